@@ -1265,7 +1265,7 @@ def upload_transcript():
             print(f"✅ Detected {detection['format']} text transcript")
             try:
                 # Parse text to combined format
-                transcript_data = parse_text_to_combined_format(transcript_data)
+                transcript_data = parse_text_to_combined_format(transcript_data, detection)
                 print(f"   Parsed {len(transcript_data)} segments")
             except Exception as e:
                 return jsonify({
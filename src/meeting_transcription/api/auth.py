@@ -217,6 +217,7 @@ class AuthConfig:
             "/api/config",
             "/webhook/recall",
             "/webhook/google-meet",  # Pub/Sub push endpoint
+            "/api/google-meet/subscriptions/renew",  # Cloud Scheduler endpoint
             "/oauth/google/callback",  # OAuth callback
             "/api/auth/login",  # New login endpoint
             "/api/auth/setup",  # New setup endpoint
@@ -485,13 +486,29 @@ def verify_webhook(f):
     return decorated
 
 
+_google_request_adapter: Any = None
+
+
+def _get_google_request_adapter() -> Any:
+    """Get a shared google-auth transport (reuses its HTTP session for cert fetches)."""
+    global _google_request_adapter
+    if _google_request_adapter is None:
+        from google.auth.transport import requests as google_requests
+
+        _google_request_adapter = google_requests.Request()
+    return _google_request_adapter
+
+
 def verify_oidc_token(token: str, expected_audience: str) -> bool:
-    """Verify OIDC token from Google Cloud Tasks matches our service account."""
+    """
+    Verify a Google-signed OIDC token matches our service account.
+
+    Used for Cloud Tasks callbacks and authenticated Pub/Sub push requests.
+    """
     try:
-        from google.auth.transport import requests as google_requests
         from google.oauth2 import id_token
 
-        request_adapter = google_requests.Request()
+        request_adapter = _get_google_request_adapter()
         claims = id_token.verify_oauth2_token(token, request_adapter, audience=expected_audience)
 
         if claims.get('iss') not in ['https://accounts.google.com', 'accounts.google.com']:
@@ -179,7 +179,13 @@ class MeetingStorage:
                 self._save_local_meeting(meeting_id, meeting)
             return meeting
 
-    def list_meetings(self, user: str | None = None, status: str | None = None, limit: int = 100) -> list[dict]:
+    def list_meetings(
+        self,
+        user: str | None = None,
+        status: str | None = None,
+        limit: int = 100,
+        provider: str | None = None,
+    ) -> list[dict]:
         """
         List meetings with optional filters.
 
@@ -187,6 +193,7 @@ class MeetingStorage:
             user: Filter by user (None = all users)
             status: Filter by status (None = all statuses)
             limit: Maximum number of results
+            provider: Filter by meeting provider (None = all providers)
 
         Returns:
             list: List of meeting records
@@ -205,6 +212,8 @@ class MeetingStorage:
                     continue
                 if status and data.get("status") != status:
                     continue
+                if provider and data.get("provider") != provider:
+                    continue
                 results.append(data)
                 if len(results) >= limit:
                     break
@@ -223,6 +232,8 @@ class MeetingStorage:
                                 continue
                             if status and meeting.get("status") != status:
                                 continue
+                            if provider and meeting.get("provider") != provider:
+                                continue
                             meetings.append(meeting)
 
             # Sort by created_at descending
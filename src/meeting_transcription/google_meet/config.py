@@ -13,6 +13,11 @@ Environment variables:
     GOOGLE_PUBSUB_PROJECT_ID: GCP project for Pub/Sub (defaults to GOOGLE_CLOUD_PROJECT)
     GOOGLE_PUBSUB_TOPIC: Pub/Sub topic for Meet events
     GOOGLE_PUBSUB_SUBSCRIPTION: Pub/Sub subscription name
+    GOOGLE_PUBSUB_PUSH_AUDIENCE: Expected audience of the OIDC token on Pub/Sub
+        push requests. Together with GCP_PROJECT_NUMBER (whose default compute
+        service account signs the token), enables authenticated push: the
+        subscription attaches the token and pushes without a valid one are
+        rejected.
 """
 
 import os
@@ -74,6 +79,13 @@ class GoogleOAuthConfig:
         self.pubsub_subscription = os.getenv(
             "GOOGLE_PUBSUB_SUBSCRIPTION", "meet-transcript-push"
         )
+        self.pubsub_push_audience = os.getenv("GOOGLE_PUBSUB_PUSH_AUDIENCE", "")
+        project_number = os.getenv("GCP_PROJECT_NUMBER", "")
+        self.pubsub_push_service_account = (
+            f"{project_number}-compute@developer.gserviceaccount.com"
+            if project_number
+            else ""
+        )
 
         # Scopes
         self.scopes = list(GOOGLE_MEET_SCOPES)
@@ -96,6 +108,21 @@ class GoogleOAuthConfig:
             f"/subscriptions/{self.pubsub_subscription}"
         )
 
+    @property
+    def pubsub_push_oidc_token(self) -> dict[str, str] | None:
+        """
+        OIDC token settings for authenticated Pub/Sub push, or None.
+
+        The subscription is created with exactly these settings and the
+        webhook verifies against them, so the two cannot disagree.
+        """
+        if not (self.pubsub_push_audience and self.pubsub_push_service_account):
+            return None
+        return {
+            "service_account_email": self.pubsub_push_service_account,
+            "audience": self.pubsub_push_audience,
+        }
+
     def validate(self) -> list[str]:
         """
         Validate configuration and return list of errors.
@@ -117,6 +144,10 @@ class GoogleOAuthConfig:
             errors.append(
                 "GOOGLE_PUBSUB_PROJECT_ID or GOOGLE_CLOUD_PROJECT is required"
             )
+        if self.pubsub_push_audience and not self.pubsub_push_service_account:
+            errors.append(
+                "GCP_PROJECT_NUMBER is required when GOOGLE_PUBSUB_PUSH_AUDIENCE is set"
+            )
 
         return errors
 
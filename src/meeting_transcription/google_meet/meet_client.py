@@ -7,6 +7,7 @@ a notification that a transcript is ready.
 API docs: https://developers.google.com/workspace/meet/api/guides/overview
 """
 
+from collections.abc import Iterator
 from typing import Any
 
 import requests
@@ -36,11 +37,32 @@ class MeetApiClient:
         Returns:
             List of transcript entry dicts with speaker and text info
 
+        Raises:
+            ValueError: If API call fails
+        """
+        return list(self.iter_transcript_entries(user_id, transcript_name))
+
+    def iter_transcript_entries(
+        self, user_id: str, transcript_name: str
+    ) -> Iterator[dict[str, Any]]:
+        """
+        Yield transcript entries page by page.
+
+        Only one API page (up to 100 entries) is held at a time, so long
+        transcripts can be processed without materializing every entry.
+
+        Args:
+            user_id: App user ID (for OAuth token lookup)
+            transcript_name: Full transcript resource name
+                (e.g., "conferenceRecords/abc/transcripts/def")
+
+        Yields:
+            Transcript entry dicts with speaker and text info
+
         Raises:
             ValueError: If API call fails
         """
         access_token = self._get_token(user_id)
-        entries = []
         page_token = None
 
         while True:
@@ -75,14 +97,12 @@ class MeetApiClient:
                 )
 
             data = resp.json()
-            entries.extend(data.get("transcriptEntries", []))
+            yield from data.get("transcriptEntries", [])
 
             page_token = data.get("nextPageToken")
             if not page_token:
                 break
 
-        return entries
-
     def get_conference_record(
         self, user_id: str, conference_record_id: str
     ) -> dict[str, Any]:
@@ -7,6 +7,7 @@ that receives Meet transcript notifications.
 
 import logging
 import os
+from typing import Any
 
 from .config import get_google_oauth_config
 
@@ -21,6 +22,30 @@ except ImportError:
     HAS_PUBSUB = False
 
 
+# ---------------------------------------------------------------------------
+# Shared clients
+# ---------------------------------------------------------------------------
+
+_publisher_client: Any = None
+_subscriber_client: Any = None
+
+
+def _get_publisher() -> Any:
+    """Get the Pub/Sub publisher client."""
+    global _publisher_client
+    if _publisher_client is None:
+        _publisher_client = pubsub_v1.PublisherClient()
+    return _publisher_client
+
+
+def _get_subscriber() -> Any:
+    """Get the Pub/Sub subscriber client."""
+    global _subscriber_client
+    if _subscriber_client is None:
+        _subscriber_client = pubsub_v1.SubscriberClient()
+    return _subscriber_client
+
+
 def ensure_pubsub_resources(push_endpoint: str | None = None) -> dict[str, str]:
     """
     Create Pub/Sub topic and push subscription if they don't exist.
@@ -52,37 +77,46 @@ def ensure_pubsub_resources(push_endpoint: str | None = None) -> dict[str, str]:
     topic_path = config.pubsub_topic_path
     subscription_path = config.pubsub_subscription_path
 
+    push_config: dict[str, Any] = {"push_endpoint": push_endpoint}
+    oidc_token = config.pubsub_push_oidc_token
+    if oidc_token:
+        # Authenticated push: Pub/Sub attaches an OIDC token the webhook verifies
+        push_config["oidc_token"] = oidc_token
+
     # Create topic
-    publisher = pubsub_v1.PublisherClient()
+    publisher = _get_publisher()
     try:
         publisher.create_topic(name=topic_path)
-        print(f"Created Pub/Sub topic: {topic_path}")
+        logger.info("Created Pub/Sub topic: %s", topic_path)
     except AlreadyExists:
-        print(f"Pub/Sub topic already exists: {topic_path}")
+        logger.info("Pub/Sub topic already exists: %s", topic_path)
 
     # Create push subscription
-    subscriber = pubsub_v1.SubscriberClient()
+    subscriber = _get_subscriber()
     try:
         subscriber.create_subscription(
             request={
                 "name": subscription_path,
                 "topic": topic_path,
-                "push_config": {"push_endpoint": push_endpoint},
+                "push_config": push_config,
                 "ack_deadline_seconds": 60,
                 "message_retention_duration": {"seconds": 86400},  # 1 day
             }
         )
-        print(f"Created Pub/Sub subscription: {subscription_path}")
-        print(f"  Push endpoint: {push_endpoint}")
+        logger.info(
+            "Created Pub/Sub subscription: %s (push endpoint: %s)",
+            subscription_path,
+            push_endpoint,
+        )
     except AlreadyExists:
         # Update the push endpoint if subscription already exists
         subscriber.modify_push_config(
             request={
                 "subscription": subscription_path,
-                "push_config": {"push_endpoint": push_endpoint},
+                "push_config": push_config,
             }
         )
-        print(f"Updated Pub/Sub subscription push endpoint: {push_endpoint}")
+        logger.info("Updated Pub/Sub subscription push endpoint: %s", push_endpoint)
 
     return {
         "topic": topic_path,
@@ -98,19 +132,19 @@ def delete_pubsub_resources() -> None:
 
     config = get_google_oauth_config()
 
-    subscriber = pubsub_v1.SubscriberClient()
+    subscriber = _get_subscriber()
     try:
         subscriber.delete_subscription(
             request={"subscription": config.pubsub_subscription_path}
         )
-        print(f"Deleted subscription: {config.pubsub_subscription_path}")
+        logger.info("Deleted subscription: %s", config.pubsub_subscription_path)
     except NotFound:
         logger.debug("Subscription %s not found, nothing to delete", config.pubsub_subscription_path)
 
-    publisher = pubsub_v1.PublisherClient()
+    publisher = _get_publisher()
     try:
         publisher.delete_topic(request={"topic": config.pubsub_topic_path})
-        print(f"Deleted topic: {config.pubsub_topic_path}")
+        logger.info("Deleted topic: %s", config.pubsub_topic_path)
     except NotFound:
         logger.debug("Topic %s not found, nothing to delete", config.pubsub_topic_path)
 
@@ -123,7 +157,7 @@ def get_pubsub_status() -> dict[str, bool | str]:
     config = get_google_oauth_config()
     result: dict[str, bool | str] = {"available": True}
 
-    subscriber = pubsub_v1.SubscriberClient()
+    subscriber = _get_subscriber()
     try:
         sub = subscriber.get_subscription(
             request={"subscription": config.pubsub_subscription_path}
@@ -136,7 +170,7 @@ def get_pubsub_status() -> dict[str, bool | str]:
         result["subscription_exists"] = False
         result["subscription_error"] = str(e)
 
-    publisher = pubsub_v1.PublisherClient()
+    publisher = _get_publisher()
     try:
         publisher.get_topic(request={"topic": config.pubsub_topic_path})
         result["topic_exists"] = True
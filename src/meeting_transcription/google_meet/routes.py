@@ -8,12 +8,14 @@ Provides:
 - /settings/google-meet/disconnect - Disconnect Google account
 - /settings/google-meet/subscribe - Enable transcript event subscription
 - /webhook/google-meet - Pub/Sub push endpoint
+- /api/google-meet/subscriptions/renew - Cloud Scheduler subscription renewal
 """
 
 import logging
 import os
 
-from flask import Blueprint, g, jsonify, redirect, render_template, request
+from flask import Blueprint, Response, g, jsonify, redirect, render_template, request
+from meeting_transcription.utils import fast_json
 
 from .config import get_google_oauth_config
 from .oauth import GoogleOAuthFlow, delete_google_tokens, get_google_tokens, is_google_connected
@@ -26,6 +28,17 @@ logger = logging.getLogger(__name__)
 
 google_meet_bp = Blueprint("google_meet", __name__)
 
+# Transcript panel ordering: pending/processing first, then by creation date
+_TRANSCRIPT_STATUS_ORDER = {"queued": 0, "processing": 1, "failed": 2, "completed": 3}
+
+
+def _transcript_sort_key(meeting: dict) -> tuple[int, str]:
+    """Sort key for the Google Meet transcript status panel."""
+    return (
+        _TRANSCRIPT_STATUS_ORDER.get(meeting.get("status", ""), 99),
+        meeting.get("created_at", ""),
+    )
+
 
 # ---------------------------------------------------------------------------
 # OAuth flow
@@ -72,7 +85,7 @@ def google_callback():
                 manager = WorkspaceEventsManager()
                 manager.create_subscription(user_id)
             except Exception as e:
-                print(f"Warning: Could not auto-subscribe: {e}")
+                logger.warning("Could not auto-subscribe: %s", e)
 
         return redirect("/settings?connected=true")
     except ValueError as e:
@@ -170,9 +183,18 @@ def google_meet_webhook():
     Handle Pub/Sub push messages for Google Meet transcript events.
 
     This endpoint receives messages from Cloud Pub/Sub when a
-    transcript becomes available.
+    transcript becomes available. When the subscription is set up for
+    authenticated push, the push must carry a valid OIDC token; anything
+    else is rejected before any storage or handler setup.
     """
-    data = request.json
+    oidc_token = get_google_oauth_config().pubsub_push_oidc_token
+    if oidc_token and not _verify_oidc_bearer(oidc_token["audience"]):
+        return jsonify({"error": "Unauthorized"}), 401
+
+    try:
+        data = fast_json.loads(request.get_data())
+    except fast_json.JSONDecodeError:
+        data = None
     if not data:
         return jsonify({"error": "No data"}), 400
 
@@ -194,18 +216,52 @@ def google_meet_webhook():
                 user_id, transcript_name, event_data
             )
         except Exception as e:
-            print(f"Error handling transcript: {e}")
+            logger.error("Error handling transcript: %s", e)
 
     handler = MeetWebhookHandler(on_transcript_ready=on_transcript_ready)
 
     try:
         result = handler.handle_push_message(data)
-        return jsonify(result), 200
+        return Response(fast_json.dumps(result), status=200, mimetype="application/json")
     except ValueError as e:
         logger.error("Webhook error: %s", e)
         return jsonify({"error": "Invalid webhook payload"}), 400
 
 
+def _verify_oidc_bearer(audience: str) -> bool:
+    """Verify the OIDC bearer token Pub/Sub and Cloud Scheduler attach to requests."""
+    auth_header = request.headers.get("Authorization", "")
+    if not auth_header.startswith("Bearer "):
+        logger.warning("Rejected %s without OIDC token", request.path)
+        return False
+
+    from meeting_transcription.api.auth import verify_oidc_token
+
+    return verify_oidc_token(auth_header[7:], audience)
+
+
+# ---------------------------------------------------------------------------
+# Subscription renewal
+# ---------------------------------------------------------------------------
+
+
+@google_meet_bp.route("/api/google-meet/subscriptions/renew", methods=["POST"])
+def renew_google_meet_subscriptions():
+    """
+    Renew Workspace Events subscriptions that expire within the next day.
+
+    Subscriptions last 7 days, so this is called daily by Cloud Scheduler
+    with an OIDC token whose audience is this endpoint's URL.
+    """
+    audience = os.getenv("SERVICE_URL", "").rstrip("/") + request.path
+    if not _verify_oidc_bearer(audience):
+        return jsonify({"error": "Unauthorized"}), 401
+
+    renewed = WorkspaceEventsManager().renew_expiring_subscriptions()
+    failed = sum(1 for sub in renewed.values() if sub is None)
+    return jsonify({"renewed": len(renewed) - failed, "failed": failed})
+
+
 # ---------------------------------------------------------------------------
 # API endpoints
 # ---------------------------------------------------------------------------
@@ -249,17 +305,9 @@ def google_meet_transcripts_partial():
     bucket_name = os.getenv("OUTPUT_BUCKET", "")
     storage = MeetingStorage(bucket_name=bucket_name)
 
-    # Get all meetings from Google Meet provider
-    all_meetings = storage.list_meetings(user=user_id)
-    google_meet_meetings = [
-        m for m in all_meetings if m.get("provider") == "google_meet"
-    ]
-
-    # Sort: pending/processing first, then by creation date
-    status_order = {"queued": 0, "processing": 1, "failed": 2, "completed": 3}
-    google_meet_meetings.sort(
-        key=lambda m: (status_order.get(m.get("status", ""), 99), m.get("created_at", ""))
-    )
+    # Get meetings from Google Meet provider
+    google_meet_meetings = storage.list_meetings(user=user_id, provider="google_meet")
+    google_meet_meetings.sort(key=_transcript_sort_key)
 
     user_timezone = "America/New_York"
 
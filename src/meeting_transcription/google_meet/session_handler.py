@@ -5,13 +5,19 @@ Orchestrates: event received -> fetch transcript -> parse -> create meeting -> q
 """
 
 import json
+import logging
 import os
 import uuid
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
 from datetime import UTC, datetime
-from typing import Any
+from itertools import chain
+from typing import Any, TextIO
 
 from .meet_client import MeetApiClient
-from .transcript_parser import parse_meet_transcript
+from .transcript_parser import iter_meet_transcript
+
+logger = logging.getLogger(__name__)
 
 
 class MeetSessionHandler:
@@ -35,6 +41,20 @@ class MeetSessionHandler:
         self.storage = storage
         self.service_url = service_url or os.getenv("SERVICE_URL", "")
         self.meet_client = MeetApiClient()
+        # Conference metadata only feeds the title and stored meeting info;
+        # deployments that don't need it can skip the extra API call.
+        self.fetch_conference_meta = (
+            os.getenv("FETCH_MEET_CONFERENCE_META", "true").lower() == "true"
+        )
+
+        # Cloud Tasks settings, resolved once per handler
+        self._project_id = os.getenv("GOOGLE_CLOUD_PROJECT", "")
+        self._location = os.getenv("GCP_REGION", "us-central1")
+        self._queue_parent: str | None = None
+        self._sa_email = (
+            f"{os.getenv('GCP_PROJECT_NUMBER', '')}-compute@developer.gserviceaccount.com"
+        )
+        self._task_url_prefix = f"{self.service_url.rstrip('/')}/api/transcripts/process"
 
     def handle_transcript_ready(
         self,
@@ -55,59 +75,68 @@ class MeetSessionHandler:
             meeting_id: The created meeting ID
 
         Raises:
-            ValueError: If transcript fetch or parsing fails
+            ValueError: If transcript fetch or parsing fails. Errors on
+                later entry pages surface while storing the transcript and
+                mark the created meeting as failed instead.
         """
         # Extract conference record ID
         parts = transcript_name.split("/")
         conference_record_id = parts[1] if len(parts) >= 4 else ""
 
-        print(f"Processing Meet transcript: {transcript_name}")
-
-        # 1. Fetch transcript entries from Meet API
-        entries = self.meet_client.get_transcript_entries(user_id, transcript_name)
-        if not entries:
-            raise ValueError(f"No transcript entries found for {transcript_name}")
-
-        print(f"  Fetched {len(entries)} transcript entries")
-
-        # 2. Fetch participant info for name resolution
-        participants = []
-        if conference_record_id:
-            try:
-                participants = self.meet_client.get_participants(
-                    user_id, conference_record_id
+        logger.info("Processing Meet transcript: %s", transcript_name)
+
+        # 1-3. Fetch transcript entries, participants and conference record.
+        # Entries are streamed page by page; the first page is fetched here
+        # while the participant and conference-record calls run alongside.
+        entries = self.meet_client.iter_transcript_entries(user_id, transcript_name)
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            participants_future = conf_record_future = None
+            if conference_record_id:
+                participants_future = pool.submit(
+                    self.meet_client.get_participants, user_id, conference_record_id
                 )
-                print(f"  Fetched {len(participants)} participants")
-            except Exception as e:
-                print(f"  Warning: Could not fetch participants: {e}")
-
-        # 3. Get conference record for meeting metadata
-        meeting_meta = {}
-        if conference_record_id:
-            try:
-                conf_record = self.meet_client.get_conference_record(
-                    user_id, conference_record_id
-                )
-                meeting_meta = {
-                    "space": conf_record.get("space", ""),
-                    "start_time": conf_record.get("startTime", ""),
-                    "end_time": conf_record.get("endTime", ""),
-                }
-            except Exception as e:
-                print(f"  Warning: Could not fetch conference record: {e}")
-
-        # 4. Parse transcript to internal format
-        segments = parse_meet_transcript(
-            entries=entries,
+                if self.fetch_conference_meta:
+                    conf_record_future = pool.submit(
+                        self.meet_client.get_conference_record, user_id, conference_record_id
+                    )
+
+            first_entry = next(entries, None)
+            if first_entry is None:
+                raise ValueError(f"No transcript entries found for {transcript_name}")
+
+            # Participant info is only used for name resolution
+            participants = []
+            if participants_future is not None:
+                try:
+                    participants = participants_future.result()
+                    logger.info("Fetched %d participants", len(participants))
+                except Exception as e:
+                    logger.warning("Could not fetch participants: %s", e)
+
+            # Conference record provides meeting metadata
+            meeting_meta = {}
+            if conf_record_future is not None:
+                try:
+                    conf_record = conf_record_future.result()
+                    meeting_meta = {
+                        "space": conf_record.get("space", ""),
+                        "start_time": conf_record.get("startTime", ""),
+                        "end_time": conf_record.get("endTime", ""),
+                    }
+                except Exception as e:
+                    logger.warning("Could not fetch conference record: %s", e)
+
+        # 4. Parse transcript to internal format (lazily, as it is stored)
+        segments = iter_meet_transcript(
+            entries=chain((first_entry,), entries),
             participants=participants,
             meeting_start_time=meeting_meta.get("start_time"),
         )
 
-        if not segments:
+        first_segment = next(segments, None)
+        if first_segment is None:
             raise ValueError("Parsed transcript is empty")
 
-        print(f"  Parsed {len(segments)} segments")
-
         # 5. Create meeting record
         meeting_id = f"gmeet-{uuid.uuid4().hex[:8]}"
         title = self._generate_title(meeting_meta, conference_record_id)
@@ -134,9 +163,9 @@ class MeetSessionHandler:
         )
 
         # 6. Store transcript and queue processing
-        self._store_and_queue(meeting_id, segments, title)
+        self._store_and_queue(meeting_id, chain((first_segment,), segments), title)
 
-        print(f"  Created meeting {meeting_id}, queued for processing")
+        logger.info("Created meeting %s, queued for processing", meeting_id)
 
         return meeting_id
 
@@ -156,13 +185,18 @@ class MeetSessionHandler:
         return f"Google Meet {conference_record_id[:8] if conference_record_id else datetime.now(UTC).strftime('%Y-%m-%d %H:%M')}"
 
     def _store_and_queue(
-        self, meeting_id: str, segments: list[dict], title: str
+        self, meeting_id: str, segments: Iterable[dict], title: str
     ) -> None:
-        """Store transcript in GCS and create Cloud Task for processing."""
+        """
+        Store transcript in GCS and create Cloud Task for processing.
+
+        Segments are written to the upload stream one at a time, so the
+        transcript never has to be held in memory as a whole.
+        """
         bucket_name = os.getenv("OUTPUT_BUCKET")
         if not bucket_name:
             # Fallback: process inline (dev mode)
-            print("  No OUTPUT_BUCKET set, storing locally")
+            logger.info("No OUTPUT_BUCKET set, storing locally")
             self.storage.update_meeting(meeting_id, {"status": "pending"})
             return
 
@@ -173,11 +207,11 @@ class MeetSessionHandler:
             gcs_client = gcs.Client()
             bucket = gcs_client.bucket(bucket_name)
             blob = bucket.blob(f"temp/{meeting_id}/transcript_upload.json")
-            blob.upload_from_string(
-                json.dumps(segments), content_type="application/json"
-            )
+            with blob.open("w", content_type="application/json") as f:
+                count = _write_json_array(f, segments)
+            logger.info("Stored %d segments", count)
         except Exception as e:
-            print(f"  Error storing transcript: {e}")
+            logger.error("Error storing transcript: %s", e)
             self.storage.update_meeting(
                 meeting_id, {"status": "failed", "error": str(e)}
             )
@@ -188,7 +222,7 @@ class MeetSessionHandler:
             try:
                 self._create_cloud_task(meeting_id, title)
             except Exception as e:
-                print(f"  Error creating Cloud Task: {e}")
+                logger.error("Error creating Cloud Task: %s", e)
                 self.storage.update_meeting(
                     meeting_id,
                     {"status": "failed", "error": f"Queue error: {e}"},
@@ -196,20 +230,18 @@ class MeetSessionHandler:
 
     def _create_cloud_task(self, meeting_id: str, title: str) -> None:
         """Create a Cloud Task for processing."""
-        from google.cloud import tasks_v2
-
-        project_id = os.getenv("GOOGLE_CLOUD_PROJECT")
-        if not project_id:
+        if not self._project_id:
             return
 
-        location = os.getenv("GCP_REGION", "us-central1")
-        queue = "transcript-processing"
-
-        url = f"{self.service_url.rstrip('/')}/api/transcripts/process/{meeting_id}"
+        from google.cloud import tasks_v2
 
-        client = tasks_v2.CloudTasksClient()
-        parent = client.queue_path(project_id, location, queue)
+        client = _get_tasks_client()
+        if self._queue_parent is None:
+            self._queue_parent = client.queue_path(
+                self._project_id, self._location, "transcript-processing"
+            )
 
+        url = f"{self._task_url_prefix}/{meeting_id}"
         payload = {"meeting_id": meeting_id, "title": title}
 
         task = {
@@ -219,14 +251,41 @@ class MeetSessionHandler:
                 "headers": {"Content-Type": "application/json"},
                 "body": json.dumps(payload).encode(),
                 "oidc_token": {
-                    "service_account_email": (
-                        f"{os.getenv('GCP_PROJECT_NUMBER', '')}"
-                        "-compute@developer.gserviceaccount.com"
-                    ),
+                    "service_account_email": self._sa_email,
                     "audience": self.service_url,
                 },
             }
         }
 
-        response = client.create_task(request={"parent": parent, "task": task})
-        print(f"  Cloud Task created: {response.name}")
+        response = client.create_task(request={"parent": self._queue_parent, "task": task})
+        logger.info("Cloud Task created: %s", response.name)
+
+
+def _write_json_array(f: TextIO, items: Iterable[Any]) -> int:
+    """Write items to f as a JSON array, one element at a time."""
+    count = 0
+    f.write("[")
+    for item in items:
+        if count:
+            f.write(",")
+        f.write(json.dumps(item))
+        count += 1
+    f.write("]")
+    return count
+
+
+# ---------------------------------------------------------------------------
+# Cloud Tasks client (shared across handlers)
+# ---------------------------------------------------------------------------
+
+_tasks_client: Any = None
+
+
+def _get_tasks_client() -> Any:
+    """Get the Cloud Tasks client."""
+    global _tasks_client
+    if _tasks_client is None:
+        from google.cloud import tasks_v2
+
+        _tasks_client = tasks_v2.CloudTasksClient()
+    return _tasks_client
@@ -23,12 +23,18 @@ Internal format (for pipeline):
 }
 """
 
+from collections.abc import Iterable, Iterator
 from datetime import datetime
+from itertools import chain
 from typing import Any
 
+# Participant user-info fields, in priority order. Meet sets only one of
+# these per participant; phone/anonymous names win if several are present.
+_PARTICIPANT_USER_FIELDS = ("phoneUser", "anonymousUser", "signedinUser")
+
 
 def parse_meet_transcript(
-    entries: list[dict[str, Any]],
+    entries: Iterable[dict[str, Any]],
     participants: list[dict[str, Any]] | None = None,
     meeting_start_time: str | None = None,
 ) -> list[dict[str, Any]]:
@@ -36,7 +42,7 @@ def parse_meet_transcript(
     Convert Meet API transcript entries to internal pipeline format.
 
     Args:
-        entries: List of transcript entries from Meet API
+        entries: Transcript entries from Meet API
         participants: Optional participant list for name resolution
         meeting_start_time: Meeting start time (ISO format) for relative timestamps.
             If not provided, uses the first entry's start time.
@@ -44,63 +50,106 @@ def parse_meet_transcript(
     Returns:
         List of segments in the internal combined format
     """
-    if not entries:
-        return []
+    return list(iter_meet_transcript(entries, participants, meeting_start_time))
+
+
+def iter_meet_transcript(
+    entries: Iterable[dict[str, Any]],
+    participants: list[dict[str, Any]] | None = None,
+    meeting_start_time: str | None = None,
+) -> Iterator[dict[str, Any]]:
+    """
+    Lazily convert Meet API transcript entries to internal pipeline format.
+
+    Streaming counterpart of parse_meet_transcript(): entries are consumed
+    one at a time and each merged segment is yielded once the speaker
+    changes, so only the segment being merged is held in memory.
+
+    Args:
+        entries: Transcript entries from Meet API (any iterable)
+        participants: Optional participant list for name resolution
+        meeting_start_time: Meeting start time (ISO format) for relative timestamps.
+            If not provided, uses the first entry's start time.
+
+    Yields:
+        Segments in the internal combined format
+    """
+    entries = iter(entries)
+    first_entry = next(entries, None)
+    if first_entry is None:
+        return
 
     # Build participant ID -> name mapping
     participant_names = _build_participant_map(participants or [])
 
     # Determine meeting start time for relative timestamps
     base_time = _parse_timestamp(meeting_start_time) if meeting_start_time else None
-    if base_time is None and entries:
-        first_start = entries[0].get("startTime", "")
-        base_time = _parse_timestamp(first_start)
-
-    segments = []
-    for entry in entries:
-        segment = _parse_entry(entry, participant_names, base_time)
-        if segment:
-            segments.append(segment)
-
-    # Merge consecutive segments from the same speaker
-    merged = _merge_consecutive_segments(segments)
+    if base_time is None:
+        base_time = _parse_timestamp(first_entry.get("startTime", ""))
+    base_epoch = base_time.timestamp() if base_time else None
+
+    # Parse and merge in a single pass: Meet API returns fine-grained
+    # (per-utterance) entries, so consecutive same-speaker segments are
+    # folded into the pending segment as they are produced.
+    pending: dict[str, Any] | None = None
+    prev_participant = None
+    parse_entry = _parse_entry
+    for entry in chain((first_entry,), entries):
+        segment = parse_entry(entry, participant_names, base_epoch)
+        if not segment:
+            continue
+
+        participant = segment["participant"]
+        if pending is not None and participant == prev_participant:
+            # Same speaker — merge text and extend end time
+            pending["text"] = f"{pending['text']} {segment['text']}"
+            pending["end_timestamp"] = segment["end_timestamp"]
+        else:
+            if pending is not None:
+                yield pending
+            pending = segment
+            prev_participant = participant
 
-    return merged
+    if pending is not None:
+        yield pending
 
 
 def _parse_entry(
     entry: dict[str, Any],
     participant_names: dict[str, str],
-    base_time: datetime | None,
+    base_epoch: float | None,
 ) -> dict[str, Any] | None:
-    """Parse a single transcript entry to internal format."""
-    text = entry.get("text", "").strip()
-    if not text:
+    """
+    Parse a single transcript entry to internal format.
+
+    ``base_epoch`` is the meeting start as a Unix timestamp; entry times
+    are made relative to it.
+    """
+    # Runs once per entry: look fields up once and keep them in locals
+    get = entry.get
+    text = get("text", "")
+    if not text or not (text := text.strip()):
         return None
 
     # Resolve participant name
-    participant_ref = entry.get("participant", "")
+    participant_ref = get("participant", "")
     # Extract participant ID from resource name
     # Format: conferenceRecords/{id}/participants/{id}
-    participant_id = participant_ref.split("/")[-1] if "/" in participant_ref else participant_ref
-    speaker = participant_names.get(participant_id, participant_names.get(participant_ref, "Unknown"))
+    participant_id = participant_ref.rpartition("/")[2] or participant_ref
+    names_get = participant_names.get
+    speaker = names_get(participant_id, names_get(participant_ref, "Unknown"))
 
     # Calculate relative timestamps
-    start_str = entry.get("startTime", "")
-    end_str = entry.get("endTime", "")
-
     start_time = 0.0
     end_time = 0.0
 
-    if start_str and base_time:
-        start_dt = _parse_timestamp(start_str)
-        if start_dt:
-            start_time = (start_dt - base_time).total_seconds()
-
-    if end_str and base_time:
-        end_dt = _parse_timestamp(end_str)
-        if end_dt:
-            end_time = (end_dt - base_time).total_seconds()
+    if base_epoch is not None:
+        start_str = get("startTime", "")
+        end_str = get("endTime", "")
+        if start_str and (start_dt := _parse_timestamp(start_str)):
+            start_time = start_dt.timestamp() - base_epoch
+        if end_str and (end_dt := _parse_timestamp(end_str)):
+            end_time = end_dt.timestamp() - base_epoch
 
     return {
         "participant": speaker,
@@ -128,22 +177,17 @@ def _build_participant_map(participants: list[dict[str, Any]]) -> dict[str, str]
     for p in participants:
         resource_name = p.get("name", "")
         # Extract just the participant ID
-        participant_id = resource_name.split("/")[-1] if "/" in resource_name else resource_name
+        participant_id = resource_name.rpartition("/")[2] or resource_name
 
         # Try different user info fields
-        display_name = "Unknown"
-
-        signed_in = p.get("signedinUser", {})
-        if signed_in.get("displayName"):
-            display_name = signed_in["displayName"]
-
-        anonymous = p.get("anonymousUser", {})
-        if anonymous.get("displayName"):
-            display_name = anonymous["displayName"]
-
-        phone = p.get("phoneUser", {})
-        if phone.get("displayName"):
-            display_name = phone["displayName"]
+        display_name = next(
+            (
+                user["displayName"]
+                for user in (p.get(field) for field in _PARTICIPANT_USER_FIELDS)
+                if isinstance(user, dict) and user.get("displayName")
+            ),
+            "Unknown",
+        )
 
         # Map both full resource name and just the ID
         name_map[resource_name] = display_name
@@ -153,33 +197,6 @@ def _build_participant_map(participants: list[dict[str, Any]]) -> dict[str, str]
     return name_map
 
 
-def _merge_consecutive_segments(
-    segments: list[dict[str, Any]],
-) -> list[dict[str, Any]]:
-    """
-    Merge consecutive segments from the same speaker.
-
-    Meet API returns fine-grained entries (per-utterance). Merging
-    consecutive same-speaker segments produces cleaner transcripts.
-    """
-    if not segments:
-        return []
-
-    merged = [segments[0].copy()]
-
-    for seg in segments[1:]:
-        prev = merged[-1]
-
-        if seg["participant"] == prev["participant"]:
-            # Same speaker — merge text and extend end time
-            prev["text"] = f"{prev['text']} {seg['text']}"
-            prev["end_timestamp"] = seg["end_timestamp"]
-        else:
-            merged.append(seg.copy())
-
-    return merged
-
-
 def _parse_timestamp(ts: str | None) -> datetime | None:
     """Parse an ISO timestamp string to datetime."""
     if not ts:
@@ -203,10 +220,7 @@ def meet_transcript_to_text(segments: list[dict[str, Any]]) -> str:
     Returns:
         Formatted text transcript
     """
-    lines = []
-    for seg in segments:
-        speaker = seg.get("participant", "Unknown")
-        text = seg.get("text", "")
-        lines.append(f"{speaker}: {text}")
-
-    return "\n\n".join(lines)
+    return "\n\n".join(
+        seg.get("participant", "Unknown") + ": " + seg.get("text", "")
+        for seg in segments
+    )
@@ -5,14 +5,27 @@ Receives push messages from Cloud Pub/Sub when a Meet transcript
 becomes available, validates them, and triggers transcript fetching.
 """
 
-import base64
-import json
+import binascii
 import logging
+import os
+import threading
+import time
+from collections import OrderedDict
 from collections.abc import Callable
 from typing import Any
 
+from meeting_transcription.utils import fast_json
+
 from .config import get_google_oauth_config
 
+# Firestore (optional, user resolution is skipped without it)
+try:
+    from google.cloud import firestore
+
+    HAS_FIRESTORE = True
+except ImportError:
+    HAS_FIRESTORE = False
+
 logger = logging.getLogger(__name__)
 
 
@@ -89,20 +102,34 @@ class MeetWebhookHandler:
         if not raw_data:
             raise ValueError("Missing 'data' in message")
 
+        # a2b_base64 reads the ASCII str in place (b64decode would first copy
+        # it to bytes) and its output goes straight to the parser. binascii
+        # and JSON errors are both ValueErrors.
         try:
-            decoded = base64.b64decode(raw_data)
-            event_data = json.loads(decoded)
-        except (base64.binascii.Error, json.JSONDecodeError) as e:
+            event_data = fast_json.loads(binascii.a2b_base64(raw_data))
+        except ValueError as e:
             raise ValueError(f"Failed to decode message data: {e}") from e
+        if not isinstance(event_data, dict):
+            raise ValueError("Message data is not a JSON object")
 
         message_id = message.get("messageId", "unknown")
         event_type = event_data.get("eventType", "")
 
-        print(f"Received Meet event: {event_type} (msg: {message_id})")
+        logger.info("Received Meet event: %s (msg: %s)", event_type, message_id)
 
         # Route by event type
         if event_type == "google.workspace.meet.transcript.v2.fileGenerated":
-            return self._handle_transcript_generated(event_data, message_id)
+            # Pub/Sub push is at-least-once; don't fetch a transcript twice
+            # for a redelivered message.
+            if "messageId" in message and not _recent_messages.add(message_id):
+                logger.info("Skipping duplicate Meet event (msg: %s)", message_id)
+                return {"status": "duplicate", "message_id": message_id}
+            try:
+                return self._handle_transcript_generated(event_data, message_id)
+            except Exception:
+                # Let Pub/Sub's retry through
+                _recent_messages.discard(message_id)
+                raise
 
         # Unknown event type — acknowledge but skip
         return {"status": "skipped", "reason": f"Unhandled event type: {event_type}"}
@@ -111,25 +138,28 @@ class MeetWebhookHandler:
         self, event_data: dict[str, Any], message_id: str
     ) -> dict[str, str]:
         """Handle a transcript.fileGenerated event."""
-        event = event_data.get("event", {})
-        transcript_info = event.get("transcript", {})
-        transcript_name = transcript_info.get("name", "")
+        # Only eventType, subscriptionId and event.transcript.name are read;
+        # missing or null levels fall back to empty values.
+        event = event_data.get("event") or {}
+        transcript_info = event.get("transcript") or {}
+        transcript_name = transcript_info.get("name") or ""
 
         if not transcript_name:
             return {"status": "error", "reason": "No transcript name in event"}
 
         # Extract conference record ID from transcript name
         # Format: conferenceRecords/{id}/transcripts/{id}
-        parts = transcript_name.split("/")
-        conference_record_id = parts[1] if len(parts) >= 2 else ""
+        conference_record_id = transcript_name.partition("/")[2].partition("/")[0]
 
         # Look up which user this subscription belongs to
         subscription_id = event_data.get("subscriptionId", "")
         user_id = self._resolve_user_from_subscription(subscription_id)
 
-        print(
-            f"Transcript ready: {transcript_name} "
-            f"(conference: {conference_record_id}, user: {user_id})"
+        logger.info(
+            "Transcript ready: %s (conference: %s, user: %s)",
+            transcript_name,
+            conference_record_id,
+            user_id,
         )
 
         # Trigger transcript fetching
@@ -148,25 +178,141 @@ class MeetWebhookHandler:
         Find the app user associated with a Workspace Events subscription.
 
         Looks up the subscription ID in our stored subscriptions to find
-        the user who created it.
+        the user who created it. Hits are cached in-process, so only the
+        first push per subscription queries Firestore.
         """
-        import os
-
-        try:
-            from google.cloud import firestore
-
-            if os.getenv("GOOGLE_CLOUD_PROJECT"):
-                db = firestore.Client()
-                # Query subscriptions collection for matching subscription ID
-                docs = (
-                    db.collection("google_meet_subscriptions")
-                    .where("name", "==", subscription_id)
-                    .limit(1)
-                    .stream()
-                )
-                for doc in docs:
-                    return doc.id  # Document ID is the user_id
-        except ImportError:
-            logger.debug("google-cloud-firestore not available, cannot resolve user from subscription", exc_info=True)
+        user_id = _subscription_users.get(subscription_id)
+        if user_id is not None:
+            return user_id
+
+        db = _get_db()
+        if db is None:
+            logger.debug("Firestore not available, cannot resolve user from subscription")
+            return None
+
+        # Query subscriptions collection for matching subscription ID
+        docs = (
+            db.collection("google_meet_subscriptions")
+            .where("name", "==", subscription_id)
+            .limit(1)
+            .stream()
+        )
+        for doc in docs:
+            _subscription_users.put(subscription_id, doc.id)
+            return doc.id  # Document ID is the user_id
 
         return None
+
+
+# ---------------------------------------------------------------------------
+# Subscription -> user cache
+# ---------------------------------------------------------------------------
+
+
+class _SubscriptionUserCache:
+    """
+    Thread-safe LRU of subscription ID -> user ID with a TTL.
+
+    A subscription belongs to one user for its whole lifetime; the TTL only
+    bounds how long a reassigned or recreated subscription can resolve to
+    a stale user.
+    """
+
+    def __init__(self, maxsize: int = 4096, ttl: float = 3600.0) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: OrderedDict[str, tuple[str, float]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, subscription_id: str) -> str | None:
+        with self._lock:
+            entry = self._entries.get(subscription_id)
+            if entry is None:
+                return None
+            user_id, expires_at = entry
+            if expires_at <= time.monotonic():
+                del self._entries[subscription_id]
+                return None
+            self._entries.move_to_end(subscription_id)
+            return user_id
+
+    def put(self, subscription_id: str, user_id: str) -> None:
+        with self._lock:
+            self._entries[subscription_id] = (user_id, time.monotonic() + self.ttl)
+            self._entries.move_to_end(subscription_id)
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def forget_user(self, user_id: str) -> None:
+        """Drop every cached subscription belonging to user_id."""
+        with self._lock:
+            stale = [sub for sub, (uid, _) in self._entries.items() if uid == user_id]
+            for sub in stale:
+                del self._entries[sub]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+_subscription_users = _SubscriptionUserCache()
+
+
+# ---------------------------------------------------------------------------
+# Recently handled message IDs (redelivery dedup)
+# ---------------------------------------------------------------------------
+
+
+class _RecentMessageIds:
+    """Thread-safe, size- and time-bounded set of Pub/Sub message IDs."""
+
+    def __init__(self, maxsize: int = 65536, ttl: float = 600.0) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._expiry: OrderedDict[str, float] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def add(self, message_id: str) -> bool:
+        """Record message_id; return False if it was already seen recently."""
+        now = time.monotonic()
+        with self._lock:
+            # Entries are in insertion order, so expired ones are at the front
+            while self._expiry and next(iter(self._expiry.values())) <= now:
+                self._expiry.popitem(last=False)
+            if message_id in self._expiry:
+                return False
+            self._expiry[message_id] = now + self.ttl
+            if len(self._expiry) > self.maxsize:
+                self._expiry.popitem(last=False)
+            return True
+
+    def discard(self, message_id: str) -> None:
+        with self._lock:
+            self._expiry.pop(message_id, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._expiry.clear()
+
+
+_recent_messages = _RecentMessageIds()
+
+
+def forget_subscription_user(user_id: str) -> None:
+    """Invalidate cached subscription lookups for a user (e.g. on unsubscribe)."""
+    _subscription_users.forget_user(user_id)
+
+
+# ---------------------------------------------------------------------------
+# Firestore client (shared across pushes)
+# ---------------------------------------------------------------------------
+
+_firestore_client: Any = None
+
+
+def _get_db() -> Any:
+    """Get Firestore client."""
+    global _firestore_client
+    if _firestore_client is None and HAS_FIRESTORE and os.getenv("GOOGLE_CLOUD_PROJECT"):
+        _firestore_client = firestore.Client()
+    return _firestore_client
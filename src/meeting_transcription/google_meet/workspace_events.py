@@ -9,13 +9,27 @@ https://developers.google.com/workspace/events
 """
 
 import logging
-from datetime import UTC, datetime
+import os
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from datetime import UTC, datetime, timedelta
 from typing import Any
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from .config import get_google_oauth_config
 from .oauth import GoogleOAuthFlow
+from .webhook_handler import forget_subscription_user
+
+# Firestore (optional, falls back to in-memory for dev)
+try:
+    from google.cloud import firestore
+
+    HAS_FIRESTORE = True
+except ImportError:
+    HAS_FIRESTORE = False
 
 logger = logging.getLogger(__name__)
 
@@ -74,10 +88,10 @@ class WorkspaceEventsManager:
             },
         }
 
-        resp = requests.post(
+        resp = _get_session().post(
             f"{WORKSPACE_EVENTS_API}/subscriptions",
             json=payload,
-            headers={"Authorization": f"Bearer {access_token}"},
+            headers=_auth_headers(access_token),
             timeout=30,
         )
 
@@ -87,10 +101,10 @@ class WorkspaceEventsManager:
             if not access_token:
                 raise ValueError("Failed to refresh Google access token")
 
-            resp = requests.post(
+            resp = _get_session().post(
                 f"{WORKSPACE_EVENTS_API}/subscriptions",
                 json=payload,
-                headers={"Authorization": f"Bearer {access_token}"},
+                headers=_auth_headers(access_token),
                 timeout=30,
             )
 
@@ -139,9 +153,9 @@ class WorkspaceEventsManager:
             _delete_stored_subscription(user_id)
             return True
 
-        resp = requests.delete(
+        resp = _get_session().delete(
             f"{WORKSPACE_EVENTS_API}/{sub['name']}",
-            headers={"Authorization": f"Bearer {access_token}"},
+            headers=_auth_headers(access_token),
             timeout=30,
         )
 
@@ -150,7 +164,9 @@ class WorkspaceEventsManager:
         # 404 means already deleted, which is fine
         return resp.status_code in (200, 204, 404)
 
-    def renew_subscription(self, user_id: str) -> dict[str, Any] | None:
+    def renew_subscription(
+        self, user_id: str, sub: dict[str, Any] | None = None, *, store: bool = True
+    ) -> dict[str, Any] | None:
         """
         Renew an expiring subscription.
 
@@ -159,11 +175,15 @@ class WorkspaceEventsManager:
 
         Args:
             user_id: App user ID
+            sub: Stored subscription, if already loaded (skips the lookup)
+            store: Persist the renewed subscription. Bulk renewals pass False
+                and write all results in batches instead.
 
         Returns:
             Updated subscription or None if renewal failed
         """
-        sub = _get_stored_subscription(user_id)
+        if sub is None:
+            sub = _get_stored_subscription(user_id)
         if not sub or "name" not in sub:
             # No existing subscription, create new
             return self.create_subscription(user_id)
@@ -172,15 +192,12 @@ class WorkspaceEventsManager:
         if not access_token:
             return None
 
-        resp = requests.patch(
+        resp = _get_session().patch(
             f"{WORKSPACE_EVENTS_API}/{sub['name']}",
             json={
                 "eventTypes": [TRANSCRIPT_EVENT_TYPE],
             },
-            headers={
-                "Authorization": f"Bearer {access_token}",
-                "Content-Type": "application/json",
-            },
+            headers=_auth_headers(access_token),
             params={"updateMask": "eventTypes"},
             timeout=30,
         )
@@ -190,30 +207,106 @@ class WorkspaceEventsManager:
             return self.create_subscription(user_id)
 
         if resp.status_code not in (200, 201):
-            print(f"Subscription renewal failed: {resp.status_code} {resp.text}")
+            logger.warning("Subscription renewal failed: %s %s", resp.status_code, resp.text)
             return None
 
         subscription = resp.json()
-        _store_subscription(user_id, subscription)
+        if store:
+            _store_subscription(user_id, subscription)
         return subscription
 
+    def renew_expiring_subscriptions(
+        self, horizon_hours: int = 24, max_workers: int = 16
+    ) -> dict[str, dict[str, Any] | None]:
+        """
+        Renew every stored subscription that expires within horizon_hours.
+
+        Expiring subscriptions are loaded with a single query, so the sweep
+        doesn't look each user up again before renewing.
+
+        Returns:
+            Mapping of user_id -> updated subscription, or None if renewal failed
+        """
+        return self._renew_many(list(iter_expiring_subscriptions(horizon_hours)), max_workers)
+
+    def _renew_many(
+        self, items: list[tuple[str, dict[str, Any] | None]], max_workers: int
+    ) -> dict[str, dict[str, Any] | None]:
+        """
+        Renew (user_id, stored subscription) pairs on a bounded thread pool.
+
+        Renewed subscriptions are persisted together in batched writes
+        once all renewals have finished.
+        """
+        if not items:
+            return {}
+
+        def renew(item: tuple[str, dict[str, Any] | None]) -> dict[str, Any] | None:
+            user_id, sub = item
+            try:
+                return self.renew_subscription(user_id, sub, store=False)
+            except Exception as e:
+                logger.warning("Subscription renewal failed for %s: %s", user_id, e)
+                return None
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(items))) as pool:
+            results = pool.map(renew, items)
+            renewed = {user_id: result for (user_id, _), result in zip(items, results, strict=True)}
+
+        _store_subscriptions_bulk(
+            [(user_id, sub) for user_id, sub in renewed.items() if sub is not None]
+        )
+        return renewed
+
     def is_subscribed(self, user_id: str) -> bool:
         """Check if a user has an active subscription."""
         sub = _get_stored_subscription(user_id)
         if not sub:
             return False
 
-        # Check if subscription has expired
-        expire_time = sub.get("expireTime", "")
-        if expire_time:
-            try:
-                expires = datetime.fromisoformat(expire_time.replace("Z", "+00:00"))
-                if expires < datetime.now(UTC):
-                    return False
-            except (ValueError, TypeError):
-                logger.debug("Failed to parse subscription expireTime: %s", expire_time, exc_info=True)
+        # Active unless it has expired
+        expires = _parse_expire_time(sub.get("expireTime"))
+        return expires is None or expires >= datetime.now(UTC)
 
-        return True
+
+# ---------------------------------------------------------------------------
+# HTTP session (shared connection pool to the Workspace Events API)
+# ---------------------------------------------------------------------------
+
+_session: requests.Session | None = None
+
+
+def _auth_headers(access_token: str) -> dict[str, str]:
+    """
+    Per-request bearer auth header.
+
+    Tokens are per user, so they are never set on the shared session.
+    requests adds Content-Type for json= bodies itself.
+    """
+    return {"Authorization": "Bearer " + access_token}
+
+
+def _get_session() -> requests.Session:
+    """Get the shared Workspace Events API session."""
+    global _session
+    if _session is None:
+        session = requests.Session()
+        # urllib3 only retries idempotent methods by default, so creates and
+        # renewals (POST/PATCH) are never replayed. Once retries run out the
+        # last response is returned rather than raised, so callers still see
+        # the status code.
+        retries = Retry(
+            total=3,
+            backoff_factor=0.3,
+            status_forcelist=(502, 503, 504),
+            raise_on_status=False,
+        )
+        session.mount(
+            "https://",
+            HTTPAdapter(pool_connections=4, pool_maxsize=32, max_retries=retries),
+        )
+        _session = session
+    return _session
 
 
 # ---------------------------------------------------------------------------
@@ -222,63 +315,143 @@ class WorkspaceEventsManager:
 
 _in_memory_subs: dict[str, dict] = {}
 
+_firestore_client: Any = None
+
+
+def _get_db() -> Any:
+    """Get Firestore client."""
+    global _firestore_client
+    if _firestore_client is None and HAS_FIRESTORE and os.getenv("GOOGLE_CLOUD_PROJECT"):
+        _firestore_client = firestore.Client()
+    return _firestore_client
+
+
+def _parse_expire_time(expire_time: Any) -> datetime | None:
+    """
+    Parse a subscription's RFC 3339 expireTime into an aware UTC datetime.
+
+    The API returns anywhere from zero to nine fractional digits, so the
+    strings don't compare chronologically; compare parsed values instead.
+    Returns None if the value is missing or unparseable.
+    """
+    if not expire_time:
+        return None
+    try:
+        # fromisoformat parses RFC 3339 "Z" timestamps natively (3.11+)
+        expires = datetime.fromisoformat(expire_time)
+    except (ValueError, TypeError):
+        logger.debug("Failed to parse subscription expireTime: %s", expire_time, exc_info=True)
+        return None
+    if expires.tzinfo is None:
+        return expires.replace(tzinfo=UTC)
+    return expires.astimezone(UTC)
+
+
+def _subscription_record(subscription: dict[str, Any], stored_at: str) -> dict[str, Any]:
+    """
+    Build the Firestore document for a subscription.
+
+    Adds expire_at, the parsed expireTime as a native timestamp, which is
+    what the expiring-subscriptions query filters on.
+    """
+    record = {**subscription, "stored_at": stored_at}
+    expires = _parse_expire_time(subscription.get("expireTime"))
+    if expires is not None:
+        record["expire_at"] = expires
+    return record
+
 
 def _store_subscription(user_id: str, subscription: dict[str, Any]) -> None:
     """Store a subscription record."""
-    import os
+    db = _get_db()
+    if db:
+        db.collection("google_meet_subscriptions").document(user_id).set(
+            _subscription_record(subscription, datetime.now(UTC).isoformat()),
+            merge=True,
+        )
+        return
 
-    try:
-        from google.cloud import firestore
-
-        if os.getenv("GOOGLE_CLOUD_PROJECT"):
-            db = firestore.Client()
-            db.collection("google_meet_subscriptions").document(user_id).set(
-                {
-                    **subscription,
-                    "stored_at": datetime.now(UTC).isoformat(),
-                },
+    _in_memory_subs[user_id] = subscription
+
+
+# Firestore caps a write batch at 500 operations
+_FIRESTORE_BATCH_SIZE = 500
+
+
+def _store_subscriptions_bulk(items: list[tuple[str, dict[str, Any]]]) -> None:
+    """Store many subscription records, one Firestore batch commit per 500."""
+    if not items:
+        return
+
+    db = _get_db()
+    if not db:
+        _in_memory_subs.update(items)
+        return
+
+    collection = db.collection("google_meet_subscriptions")
+    stored_at = datetime.now(UTC).isoformat()
+    for i in range(0, len(items), _FIRESTORE_BATCH_SIZE):
+        batch = db.batch()
+        for user_id, subscription in items[i : i + _FIRESTORE_BATCH_SIZE]:
+            batch.set(
+                collection.document(user_id),
+                _subscription_record(subscription, stored_at),
                 merge=True,
             )
-            return
-    except ImportError:
-        logger.debug("google-cloud-firestore not installed, using in-memory storage for store", exc_info=True)
-
-    _in_memory_subs[user_id] = subscription
+        batch.commit()
 
 
 def _get_stored_subscription(user_id: str) -> dict[str, Any] | None:
     """Get stored subscription for a user."""
-    import os
-
-    try:
-        from google.cloud import firestore
-
-        if os.getenv("GOOGLE_CLOUD_PROJECT"):
-            db = firestore.Client()
-            doc = (
-                db.collection("google_meet_subscriptions")
-                .document(user_id)
-                .get()
-            )
-            return doc.to_dict() if doc.exists else None
-    except ImportError:
-        logger.debug("google-cloud-firestore not installed, using in-memory storage for get", exc_info=True)
+    db = _get_db()
+    if db:
+        doc = (
+            db.collection("google_meet_subscriptions")
+            .document(user_id)
+            .get()
+        )
+        return doc.to_dict() if doc.exists else None
 
     return _in_memory_subs.get(user_id)
 
 
+def iter_expiring_subscriptions(
+    horizon_hours: int = 24,
+) -> Iterator[tuple[str, dict[str, Any]]]:
+    """
+    Yield (user_id, subscription) for stored subscriptions expiring soon.
+
+    With Firestore this is one server-side filtered query on the stored
+    expire_at timestamp instead of a document read per user. (expireTime
+    itself is a string with variable fractional precision, so it can't be
+    range-compared.)
+    """
+    cutoff = datetime.now(UTC) + timedelta(hours=horizon_hours)
+
+    db = _get_db()
+    if db:
+        docs = (
+            db.collection("google_meet_subscriptions")
+            .where("expire_at", "<", cutoff)
+            .stream()
+        )
+        for doc in docs:
+            yield doc.id, doc.to_dict()
+        return
+
+    for user_id, sub in list(_in_memory_subs.items()):
+        expires = _parse_expire_time(sub.get("expireTime"))
+        if expires is not None and expires < cutoff:
+            yield user_id, sub
+
+
 def _delete_stored_subscription(user_id: str) -> None:
     """Delete stored subscription."""
-    import os
+    forget_subscription_user(user_id)
 
-    try:
-        from google.cloud import firestore
-
-        if os.getenv("GOOGLE_CLOUD_PROJECT"):
-            db = firestore.Client()
-            db.collection("google_meet_subscriptions").document(user_id).delete()
-            return
-    except ImportError:
-        logger.debug("google-cloud-firestore not installed, using in-memory storage for delete", exc_info=True)
+    db = _get_db()
+    if db:
+        db.collection("google_meet_subscriptions").document(user_id).delete()
+        return
 
     _in_memory_subs.pop(user_id, None)
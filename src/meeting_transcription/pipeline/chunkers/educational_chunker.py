@@ -5,15 +5,10 @@ This chunker wraps the existing create_educational_chunks implementation,
 maintaining 100% backward compatibility while conforming to the BaseChunker interface.
 """
 
-import os
-import sys
 from typing import Any
 
-# Add parent directory to path for imports
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../..'))
-
-from pipeline import create_educational_chunks
-from pipeline.core import BaseChunker, ChunkMetadata, ChunkStrategy, ContentType
+from .. import create_educational_chunks
+from ..core import BaseChunker, ChunkMetadata, ChunkStrategy, ContentType
 
 
 class EducationalTimeBasedChunker(BaseChunker):
@@ -61,8 +56,8 @@ class EducationalTimeBasedChunker(BaseChunker):
         # Identify instructor (existing function from create_educational_chunks)
         instructor = create_educational_chunks.identify_instructor(combined_transcript)
 
-        # Create chunks (existing function)
-        chunks = create_educational_chunks.create_educational_chunks(
+        # Create chunks and participant statistics in one pass (existing logic)
+        chunks, participants = create_educational_chunks.create_educational_chunks_with_stats(
             combined_transcript,
             instructor,
             chunk_minutes=self.chunk_minutes
@@ -73,20 +68,6 @@ class EducationalTimeBasedChunker(BaseChunker):
         # Calculate metadata
         total_duration = combined_transcript[-1]['end_timestamp']['relative'] / 60
 
-        # Get participant statistics
-        participants = {}
-        for segment in combined_transcript:
-            name = segment['participant']['name']
-            if name not in participants:
-                participants[name] = {
-                    'name': name,
-                    'is_instructor': name == instructor,
-                    'total_words': 0,
-                    'total_segments': 0
-                }
-            participants[name]['total_words'] += segment['word_count']
-            participants[name]['total_segments'] += 1
-
         # Build metadata
         metadata = ChunkMetadata(
             content_type=ContentType.EDUCATIONAL,
@@ -4,12 +4,22 @@ Whole Meeting Chunker
 Processes entire transcript as a single chunk.
 Used by plugins that need full meeting context (therapy, legal, etc.)
 """
+from dataclasses import asdict, dataclass
 from typing import Any
 
 from ..core.base_chunker import BaseChunker, ChunkMetadata
 from ..core.types import ChunkStrategy, ContentType
 
 
+@dataclass(slots=True)
+class ParticipantStats:
+    """Running word and turn totals for one speaker"""
+    name: str
+    is_host: bool = False
+    word_count: int = 0
+    turn_count: int = 0
+
+
 class WholeMeetingChunker(BaseChunker):
     """
     Chunks entire meeting as one unit.
@@ -49,22 +59,22 @@ class WholeMeetingChunker(BaseChunker):
         end_time = combined_transcript[-1]['end_timestamp']['relative']
         duration_minutes = int((end_time - start_time) / 60)
 
-        # Calculate statistics
-        total_words = sum(seg.get('word_count', 0) for seg in combined_transcript)
-
-        # Identify participants
+        # Calculate statistics and identify participants in a single pass
+        total_words = 0
         participants = {}
         for seg in combined_transcript:
-            speaker_name = seg['participant']['name']
-            if speaker_name not in participants:
-                participants[speaker_name] = {
-                    'name': speaker_name,
-                    'is_host': seg['participant'].get('is_host', False),
-                    'word_count': 0,
-                    'turn_count': 0
-                }
-            participants[speaker_name]['word_count'] += seg.get('word_count', 0)
-            participants[speaker_name]['turn_count'] += 1
+            participant = seg['participant']
+            speaker_name = participant['name']
+            word_count = seg.get('word_count', 0)
+            total_words += word_count
+
+            stats = participants.get(speaker_name)
+            if stats is None:
+                stats = participants[speaker_name] = ParticipantStats(
+                    speaker_name, participant.get('is_host', False)
+                )
+            stats.word_count += word_count
+            stats.turn_count += 1
 
         # Create single chunk with full meeting
         chunk = {
@@ -75,7 +85,7 @@ class WholeMeetingChunker(BaseChunker):
             'duration_minutes': duration_minutes,
             'segments': combined_transcript,
             'total_words': total_words,
-            'participants': list(participants.values())
+            'participants': [asdict(stats) for stats in participants.values()]
         }
 
         # Create metadata
@@ -2,9 +2,10 @@
 """
 Combine individual words in transcript into full text segments.
 """
-import json
 import sys
 
+from meeting_transcription.utils import fast_json
+
 
 def combine_transcript_words(input_file, output_file):
     """
@@ -19,13 +20,13 @@ def combine_transcript_words(input_file, output_file):
         output_file: Path to output JSON file with combined text
     """
     # Read the transcript
-    with open(input_file) as f:
-        transcript = json.load(f)
+    with open(input_file, 'rb') as f:
+        transcript = fast_json.loads(f.read())
 
     if not transcript or len(transcript) == 0:
         print("⚠️ Empty transcript")
-        with open(output_file, 'w') as f:
-            json.dump([], f, indent=2)
+        with open(output_file, 'wb') as f:
+            f.write(fast_json.dumps([]))
         return
 
     # Detect format: check first segment
@@ -35,8 +36,8 @@ def combine_transcript_words(input_file, output_file):
     if 'text' in first_segment and 'words' not in first_segment:
         print("✅ Transcript already in combined format, passing through...")
         # Just copy it over
-        with open(output_file, 'w') as f:
-            json.dump(transcript, f, indent=2)
+        with open(output_file, 'wb') as f:
+            f.write(fast_json.dumps(transcript, indent=True))
         print(f"Processed {len(transcript)} segments (pass-through)")
         print(f"Output written to: {output_file}")
         return
@@ -63,9 +64,10 @@ def combine_transcript_words(input_file, output_file):
 
         combined_transcript.append(combined_segment)
 
-    # Write the combined transcript
-    with open(output_file, 'w') as f:
-        json.dump(combined_transcript, f, indent=2)
+    # Write the combined transcript (uploaded alongside the outputs, so it
+    # stays pretty-printed)
+    with open(output_file, 'wb') as f:
+        f.write(fast_json.dumps(combined_transcript, indent=True))
 
     print(f"Processed {len(combined_transcript)} segments")
     print(f"Output written to: {output_file}")
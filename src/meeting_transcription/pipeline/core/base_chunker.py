@@ -14,6 +14,16 @@ class ChunkMetadata:
     total_duration_minutes: int
     additional_metadata: dict[str, Any]
 
+    def to_dict(self) -> dict[str, Any]:
+        """Shallow dict for JSON serialization (no asdict deep copy)"""
+        return {
+            'content_type': self.content_type,
+            'chunk_strategy': self.chunk_strategy,
+            'total_chunks': self.total_chunks,
+            'total_duration_minutes': self.total_duration_minutes,
+            'additional_metadata': self.additional_metadata,
+        }
+
 
 class BaseChunker(ABC):
     """
@@ -6,13 +6,18 @@ Base class for plugins using single-pass LLM structured extraction.
 Handles transcript chunking, LLM calling, and response parsing.
 Subclasses implement domain-specific prompts and output formatting.
 """
-import json
+import logging
 import os
 from abc import ABC, abstractmethod
-from dataclasses import asdict, is_dataclass
+from functools import cached_property
 from typing import Any
 
-from meeting_transcription.utils.llm_client import LLMClient
+from meeting_transcription.utils import fast_json
+from meeting_transcription.utils.llm_client import get_llm_client, parse_json_response
+
+from .base_chunker import ChunkMetadata
+
+logger = logging.getLogger(__name__)
 
 
 class BasePromptablePlugin(ABC):
@@ -36,67 +41,70 @@ class BasePromptablePlugin(ABC):
         outputs = {}
 
         # Load transcript
-        print("📂 Loading combined transcript...")
-        with open(combined_transcript_path) as f:
-            combined_transcript = json.load(f)
+        logger.debug("Loading combined transcript %s", combined_transcript_path)
+        with open(combined_transcript_path, 'rb') as f:
+            combined_transcript = fast_json.loads(f.read())
 
         # Chunk transcript
-        print("📦 Chunking transcript...")
+        logger.debug("Chunking transcript")
         chunker = self.get_chunker()
         chunked_data = chunker.chunk_transcript(combined_transcript, **metadata)
 
-        # Convert ChunkMetadata dataclass to dict for JSON serialization
-        chunks_to_save = {
-            'metadata': asdict(chunked_data['metadata']) if is_dataclass(chunked_data['metadata']) else chunked_data['metadata'],
-            'chunks': chunked_data['chunks']
-        }
+        # Chunkers return ChunkMetadata; plain dicts are still accepted.
+        # Normalize once to the dict form used for JSON and the summary.
+        chunk_metadata = chunked_data['metadata']
+        if isinstance(chunk_metadata, ChunkMetadata):
+            chunk_metadata = chunk_metadata.to_dict()
+
+        if self.should_save_chunks():
+            chunks_to_save = {
+                'metadata': chunk_metadata,
+                'chunks': chunked_data['chunks']
+            }
 
-        chunks_path = os.path.join(output_dir, "chunks.json")
-        with open(chunks_path, 'w') as f:
-            json.dump(chunks_to_save, f, indent=2)
-        outputs["chunks"] = chunks_path
-        print(f"   Saved {len(chunked_data['chunks'])} chunks")
+            chunks_path = os.path.join(output_dir, "chunks.json")
+            with open(chunks_path, 'wb') as f:
+                f.write(fast_json.dumps(chunks_to_save, indent=True))
+            outputs["chunks"] = chunks_path
+            logger.debug("Saved %d chunks", len(chunked_data['chunks']))
 
         # Format transcript for prompt
-        print("📝 Formatting transcript for LLM...")
+        logger.debug("Formatting transcript for LLM")
         transcript_text = self._format_transcript_for_prompt(chunked_data)
 
         # Get prompt from subclass
-        print("🎯 Building extraction prompt...")
+        logger.debug("Building extraction prompt")
         prompt = self.get_extraction_prompt(transcript_text, metadata)
 
         # Call LLM (uses AI_MODEL env var if model not provided)
-        print("🤖 Calling LLM...")
-        llm_client = LLMClient(model=model)
-
-        response_schema = self.get_response_schema()
+        llm_client = get_llm_client(model)
+        logger.info("Calling LLM %s", llm_client.model)
+        response_schema = self._response_schema
         if response_schema:
-            print("   Using structured output schema")
+            logger.debug("Using structured output schema")
             llm_response = llm_client.call_structured(
                 prompt=prompt,
                 response_schema=response_schema,
                 max_tokens=self.get_max_tokens(),
-                temperature=self.get_temperature()
+                temperature=self.get_temperature(),
+                cache_prompt=True
             )
         else:
-            print("   Using free-form text output")
+            logger.debug("Using free-form text output")
             llm_response_text = llm_client.call(
                 prompt=prompt,
                 max_tokens=self.get_max_tokens(),
-                temperature=self.get_temperature()
+                temperature=self.get_temperature(),
+                cache_prompt=True
             )
             llm_response = self._parse_json_response(llm_response_text)
 
         # Save LLM response
-        print("💾 Saving LLM response...")
+        logger.debug("Saving LLM response")
         summary_path = os.path.join(output_dir, "summary.json")
 
-        # Extract chunk strategy from metadata (handle both dict and dataclass)
-        chunk_metadata = chunked_data.get('metadata', {})
-        if is_dataclass(chunk_metadata):
-            chunk_strategy = str(chunk_metadata.chunk_strategy)
-        else:
-            chunk_strategy = chunk_metadata.get('chunk_strategy', 'unknown')
+        # ChunkStrategy is a str Enum, so str() gives its value
+        chunk_strategy = str(chunk_metadata.get('chunk_strategy', 'unknown'))
 
         # Extract provider from model for logging
         provider = llm_client.model.split(":")[0] if ":" in llm_client.model else "unknown"
@@ -113,15 +121,16 @@ class BasePromptablePlugin(ABC):
             'processing_info': {
                 'provider': provider,
                 'model': llm_client.model,
-                'chunks_processed': len(chunked_data['chunks'])
+                'chunks_processed': len(chunked_data['chunks']),
+                'usage': llm_client.last_usage
             }
         }
-        with open(summary_path, 'w') as f:
-            json.dump(summary_data, f, indent=2)
+        with open(summary_path, 'wb') as f:
+            f.write(fast_json.dumps(summary_data, indent=True))
         outputs["summary"] = summary_path
 
         # Create output files via subclass
-        print("📋 Formatting outputs...")
+        logger.debug("Formatting outputs")
         subclass_outputs = self.process_llm_response(
             llm_response=llm_response,
             output_dir=output_dir,
@@ -129,31 +138,29 @@ class BasePromptablePlugin(ABC):
         )
         outputs.update(subclass_outputs)
 
-        print(f"✅ Pipeline complete! Generated {len(outputs)} outputs")
+        logger.info("Pipeline complete, generated %d outputs", len(outputs))
         return outputs
 
     def _format_transcript_for_prompt(self, chunked_data: dict) -> str:
         """Format transcript chunks into text for LLM prompt."""
-        lines = []
-        for chunk in chunked_data['chunks']:
-            for segment in chunk.get('segments', []):
-                speaker = segment['participant']['name']
-                text = segment['text']
-                timestamp = segment['start_timestamp']['relative']
-                minutes = int(timestamp // 60)
-                seconds = int(timestamp % 60)
-                lines.append(f"[{minutes:02d}:{seconds:02d}] {speaker}: {text}")
-        return "\n".join(lines)
+        timestamps = _get_prompt_timestamps()
+        cached = len(timestamps)
+
+        def lines():
+            for chunk in chunked_data['chunks']:
+                for segment in chunk.get('segments', ()):
+                    offset = int(segment['start_timestamp']['relative'])
+                    if 0 <= offset < cached:
+                        timestamp = timestamps[offset]
+                    else:
+                        minutes, seconds = divmod(offset, 60)
+                        timestamp = f"[{minutes:02d}:{seconds:02d}]"
+                    yield f"{timestamp} {segment['participant']['name']}: {segment['text']}"
+        return "\n".join(lines())
 
     def _parse_json_response(self, response: str) -> dict[str, Any]:
         """Parse JSON from LLM response, handling markdown code blocks."""
-        if '```json' in response:
-            json_str = response.split('```json')[1].split('```')[0].strip()
-        elif '```' in response:
-            json_str = response.split('```')[1].split('```')[0].strip()
-        else:
-            json_str = response.strip()
-        return json.loads(json_str)
+        return parse_json_response(response)
 
     # ========================================================================
     # Abstract methods - subclass must implement
@@ -193,6 +200,15 @@ class BasePromptablePlugin(ABC):
         """
         pass
 
+    # get_response_schema() is resolved once per plugin instance; plugins are
+    # long-lived, so server mode reuses the schema across transcripts. The
+    # chunker is built per run (get_chunker()) because chunkers may hold
+    # per-run state.
+
+    @cached_property
+    def _response_schema(self) -> dict[str, Any] | None:
+        return self.get_response_schema()
+
     # ========================================================================
     # Optional overrides
     # ========================================================================
@@ -206,6 +222,15 @@ class BasePromptablePlugin(ABC):
         from ..chunkers.whole_meeting_chunker import WholeMeetingChunker
         return WholeMeetingChunker()
 
+    def should_save_chunks(self) -> bool:
+        """
+        Return whether to write chunks.json and list it in the outputs.
+
+        Default: True. Override to return False when nothing reads the
+        chunks back, to skip serializing the whole transcript again.
+        """
+        return True
+
     def get_max_tokens(self) -> int:
         """Return max tokens for LLM response (default: 8000)."""
         return 8000
@@ -213,3 +238,18 @@ class BasePromptablePlugin(ABC):
     def get_temperature(self) -> float:
         """Return temperature for LLM sampling (default: 0.7)."""
         return 0.7
+
+
+# "[mm:ss]" labels for every second of the first two hours, indexed by
+# offset in seconds; built on first use (longer offsets are formatted)
+_prompt_timestamps: tuple[str, ...] | None = None
+
+
+def _get_prompt_timestamps() -> tuple[str, ...]:
+    """Get the prompt timestamp lookup table."""
+    global _prompt_timestamps
+    if _prompt_timestamps is None:
+        _prompt_timestamps = tuple(
+            f"[{minutes:02d}:{seconds:02d}]" for minutes in range(120) for seconds in range(60)
+        )
+    return _prompt_timestamps
@@ -4,7 +4,7 @@ from typing import Any
 from .types import ContentType
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class PipelineConfig:
     """
     Configuration for a content processing pipeline.
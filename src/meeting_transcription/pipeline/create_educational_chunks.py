@@ -3,8 +3,20 @@
 Create educational content chunks optimized for LLM summarization.
 Designed for AI/tech class recordings with instructor and students.
 """
-import json
 import sys
+from bisect import bisect_left, bisect_right
+from dataclasses import asdict, dataclass
+
+from meeting_transcription.utils import fast_json
+
+
+@dataclass(slots=True)
+class ClassParticipantStats:
+    """Running word and segment totals for one class participant."""
+    name: str
+    is_instructor: bool = False
+    total_words: int = 0
+    total_segments: int = 0
 
 
 def format_timestamp(seconds: float) -> str:
@@ -49,48 +61,110 @@ def create_educational_chunks(
     Returns:
         List of educational chunks
     """
+    chunks, _participants = create_educational_chunks_with_stats(
+        transcript, instructor, chunk_minutes
+    )
+    return chunks
+
+def create_educational_chunks_with_stats(
+    transcript: list[dict],
+    instructor: str,
+    chunk_minutes: int = 10
+) -> tuple[list[dict], dict[str, dict]]:
+    """
+    Create time-based chunks and per-participant statistics.
+
+    The transcript is walked once: participant totals are accumulated while
+    each segment is reduced to the fields the chunks need, and the time
+    windows are then filled from those.
+
+    Args:
+        transcript: Combined transcript
+        instructor: Name of the instructor
+        chunk_minutes: Minutes per chunk
+
+    Returns:
+        Tuple of (chunks, participants), where participants maps each
+        speaker name to its name, is_instructor, total_words and
+        total_segments
+    """
     if not transcript:
-        return []
+        return [], {}
+
+    participants = {}
+    entries = []
+    for segment in transcript:
+        speaker = segment['participant']['name']
+        word_count = segment['word_count']
+
+        stats = participants.get(speaker)
+        if stats is None:
+            stats = participants[speaker] = ClassParticipantStats(speaker, speaker == instructor)
+        stats.total_words += word_count
+        stats.total_segments += 1
+
+        seg_start = segment['start_timestamp']['relative']
+        entries.append((
+            seg_start,
+            segment['end_timestamp']['relative'],
+            speaker,
+            stats.is_instructor,
+            segment['text'],
+            format_timestamp(seg_start),
+            word_count,
+        ))
 
     chunks = []
     chunk_seconds = chunk_minutes * 60
 
     # Get meeting boundaries
-    meeting_start = transcript[0]['start_timestamp']['relative']
-    meeting_end = transcript[-1]['end_timestamp']['relative']
+    meeting_start = entries[0][0]
+    meeting_end = entries[-1][1]
 
+    # Window boundaries; each window starts where the previous one ends
+    window_starts = []
+    window_ends = []
     current_time = meeting_start
-    chunk_num = 1
-
     while current_time < meeting_end:
-        chunk_end = current_time + chunk_seconds
-
-        # Collect segments in this time window
-        chunk_segments = []
-        for segment in transcript:
-            seg_start = segment['start_timestamp']['relative']
-            seg_end = segment['end_timestamp']['relative']
-
-            # Include if overlaps with chunk window
-            if seg_start < chunk_end and seg_end > current_time:
-                speaker = segment['participant']['name']
-                is_instructor = speaker == instructor
-
-                chunk_segments.append({
-                    'speaker': speaker,
-                    'is_instructor': is_instructor,
-                    'text': segment['text'],
-                    'timestamp': format_timestamp(seg_start),
-                    'word_count': segment['word_count'],
-                    'start_seconds': seg_start,
-                    'end_seconds': seg_end
-                })
+        window_starts.append(current_time)
+        current_time += chunk_seconds
+        window_ends.append(current_time)
+
+    # Assign each segment to every window it overlaps
+    # (seg_start < window end and seg_end > window start) by binary search
+    # instead of scanning all segments for each window. Segments stay in
+    # transcript order within a window.
+    window_segments = [[] for _ in window_starts]
+    for seg_start, seg_end, speaker, is_instructor, text, timestamp, word_count in entries:
+        first = bisect_right(window_ends, seg_start)
+        last = bisect_left(window_starts, seg_end)
+        if first >= last:
+            continue
+        segment = {
+            'speaker': speaker,
+            'is_instructor': is_instructor,
+            'text': text,
+            'timestamp': timestamp,
+            'word_count': word_count,
+            'start_seconds': seg_start,
+            'end_seconds': seg_end
+        }
+        window_segments[first].append(segment)
+        for window in range(first + 1, last):
+            # Each chunk gets its own segment dicts
+            window_segments[window].append(dict(segment))
+
+    chunk_num = 1
 
+    for current_time, chunk_end, chunk_segments in zip(
+        window_starts, window_ends, window_segments, strict=True
+    ):
         if chunk_segments:
             # Calculate statistics
             total_words = sum(seg['word_count'] for seg in chunk_segments)
             speakers = list({seg['speaker'] for seg in chunk_segments})
-            student_speakers = [s for s in speakers if s != instructor]
+            # Instructor status was resolved once per speaker above
+            student_speakers = [s for s in speakers if not participants[s].is_instructor]
 
             # Count instructor vs student words
             instructor_words = sum(
@@ -117,9 +191,7 @@ def create_educational_chunks(
             })
             chunk_num += 1
 
-        current_time = chunk_end
-
-    return chunks
+    return chunks, {name: asdict(stats) for name, stats in participants.items()}
 
 def format_chunk_for_llm(chunk: dict, instructor: str) -> str:
     """
@@ -153,7 +225,7 @@ def create_educational_content_chunks(
     input_file: str,
     output_file: str,
     chunk_minutes: int = 10
-):
+) -> dict:
     """
     Main function to create educational chunks from combined transcript.
 
@@ -161,10 +233,14 @@ def create_educational_content_chunks(
         input_file: Combined transcript JSON
         output_file: Output educational chunks JSON
         chunk_minutes: Minutes per chunk (default 10)
+
+    Returns:
+        The chunks document written to output_file ({'metadata', 'chunks'}),
+        so an in-process caller can pass it on without re-reading the file
     """
     # Read combined transcript
-    with open(input_file) as f:
-        transcript = json.load(f)
+    with open(input_file, 'rb') as f:
+        transcript = fast_json.loads(f.read())
 
     if not transcript:
         raise ValueError("Empty transcript - no content to process")
@@ -173,22 +249,17 @@ def create_educational_content_chunks(
     instructor = identify_instructor(transcript)
     print(f"Identified instructor: {instructor}")
 
-    # Get all participants
-    participants = {}
-    for segment in transcript:
-        name = segment['participant']['name']
-        if name not in participants:
-            participants[name] = {
-                'name': name,
-                'is_instructor': name == instructor,
-                'total_words': 0,
-                'speaking_turns': 0
-            }
-        participants[name]['total_words'] += segment['word_count']
-        participants[name]['speaking_turns'] += 1
-
-    # Create chunks
-    chunks = create_educational_chunks(transcript, instructor, chunk_minutes)
+    # Create chunks; participant stats are gathered in the same pass
+    chunks, stats = create_educational_chunks_with_stats(transcript, instructor, chunk_minutes)
+    participants = [
+        {
+            'name': p['name'],
+            'is_instructor': p['is_instructor'],
+            'total_words': p['total_words'],
+            'speaking_turns': p['total_segments']
+        }
+        for p in stats.values()
+    ]
 
     # Calculate metadata
     total_duration = transcript[-1]['end_timestamp']['relative'] / 60
@@ -207,14 +278,14 @@ def create_educational_content_chunks(
             'total_words': sum(chunk['total_words'] for chunk in chunks),
             'instructor': instructor,
             'total_participants': len(participants),
-            'participants': list(participants.values())
+            'participants': participants
         },
         'chunks': chunks
     }
 
-    # Write output
-    with open(output_file, 'w') as f:
-        json.dump(output, f, indent=2)
+    # Write output (user-facing, so always indented)
+    with open(output_file, 'wb') as f:
+        f.write(fast_json.dumps(output, indent=True))
 
     # Print summary
     print("\n=== Educational Chunks Created ===")
@@ -240,6 +311,8 @@ def create_educational_content_chunks(
         f.write(format_chunk_for_llm(chunks[0], instructor))
     print(f"Sample LLM format written to: {sample_file}")
 
+    return output
+
 if __name__ == '__main__':
     if len(sys.argv) < 3:
         print("Usage: python create_educational_chunks.py <input_file> <output_file> [chunk_minutes]")
@@ -2,50 +2,63 @@
 """
 Create markdown and PDF study guide from educational summary JSON.
 """
-import json
+import logging
 import sys
 from datetime import datetime
+from itertools import islice
 
+from meeting_transcription.utils import fast_json
 
-def create_markdown_study_guide(summary_file: str, output_file: str):
+logger = logging.getLogger(__name__)
+
+
+def create_markdown_study_guide(summary_file: str, output_file: str, summary_data: dict | None = None):
     """
     Convert educational summary JSON to markdown study guide.
 
     Args:
         summary_file: Path to summary JSON
         output_file: Path to output markdown file
+        summary_data: The summary document, if the caller already has it in
+            memory; summary_file is then not read
     """
     # Load summary
-    with open(summary_file) as f:
-        data = json.load(f)
+    if summary_data is not None:
+        data = summary_data
+    else:
+        with open(summary_file, 'rb') as f:
+            data = fast_json.loads(f.read())
 
-    metadata = data.get('metadata', {})
-    chunk_analyses = data.get('chunk_analyses', [])
-    overall_summary = data.get('overall_summary', {})
-    action_items = data.get('action_items', {})
+    metadata = data.get('metadata') or {}
+    chunk_analyses = data.get('chunk_analyses') or []
+    overall_summary = data.get('overall_summary') or {}
+    action_items = data.get('action_items') or {}
+    class_metadata = overall_summary.get('class_metadata') or {}
+    meta_get = metadata.get
 
     # Start building markdown
     md = []
 
     # Title
-    class_topic = overall_summary.get('class_metadata', {}).get('topic', 'AI Solutions Architect Class')
+    class_topic = class_metadata.get('topic', 'AI Solutions Architect Class')
     md.append(f"# {class_topic}")
     md.append("")
 
     # Metadata
     md.append("## Class Information")
     md.append("")
-    md.append(f"- **Instructor**: {metadata.get('instructor', 'Unknown')}")
-    md.append(f"- **Date**: {metadata.get('meeting_date', 'Unknown')}")
-    md.append(f"- **Duration**: {metadata.get('meeting_duration_minutes', 0)} minutes")
-    md.append(f"- **Participants**: {metadata.get('total_participants', 0)}")
+    md.append(f"- **Instructor**: {meta_get('instructor', 'Unknown')}")
+    md.append(f"- **Date**: {meta_get('meeting_date', 'Unknown')}")
+    md.append(f"- **Duration**: {meta_get('meeting_duration_minutes', 0)} minutes")
+    md.append(f"- **Participants**: {meta_get('total_participants', 0)}")
     md.append("")
 
     # Executive Summary
-    if 'executive_summary' in overall_summary and overall_summary['executive_summary']:
+    executive_summary = overall_summary.get('executive_summary')
+    if executive_summary:
         md.append("## Executive Summary")
         md.append("")
-        md.append(overall_summary['executive_summary'])
+        md.append(executive_summary)
         md.append("")
 
     # Action Items
@@ -53,10 +66,11 @@ def create_markdown_study_guide(summary_file: str, output_file: str):
     md.append("")
 
     if action_items:
-        if action_items.get('student_assignments'):
+        student_assignments = action_items.get('student_assignments')
+        if student_assignments:
             md.append("### Student Assignments")
             md.append("")
-            for assignment in action_items['student_assignments']:
+            for assignment in student_assignments:
                 md.append(f"- **{assignment.get('assignment', 'Task')}**")
                 if assignment.get('due_date'):
                     md.append(f"  - Due: {assignment['due_date']}")
@@ -64,19 +78,21 @@ def create_markdown_study_guide(summary_file: str, output_file: str):
                     md.append(f"  - Purpose: {assignment['purpose']}")
                 md.append("")
 
-        if action_items.get('instructor_commitments'):
+        instructor_commitments = action_items.get('instructor_commitments')
+        if instructor_commitments:
             md.append("### Instructor Commitments")
             md.append("")
-            for commit in action_items['instructor_commitments']:
+            for commit in instructor_commitments:
                 md.append(f"- {commit.get('commitment', 'Task')}")
                 if commit.get('timeline'):
                     md.append(f"  - Timeline: {commit['timeline']}")
                 md.append("")
 
-        if action_items.get('preparation_for_next_class'):
+        preparation = action_items.get('preparation_for_next_class')
+        if preparation:
             md.append("### Preparation for Next Class")
             md.append("")
-            for prep in action_items['preparation_for_next_class']:
+            for prep in preparation:
                 md.append(f"- {prep.get('task', 'Task')}")
                 if prep.get('reason'):
                     md.append(f"  - Reason: {prep['reason']}")
@@ -142,31 +158,38 @@ def create_markdown_study_guide(summary_file: str, output_file: str):
         for i, insight in enumerate(unique_insights, 1):
             md.append(f"{i}. {insight}")
         md.append("")
-    # Collect all unique concepts (to be rendered later at the end)
+    # Collect unique concepts (rendered later at the end), unique tools and
+    # all Q&A in one pass over the chunks
     all_concepts = {}
+    all_tools = {}
+    all_qa = []
     for chunk in chunk_analyses:
+        chunk_number = chunk['chunk_number']
         for concept in chunk.get('key_concepts', []):
             name = concept.get('name', 'Unknown')
-            if name not in all_concepts:
-                all_concepts[name] = {
+            entry = all_concepts.get(name)
+            if entry is None:
+                entry = all_concepts[name] = {
                     'definition': concept.get('definition', ''),
                     'explanation': concept.get('explanation_summary', ''),
                     'examples': concept.get('examples_mentioned', []),
                     'chunks': []
                 }
-            all_concepts[name]['chunks'].append(chunk['chunk_number'])
-    # Collect all unique tools
-    all_tools = {}
-    for chunk in chunk_analyses:
+            entry['chunks'].append(chunk_number)
         for tool in chunk.get('tools_frameworks', []):
             name = tool.get('name', 'Unknown')
-            if name not in all_tools:
-                all_tools[name] = {
+            entry = all_tools.get(name)
+            if entry is None:
+                entry = all_tools[name] = {
                     'context': tool.get('context', ''),
                     'use_case': tool.get('use_case', ''),
                     'chunks': []
                 }
-            all_tools[name]['chunks'].append(chunk['chunk_number'])
+            entry['chunks'].append(chunk_number)
+        for qa in chunk.get('qa_exchanges', []):
+            # Copied: summary_data may be the caller's in-memory summary
+            all_qa.append({**qa, 'chunk': chunk_number, 'time_range': chunk['time_range']})
+
     # Tools & Frameworks
     md.append("## Tools & Frameworks")
     md.append("")
@@ -178,37 +201,10 @@ def create_markdown_study_guide(summary_file: str, output_file: str):
         md.append(f"| **{name}** | {context} | {use_case} |")
     md.append("")
 
-    # Collect all Q&A
-    all_qa = []
-    for chunk in chunk_analyses:
-        for qa in chunk.get('qa_exchanges', []):
-            qa['chunk'] = chunk['chunk_number']
-            qa['time_range'] = chunk['time_range']
-            all_qa.append(qa)
-
     # Consolidate duplicate questions
     if len(all_qa) > 3:
-        print("🔄 Consolidating Q&A exchanges...")
-        # Group by similar questions
-        consolidated_qa = []
-        seen_questions = {}
-
-        for qa in all_qa:
-            question = qa.get('question', '')
-            # Simple similarity check - questions with 80%+ word overlap are considered duplicates
-            is_duplicate = False
-            for seen_q in seen_questions:
-                q_words = set(question.lower().split())
-                seen_words = set(seen_q.lower().split())
-                if len(q_words & seen_words) / max(len(q_words), len(seen_words)) > 0.8:
-                    is_duplicate = True
-                    break
-
-            if not is_duplicate:
-                consolidated_qa.append(qa)
-                seen_questions[question] = True
-
-        print(f"  Consolidated {len(all_qa)} → {len(consolidated_qa)} Q&A exchanges")
+        consolidated_qa = consolidate_qa_exchanges(all_qa)
+        logger.debug("Consolidated %d -> %d Q&A exchanges", len(all_qa), len(consolidated_qa))
         all_qa = consolidated_qa
 
     # Q&A Exchanges
@@ -233,15 +229,17 @@ def create_markdown_study_guide(summary_file: str, output_file: str):
         md.append(f"**Main Theme**: {chunk.get('main_theme', 'No theme')}")
         md.append("")
 
-        if chunk.get('key_concepts'):
+        key_concepts = chunk.get('key_concepts')
+        if key_concepts:
             md.append("**Concepts Covered**:")
-            for concept in chunk['key_concepts']:
+            for concept in key_concepts:
                 md.append(f"- {concept.get('name', 'Unknown')}")
             md.append("")
 
-        if chunk.get('tools_frameworks'):
+        tools = chunk.get('tools_frameworks')
+        if tools:
             md.append("**Tools Mentioned**:")
-            for tool in chunk['tools_frameworks'][:5]:  # Limit to 5
+            for tool in islice(tools, 5):  # Limit to 5
                 md.append(f"- {tool.get('name', 'Unknown')}")
             md.append("")
 
@@ -276,24 +274,73 @@ def create_markdown_study_guide(summary_file: str, output_file: str):
     with open(output_file, 'w') as f:
         f.write(markdown_content)
 
-    print(f"✓ Markdown study guide created: {output_file}")
+    logger.info(
+        "Markdown study guide created: %s (%d key concepts, %d tools/frameworks, "
+        "%d best practices, %d unique insights, %d Q&A exchanges, %d time segments)",
+        output_file,
+        len(all_concepts),
+        len(all_tools),
+        len(best_practices),
+        len(unique_insights),
+        len(all_qa),
+        len(chunk_analyses),
+    )
 
-    # Calculate stats
-    total_concepts = len(all_concepts)
-    total_tools = len(all_tools)
-    total_practices = len(best_practices)
-    total_insights = len(unique_insights)
-    total_qa = len(all_qa)
+    return output_file
 
-    print("\nStudy Guide Contents:")
-    print(f"  - {total_concepts} Key Concepts")
-    print(f"  - {total_tools} Tools/Frameworks")
-    print(f"  - {total_practices} Best Practices")
-    print(f"  - {total_insights} Unique Insights")
-    print(f"  - {total_qa} Q&A Exchanges")
-    print(f"  - {len(chunk_analyses)} Time Segments")
 
-    return output_file
+def consolidate_qa_exchanges(all_qa: list[dict], threshold: float = 0.8) -> list[dict]:
+    """
+    Drop Q&A exchanges whose question repeats an earlier one.
+
+    Two questions are duplicates when their shared words exceed threshold
+    of the larger word set. Each kept question's word set is computed once
+    and indexed by word, so a question is only compared against earlier
+    questions it shares a word with.
+
+    Args:
+        all_qa: Q&A exchanges in transcript order
+        threshold: Word-overlap ratio above which questions are duplicates
+
+    Returns:
+        The exchanges that were kept, in order
+    """
+    consolidated_qa = []
+    kept_words = []
+    word_index = {}
+    seen_empty = False
+
+    for qa in all_qa:
+        q_words = set(qa.get('question', '').lower().split())
+
+        if not q_words:
+            # Blank questions only duplicate each other
+            if seen_empty:
+                continue
+            seen_empty = True
+            consolidated_qa.append(qa)
+            continue
+
+        # Count shared words with each earlier question via the index
+        overlaps = {}
+        for word in q_words:
+            for idx in word_index.get(word, ()):
+                overlaps[idx] = overlaps.get(idx, 0) + 1
+
+        is_duplicate = any(
+            shared / max(len(q_words), len(kept_words[idx])) > threshold
+            for idx, shared in overlaps.items()
+        )
+        if is_duplicate:
+            continue
+
+        idx = len(kept_words)
+        kept_words.append(q_words)
+        for word in q_words:
+            word_index.setdefault(word, []).append(idx)
+        consolidated_qa.append(qa)
+
+    return consolidated_qa
 
 
 if __name__ == '__main__':
@@ -303,6 +350,8 @@ if __name__ == '__main__':
         print("  python create_study_guide.py transcript_summary.json study_guide.md")
         sys.exit(1)
 
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
     summary_file = sys.argv[1]
     output_file = sys.argv[2]
 
@@ -4,13 +4,14 @@ LLM prompt templates for educational content extraction.
 Designed for AI/tech class recordings.
 """
 
-# Prompt for analyzing individual chunks
-CHUNK_ANALYSIS_PROMPT = """You are analyzing a transcript chunk from an AI Solutions Architect class taught by {instructor}.
+from functools import lru_cache
 
-Your task is to extract structured educational content from this transcript segment.
+# Prompt for analyzing individual chunks. The instructions come first and
+# the chunk text last, so every chunk call of a run shares the same prefix
+# (which providers can serve from their prompt cache).
+CHUNK_ANALYSIS_INSTRUCTIONS = """You are analyzing a transcript chunk from an AI Solutions Architect class taught by {instructor}.
 
-TRANSCRIPT CHUNK:
-{chunk_text}
+Your task is to extract structured educational content from the transcript segment at the end of this message.
 
 Extract the following information in JSON format:
 
@@ -92,6 +93,13 @@ Example response structure:
 }}
 """
 
+CHUNK_ANALYSIS_TRANSCRIPT = """
+TRANSCRIPT CHUNK:
+{chunk_text}
+"""
+
+CHUNK_ANALYSIS_PROMPT = CHUNK_ANALYSIS_INSTRUCTIONS + CHUNK_ANALYSIS_TRANSCRIPT
+
 # Prompt for creating overall summary from all chunks
 OVERALL_SUMMARY_PROMPT = """You are creating a comprehensive study guide for an AI Solutions Architect class.
 
@@ -228,21 +236,8 @@ Important:
 - Be specific with technical details - this is a technical class
 """
 
-# Prompt for extracting action items across entire transcript
-ACTION_ITEMS_PROMPT = """You are analyzing a transcript from an AI Solutions Architect class to extract ALL action items, assignments, and commitments.
-
-FULL TRANSCRIPT SUMMARY:
-{full_summary}
-
-Extract:
-
-1. **Student Assignments**: Homework, projects, tasks assigned to students
-2. **Instructor Commitments**: Things the instructor promised to share/do
-3. **Class Expectations**: What students should do before next class
-4. **Resource Sharing**: Materials that will be shared or were mentioned
-
-Return in JSON format:
-{{
+# JSON structure of the extracted action items (braces escaped for str.format)
+ACTION_ITEMS_SCHEMA = """{{
   "student_assignments": [
     {{
       "assignment": "Description",
@@ -271,12 +266,42 @@ Return in JSON format:
       "mentioned_at": "Timestamp"
     }}
   ]
-}}
-"""
+}}"""
+
+# Prompt for extracting action items across entire transcript
+ACTION_ITEMS_PROMPT = """You are analyzing a transcript from an AI Solutions Architect class to extract ALL action items, assignments, and commitments.
+
+FULL TRANSCRIPT SUMMARY:
+{full_summary}
+
+Extract:
+
+1. **Student Assignments**: Homework, projects, tasks assigned to students
+2. **Instructor Commitments**: Things the instructor promised to share/do
+3. **Class Expectations**: What students should do before next class
+4. **Resource Sharing**: Materials that will be shared or were mentioned
+
+Return in JSON format:
+""" + ACTION_ITEMS_SCHEMA + "\n"
+
+# Overall summary and action items in one call: the action items come from
+# the chunk summaries directly instead of a second pass over the summary
+OVERALL_SUMMARY_WITH_ACTION_ITEMS_PROMPT = OVERALL_SUMMARY_PROMPT + """
+Also extract ALL action items, assignments, and commitments from the chunk summaries
+(student assignments, instructor commitments, preparation for next class, and
+resources to be shared) and include them in the same JSON object under a top-level
+"action_items" key with this structure:
+
+""" + ACTION_ITEMS_SCHEMA + "\n"
+
+@lru_cache(maxsize=8)
+def chunk_analysis_instructions(instructor):
+    """Static part of the chunk analysis prompt (formatted once per instructor)."""
+    return CHUNK_ANALYSIS_INSTRUCTIONS.format(instructor=instructor)
 
 # Helper function to format chunk for LLM
-def format_chunk_for_llm_analysis(chunk_data, instructor):
-    """Format a single chunk for LLM analysis."""
+def chunk_analysis_prompt_parts(chunk_data, instructor):
+    """Return (instructions, transcript) for a chunk; the prompt is their concatenation."""
     chunk_text = f"=== TIME RANGE: {chunk_data['time_range']} ===\n"
     chunk_text += f"Duration: {chunk_data['duration_minutes']:.1f} minutes\n"
     chunk_text += f"Speakers: {', '.join(chunk_data['speakers'])}\n"
@@ -287,18 +312,27 @@ def format_chunk_for_llm_analysis(chunk_data, instructor):
         role = "INSTRUCTOR" if seg['is_instructor'] else "STUDENT"
         chunk_text += f"[{seg['timestamp']}] {role} ({seg['speaker']}): {seg['text']}\n\n"
 
-    return CHUNK_ANALYSIS_PROMPT.format(
-        instructor=instructor,
-        chunk_text=chunk_text
+    return (
+        chunk_analysis_instructions(instructor),
+        CHUNK_ANALYSIS_TRANSCRIPT.format(chunk_text=chunk_text)
     )
 
-def create_overall_summary_prompt(chunk_analyses, metadata):
-    """Create prompt for overall summary from chunk analyses."""
-    chunk_summaries_text = ""
-    for i, analysis in enumerate(chunk_analyses, 1):
-        chunk_summaries_text += f"\n=== CHUNK {i} ===\n{analysis}\n"
+def format_chunk_for_llm_analysis(chunk_data, instructor):
+    """Format a single chunk for LLM analysis."""
+    return "".join(chunk_analysis_prompt_parts(chunk_data, instructor))
+
+def create_overall_summary_prompt(chunk_analyses, metadata, include_action_items=False):
+    """Create prompt for overall summary from chunk analyses.
+
+    With include_action_items, the response also carries the action items
+    (ACTION_ITEMS_SCHEMA) under "action_items", saving a separate call.
+    """
+    chunk_summaries_text = "".join(
+        f"\n=== CHUNK {i} ===\n{analysis}\n" for i, analysis in enumerate(chunk_analyses, 1)
+    )
 
-    return OVERALL_SUMMARY_PROMPT.format(
+    template = OVERALL_SUMMARY_WITH_ACTION_ITEMS_PROMPT if include_action_items else OVERALL_SUMMARY_PROMPT
+    return template.format(
         num_chunks=len(chunk_analyses),
         chunk_summaries=chunk_summaries_text,
         instructor=metadata.get('instructor', 'Unknown'),
@@ -5,20 +5,15 @@ This factory detects content type and instantiates appropriate
 chunker, prompt engine, and formatter implementations.
 """
 
-import os
-import sys
 from typing import Any
 
-# Add parent directory to path for imports
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../..'))
-
-from pipeline.chunkers import EducationalTimeBasedChunker
-from pipeline.core import (
+from ..chunkers import EducationalTimeBasedChunker
+from ..core import (
     ContentType,
     PipelineConfig,
 )
-from pipeline.formatters import StudyGuideFormatter
-from pipeline.prompts import EducationalPromptEngine
+from ..formatters import StudyGuideFormatter
+from ..prompts import EducationalPromptEngine
 
 
 class PipelineFactory:
@@ -6,17 +6,62 @@ implementations, maintaining 100% backward compatibility while conforming
 to the BaseFormatter interface.
 """
 
-import json
 import os
-import sys
 from pathlib import Path
 from typing import Any
 
-# Add parent directory to path for imports
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../..'))
+from meeting_transcription.utils import fast_json
 
-from pipeline import create_study_guide, markdown_to_pdf
-from pipeline.core import BaseFormatter
+from .. import create_study_guide, markdown_to_pdf
+from ..core import BaseFormatter
+
+# summary.json metadata key -> ChunkMetadata attribute
+_METADATA_FIELDS = (
+    ('content_type', 'content_type'),
+    ('chunk_strategy', 'chunk_strategy'),
+    ('total_chunks', 'total_chunks'),
+    ('meeting_duration_minutes', 'total_duration_minutes'),
+)
+
+
+def _metadata_to_dict(metadata: Any) -> dict[str, Any]:
+    """
+    Flatten ChunkMetadata (or a dict with the same keys) for summary.json.
+
+    Missing fields come out as None instead of raising.
+    """
+    get = metadata.get if isinstance(metadata, dict) else (
+        lambda attr, default=None: getattr(metadata, attr, default)
+    )
+    result = {key: get(attr) for key, attr in _METADATA_FIELDS}
+    # Enum members are stored by their string form
+    for key in ('content_type', 'chunk_strategy'):
+        if result[key] is not None:
+            result[key] = str(result[key])
+    result.update(get('additional_metadata') or {})
+    return result
+
+
+def _write_if_changed(path: Path, data: bytes) -> bool:
+    """
+    Atomically replace path with data unless it already holds exactly that.
+
+    The data goes to a temporary file in the same directory that is then
+    renamed over path, so readers never see a half-written file.
+
+    Returns:
+        True if the file was written
+    """
+    try:
+        if path.stat().st_size == len(data) and path.read_bytes() == data:
+            return False
+    except FileNotFoundError:
+        pass
+
+    tmp_path = path.with_name(path.name + '.tmp')
+    tmp_path.write_bytes(data)
+    os.replace(tmp_path, path)
+    return True
 
 
 class StudyGuideFormatter(BaseFormatter):
@@ -72,25 +117,21 @@ class StudyGuideFormatter(BaseFormatter):
 
         # Save summary data as JSON (needed by create_study_guide)
         summary_json_path = output_dir / "summary.json"
-        with open(summary_json_path, 'w') as f:
-            # Convert metadata to dict for JSON serialization
-            summary_copy = summary_data.copy()
-            if 'metadata' in summary_copy:
-                metadata = summary_copy['metadata']
-                summary_copy['metadata'] = {
-                    'content_type': str(metadata.content_type),
-                    'chunk_strategy': str(metadata.chunk_strategy),
-                    'total_chunks': metadata.total_chunks,
-                    'meeting_duration_minutes': metadata.total_duration_minutes,
-                    **metadata.additional_metadata
-                }
-            json.dump(summary_copy, f, indent=2)
+        # Convert metadata to dict for JSON serialization (before opening
+        # the file, so a bad metadata object can't leave it truncated)
+        summary_copy = summary_data.copy()
+        metadata = summary_copy.get('metadata')
+        if metadata is not None:
+            summary_copy['metadata'] = _metadata_to_dict(metadata)
+        # User-facing output, so always indented
+        _write_if_changed(summary_json_path, fast_json.dumps(summary_copy, indent=True))
 
         # Generate markdown study guide (existing function)
         md_path = output_dir / "study_guide.md"
         create_study_guide.create_markdown_study_guide(
             str(summary_json_path),
-            str(md_path)
+            str(md_path),
+            summary_data=summary_copy
         )
         outputs['study_guide_md'] = str(md_path)
 
@@ -2,156 +2,243 @@
 """
 Convert Markdown to PDF with nice formatting using WeasyPrint.
 """
+import hashlib
+import logging
 import os
+import re
 import sys
+import threading
+from typing import Any
 
+logger = logging.getLogger(__name__)
 
-def convert_markdown_to_pdf(md_file, output_pdf=None):
+# Study guide stylesheet, passed to WeasyPrint as a pre-parsed CSS object
+_STUDY_GUIDE_CSS = """
+    @page {
+        size: letter;
+        margin: 1in;
+    }
+    body {
+        font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Helvetica, Arial, sans-serif;
+        line-height: 1.6;
+        color: #333;
+        font-size: 11pt;
+    }
+    h1 {
+        color: #2c3e50;
+        border-bottom: 3px solid #3498db;
+        padding-bottom: 10px;
+        font-size: 24pt;
+        margin-top: 0;
+    }
+    h2 {
+        color: #34495e;
+        margin-top: 30px;
+        border-bottom: 2px solid #ecf0f1;
+        padding-bottom: 5px;
+        font-size: 18pt;
+        page-break-after: avoid;
+    }
+    h3 {
+        color: #7f8c8d;
+        margin-top: 20px;
+        font-size: 14pt;
+        page-break-after: avoid;
+    }
+    ul, ol {
+        margin-left: 20px;
+    }
+    li {
+        margin-bottom: 5px;
+    }
+    table {
+        border-collapse: collapse;
+        width: 100%;
+        margin: 20px 0;
+        page-break-inside: avoid;
+    }
+    table, th, td {
+        border: 1px solid #ddd;
+    }
+    th, td {
+        padding: 8px 12px;
+        text-align: left;
+    }
+    th {
+        background-color: #3498db;
+        color: white;
+        font-weight: bold;
+    }
+    code {
+        background-color: #f4f4f4;
+        padding: 2px 6px;
+        border-radius: 3px;
+        font-family: 'Courier New', monospace;
+        font-size: 10pt;
+    }
+    pre {
+        background-color: #f4f4f4;
+        padding: 15px;
+        border-radius: 5px;
+        overflow-x: auto;
+        page-break-inside: avoid;
+    }
+    pre code {
+        background-color: transparent;
+        padding: 0;
+    }
+    blockquote {
+        border-left: 4px solid #3498db;
+        margin: 20px 0;
+        padding-left: 20px;
+        color: #555;
+        font-style: italic;
+    }
+    hr {
+        border: none;
+        border-top: 2px solid #ecf0f1;
+        margin: 30px 0;
+    }
+    p {
+        margin-bottom: 10px;
+        orphans: 3;
+        widows: 3;
+    }
+"""
+
+# Document shell; the converted markdown replaces {BODY}
+_HTML_TEMPLATE = """<!DOCTYPE html>
+<html>
+<head>
+    <meta charset="UTF-8">
+    <title>Study Guide</title>
+</head>
+<body>
+{BODY}
+</body>
+</html>"""
+
+# Stands in for the stylesheet and template in each PDF's sidecar digest,
+# so changing either invalidates every cached PDF
+_RENDER_VERSION = hashlib.blake2b(
+    (_STUDY_GUIDE_CSS + _HTML_TEMPLATE).encode(), digest_size=16
+).digest()
+
+# Nodes that render nothing but still cost WeasyPrint style matching
+_NOOP_HTML_RE = re.compile(r'<!--.*?-->|<pre><code>\s*</code></pre>', re.S)
+
+# Per-thread (markdown, HTML, stylesheet, font_config), built on first use
+# and reused: parsing the stylesheet and setting up fontconfig dominate the
+# cost of a small document. A font configuration can't be shared by renders
+# running at once, so each thread gets its own. False once the libraries
+# have been found missing.
+_pdf_renderer = threading.local()
+_pdf_renderer_lock = threading.Lock()
+
+
+def _get_pdf_renderer() -> Any:
+    """Get this thread's WeasyPrint objects, or False if the libraries are missing."""
+    renderer = getattr(_pdf_renderer, 'value', None)
+    if renderer is None:
+        with _pdf_renderer_lock:
+            try:
+                import markdown
+                from weasyprint import CSS, HTML
+                from weasyprint.text.fonts import FontConfiguration
+            except ImportError as e:
+                logger.warning(
+                    "Missing required library: %s (install with: pip install markdown weasyprint)", e
+                )
+                renderer = False
+            else:
+                font_config = FontConfiguration()
+                stylesheet = CSS(string=_STUDY_GUIDE_CSS, font_config=font_config)
+                renderer = (markdown, HTML, stylesheet, font_config)
+        _pdf_renderer.value = renderer
+    return renderer
+
+
+def _markdown_extensions(md_content: str) -> list[str]:
+    """Only enable the extensions whose syntax appears in the document."""
+    extensions = []
+    if '|' in md_content:
+        extensions.append('tables')
+    if '```' in md_content or '~~~' in md_content:
+        extensions.append('fenced_code')
+    return extensions
+
+
+def _read_digest(digest_file):
+    """Return the digest recorded next to a PDF, or None if there isn't one."""
+    try:
+        with open(digest_file) as f:
+            return f.read()
+    except OSError:
+        return None
+
+
+def convert_markdown_to_pdf(md_file, output_pdf=None, force=False):
     """Convert markdown file to PDF.
 
+    A digest of the markdown is stored next to the PDF (<pdf>.digest); when
+    it still matches, the existing PDF is returned without re-rendering.
+
     Args:
         md_file: Path to markdown file
         output_pdf: Optional output PDF path (defaults to same name as md_file)
+        force: Render even if an up-to-date PDF already exists
 
     Returns:
         str: Path to generated PDF file, or None if failed
     """
-    try:
-        import markdown
-        from weasyprint import HTML
-        from weasyprint.text.fonts import FontConfiguration
-    except ImportError as e:
-        print(f"✗ Missing required library: {e}")
-        print("Install with: pip install markdown weasyprint")
-        return None
-
     # Read markdown content
     with open(md_file) as f:
         md_content = f.read()
 
+    pdf_file = output_pdf or md_file.replace('.md', '.pdf')
+    digest_file = pdf_file + '.digest'
+    digest = hashlib.blake2b(
+        md_content.encode(), digest_size=16, key=_RENDER_VERSION
+    ).hexdigest()
+    if not force and os.path.exists(pdf_file) and _read_digest(digest_file) == digest:
+        logger.info("PDF up to date: %s", pdf_file)
+        return pdf_file
+
+    renderer = _get_pdf_renderer()
+    if not renderer:
+        return None
+    markdown, html_cls, stylesheet, font_config = renderer
+
     # Convert markdown to HTML
-    html_content = markdown.markdown(md_content, extensions=['tables', 'fenced_code'])
+    html_content = markdown.markdown(md_content, extensions=_markdown_extensions(md_content))
+    html_content = _NOOP_HTML_RE.sub('', html_content)
 
     # Create styled HTML document
-    styled_html = f"""<!DOCTYPE html>
-<html>
-<head>
-    <meta charset="UTF-8">
-    <title>Study Guide</title>
-    <style>
-        @page {{
-            size: letter;
-            margin: 1in;
-        }}
-        body {{
-            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Helvetica, Arial, sans-serif;
-            line-height: 1.6;
-            color: #333;
-            font-size: 11pt;
-        }}
-        h1 {{
-            color: #2c3e50;
-            border-bottom: 3px solid #3498db;
-            padding-bottom: 10px;
-            font-size: 24pt;
-            margin-top: 0;
-        }}
-        h2 {{
-            color: #34495e;
-            margin-top: 30px;
-            border-bottom: 2px solid #ecf0f1;
-            padding-bottom: 5px;
-            font-size: 18pt;
-            page-break-after: avoid;
-        }}
-        h3 {{
-            color: #7f8c8d;
-            margin-top: 20px;
-            font-size: 14pt;
-            page-break-after: avoid;
-        }}
-        ul, ol {{
-            margin-left: 20px;
-        }}
-        li {{
-            margin-bottom: 5px;
-        }}
-        table {{
-            border-collapse: collapse;
-            width: 100%;
-            margin: 20px 0;
-            page-break-inside: avoid;
-        }}
-        table, th, td {{
-            border: 1px solid #ddd;
-        }}
-        th, td {{
-            padding: 8px 12px;
-            text-align: left;
-        }}
-        th {{
-            background-color: #3498db;
-            color: white;
-            font-weight: bold;
-        }}
-        code {{
-            background-color: #f4f4f4;
-            padding: 2px 6px;
-            border-radius: 3px;
-            font-family: 'Courier New', monospace;
-            font-size: 10pt;
-        }}
-        pre {{
-            background-color: #f4f4f4;
-            padding: 15px;
-            border-radius: 5px;
-            overflow-x: auto;
-            page-break-inside: avoid;
-        }}
-        pre code {{
-            background-color: transparent;
-            padding: 0;
-        }}
-        blockquote {{
-            border-left: 4px solid #3498db;
-            margin: 20px 0;
-            padding-left: 20px;
-            color: #555;
-            font-style: italic;
-        }}
-        hr {{
-            border: none;
-            border-top: 2px solid #ecf0f1;
-            margin: 30px 0;
-        }}
-        p {{
-            margin-bottom: 10px;
-            orphans: 3;
-            widows: 3;
-        }}
-    </style>
-</head>
-<body>
-{html_content}
-</body>
-</html>"""
+    styled_html = _HTML_TEMPLATE.replace('{BODY}', html_content)
 
     # Generate PDF
-    pdf_file = output_pdf or md_file.replace('.md', '.pdf')
-
     try:
-        font_config = FontConfiguration()
-        HTML(string=styled_html).write_pdf(
+        html_cls(string=styled_html).write_pdf(
             pdf_file,
+            stylesheets=[stylesheet],
             font_config=font_config
         )
-        print(f"✓ Created PDF: {pdf_file}")
-        return pdf_file
     except Exception as e:
-        print(f"✗ Failed to create PDF: {e}")
+        logger.error("Failed to create PDF: %s", e)
         return None
 
+    try:
+        with open(digest_file, 'w') as f:
+            f.write(digest)
+    except OSError:
+        pass  # Next run just renders again
+    logger.info("Created PDF: %s", pdf_file)
+    return pdf_file
+
+
 if __name__ == '__main__':
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
     if len(sys.argv) != 2:
         print("Usage: python markdown_to_pdf.py <input.md>")
         print("\nExample:")
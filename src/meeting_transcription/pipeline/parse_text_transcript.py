@@ -12,8 +12,30 @@ Supports formats:
    [00:00:08]
    Attorney Sarah Chen: Please state your name for the record.
 """
+import io
+import logging
 import re
-from typing import Any
+from typing import IO, Any
+
+logger = logging.getLogger(__name__)
+
+# Format detection (searched anywhere in the text)
+_VTT_HEADER_RE = re.compile(r'\s*WEBVTT')
+_VTT_TIMESTAMP_RE = re.compile(r'\d{2}:\d{2}:\d{2}\.\d{3}\s+-->\s+\d{2}:\d{2}:\d{2}\.\d{3}')
+_BRACKETED_TIMESTAMP_RE = re.compile(r'\[\d{2}:\d{2}:\d{2}\]|\[\d{2}:\d{2}\]')
+_SPEAKER_LINE_RE = re.compile(r'^[A-Z][^:\n]+:\s+.+$', re.MULTILINE)
+_ZOOM_RE = re.compile(r'zoom', re.IGNORECASE)
+
+# Line parsing (matched against one stripped line)
+# VTT cue timing: 00:00:05.000 --> 00:00:08.000
+_VTT_CUE_RE = re.compile(r'^(\d{2}:\d{2}:\d{2}\.\d{3})\s+-->\s+(\d{2}:\d{2}:\d{2}\.\d{3})$')
+# Bracketed timestamp line: [00:00:08] or [00:08]
+_BRACKETED_TIMESTAMP_LINE_RE = re.compile(r'^\[(\d{2}:\d{2}:\d{2}|\d{2}:\d{2})\]$')
+# Speaker line: "Speaker Name: text"
+_SPEAKER_RE = re.compile(r'^([^:\n]+):\s+(.+)$')
+
+# Any single timestamp: [HH:MM:SS], [MM:SS], HH:MM:SS.mmm
+_TIMESTAMP_RE = re.compile(r'\[?(?:(\d+):)?(\d+):(\d+)(?:\.(\d+))?\]?')
 
 
 def parse_timestamp(timestamp_str: str) -> float:
@@ -24,26 +46,26 @@ def parse_timestamp(timestamp_str: str) -> float:
     - [00:00:08] -> 8.0
     - [00:01:23] -> 83.0
     - [01:23:45] -> 5025.0
+    - 00:01:23.500 -> 83.5 (VTT, brackets optional)
 
     Args:
-        timestamp_str: Timestamp in [HH:MM:SS] or [MM:SS] format
+        timestamp_str: Timestamp in [HH:MM:SS], [MM:SS] or HH:MM:SS.mmm format
 
     Returns:
         Total seconds as float
     """
-    # Remove brackets and split
-    time_str = timestamp_str.strip('[]')
-    parts = time_str.split(':')
-
-    if len(parts) == 2:  # MM:SS
-        minutes, seconds = parts
-        return int(minutes) * 60 + int(seconds)
-    elif len(parts) == 3:  # HH:MM:SS
-        hours, minutes, seconds = parts
-        return int(hours) * 3600 + int(minutes) * 60 + int(seconds)
-    else:
+    match = _TIMESTAMP_RE.fullmatch(timestamp_str)
+    if match is None:
         raise ValueError(f"Invalid timestamp format: {timestamp_str}")
 
+    hours, minutes, seconds, fraction = match.groups()
+    total_seconds = int(minutes) * 60 + int(seconds)
+    if hours:
+        total_seconds += int(hours) * 3600
+    if fraction:
+        total_seconds += int(fraction) / 10 ** len(fraction)
+    return total_seconds
+
 
 def parse_vtt_timestamp(timestamp_str: str) -> float:
     """
@@ -54,20 +76,36 @@ def parse_vtt_timestamp(timestamp_str: str) -> float:
     - 00:01:23.500 -> 83.5
     - 01:23:45.123 -> 5025.123
 
+    Same parser as parse_timestamp(); kept for existing callers.
+
     Args:
         timestamp_str: Timestamp in HH:MM:SS.mmm format
 
     Returns:
         Total seconds as float
     """
-    # Format: HH:MM:SS.mmm
-    time_part, ms_part = timestamp_str.split('.')
-    hours, minutes, seconds = time_part.split(':')
+    return parse_timestamp(timestamp_str)
 
-    total_seconds = int(hours) * 3600 + int(minutes) * 60 + int(seconds)
-    total_seconds += float(f"0.{ms_part}")
 
-    return total_seconds
+def _iter_lines(text: str | IO[str]) -> IO[str]:
+    """
+    Iterate over the lines of a transcript without splitting it into a list.
+
+    Lines keep their newline; the parsers strip() every line anyway.
+    """
+    return io.StringIO(text) if isinstance(text, str) else text
+
+
+def _participant_record(participant_id: int, name: str, platform: str | None) -> dict[str, Any]:
+    """Combined-format participant dict for a speaker."""
+    return {
+        'id': participant_id,
+        'name': name,
+        'is_host': None,
+        'platform': platform,
+        'email': None,
+        'extra_data': None
+    }
 
 
 def detect_text_transcript_format(text: str) -> dict[str, Any]:
@@ -81,9 +119,10 @@ def detect_text_transcript_format(text: str) -> dict[str, Any]:
         Dict with 'is_transcript' bool and 'format' string
     """
     # VTT format detection
-    vtt_header = text.strip().startswith('WEBVTT')
-    vtt_timestamp_pattern = r'\d{2}:\d{2}:\d{2}\.\d{3}\s+-->\s+\d{2}:\d{2}:\d{2}\.\d{3}'
-    has_vtt_timestamps = bool(re.search(vtt_timestamp_pattern, text))
+    vtt_header = _VTT_HEADER_RE.match(text) is not None
+    # Substring checks first: a plain `in` scan is far cheaper than the
+    # regex on text that has no arrows/brackets at all.
+    has_vtt_timestamps = '-->' in text and bool(_VTT_TIMESTAMP_RE.search(text))
 
     if vtt_header and has_vtt_timestamps:
         return {
@@ -94,12 +133,10 @@ def detect_text_transcript_format(text: str) -> dict[str, Any]:
         }
 
     # Bracketed timestamp format like [00:00:08]
-    bracketed_timestamp_pattern = r'\[\d{2}:\d{2}:\d{2}\]|\[\d{2}:\d{2}\]'
-    has_bracketed_timestamps = bool(re.search(bracketed_timestamp_pattern, text))
+    has_bracketed_timestamps = '[' in text and bool(_BRACKETED_TIMESTAMP_RE.search(text))
 
     # Look for speaker patterns like "Name: text"
-    speaker_pattern = r'^[A-Z][^:\n]+:\s+.+$'
-    has_speakers = bool(re.search(speaker_pattern, text, re.MULTILINE))
+    has_speakers = bool(_SPEAKER_LINE_RE.search(text))
 
     is_transcript = has_bracketed_timestamps and has_speakers
 
@@ -108,7 +145,7 @@ def detect_text_transcript_format(text: str) -> dict[str, Any]:
     if is_transcript:
         if 'Google Meet Transcript' in text:
             format_type = 'google_meet'
-        elif 'Zoom' in text or 'zoom' in text.lower():
+        elif _ZOOM_RE.search(text):
             format_type = 'zoom_text'
         else:
             format_type = 'generic_text'
@@ -121,7 +158,7 @@ def detect_text_transcript_format(text: str) -> dict[str, Any]:
     }
 
 
-def parse_vtt_to_combined_format(text: str) -> list[dict[str, Any]]:
+def parse_vtt_to_combined_format(text: str | IO[str]) -> list[dict[str, Any]]:
     """
     Parse VTT (WebVTT) transcript into combined JSON format.
 
@@ -132,28 +169,24 @@ def parse_vtt_to_combined_format(text: str) -> list[dict[str, Any]]:
     Sarah Chen: Good morning everyone
 
     Args:
-        text: Raw VTT transcript
+        text: Raw VTT transcript, or a text stream to read it from
 
     Returns:
         List of segments in combined format
     """
-    lines = text.split('\n')
-
-    # Pattern to match VTT timestamps: 00:00:05.000 --> 00:00:08.000
-    vtt_timestamp_pattern = re.compile(
-        r'^(\d{2}:\d{2}:\d{2}\.\d{3})\s+-->\s+(\d{2}:\d{2}:\d{2}\.\d{3})$'
-    )
-
-    # Pattern to match speaker lines: "Speaker Name: text"
-    speaker_pattern = re.compile(r'^([^:\n]+):\s+(.+)$')
+    lines = _iter_lines(text)
+    vtt_timestamp_pattern = _VTT_CUE_RE
+    speaker_pattern = _SPEAKER_RE
 
     segments = []
     current_start = None
     current_end = None
     current_speaker = None
+    # Lines of the current segment; appends are amortized O(1) and the
+    # ' '.join() at flush copies each line once
     current_text = []
 
-    participants = {}
+    participants = {}  # speaker -> participant dict, shared by their segments
     participant_id = 100
 
     for line in lines:
@@ -188,7 +221,9 @@ def parse_vtt_to_combined_format(text: str) -> list[dict[str, Any]]:
 
             # Track participant
             if current_speaker not in participants:
-                participants[current_speaker] = participant_id
+                participants[current_speaker] = _participant_record(
+                    participant_id, current_speaker, 'zoom'
+                )
                 participant_id += 1
 
             continue
@@ -205,14 +240,18 @@ def parse_vtt_to_combined_format(text: str) -> list[dict[str, Any]]:
                     current_text = [text_part]
 
                     if current_speaker not in participants:
-                        participants[current_speaker] = participant_id
+                        participants[current_speaker] = _participant_record(
+                            participant_id, current_speaker, 'zoom'
+                        )
                         participant_id += 1
                 else:
                     # Plain text line without speaker - use "Unknown Speaker"
                     if not current_speaker:
                         current_speaker = "Unknown Speaker"
                         if current_speaker not in participants:
-                            participants[current_speaker] = participant_id
+                            participants[current_speaker] = _participant_record(
+                                participant_id, current_speaker, 'zoom'
+                            )
                             participant_id += 1
                     current_text.append(line)
             else:
@@ -233,14 +272,7 @@ def parse_vtt_to_combined_format(text: str) -> list[dict[str, Any]]:
         word_count = len(segment['text'].split())
 
         combined_segment = {
-            'participant': {
-                'id': participants[segment['speaker']],
-                'name': segment['speaker'],
-                'is_host': None,
-                'platform': 'zoom',
-                'email': None,
-                'extra_data': None
-            },
+            'participant': participants[segment['speaker']],
             'text': segment['text'],
             'start_timestamp': {
                 'relative': segment['start'],
@@ -258,7 +290,7 @@ def parse_vtt_to_combined_format(text: str) -> list[dict[str, Any]]:
     return combined_transcript
 
 
-def parse_bracketed_to_combined_format(text: str) -> list[dict[str, Any]]:
+def parse_bracketed_to_combined_format(text: str | IO[str]) -> list[dict[str, Any]]:
     """
     Parse bracketed timestamp transcript into combined JSON format.
 
@@ -267,26 +299,23 @@ def parse_bracketed_to_combined_format(text: str) -> list[dict[str, Any]]:
     Sarah Chen: Good morning everyone
 
     Args:
-        text: Raw text transcript
+        text: Raw text transcript, or a text stream to read it from
 
     Returns:
         List of segments in combined format
     """
-    # Split into lines
-    lines = text.split('\n')
-
-    # Pattern to match timestamps
-    timestamp_pattern = re.compile(r'^\[(\d{2}:\d{2}:\d{2}|\d{2}:\d{2})\]$')
-
-    # Pattern to match speaker lines: "Speaker Name: text"
-    speaker_pattern = re.compile(r'^([^:\n]+):\s+(.+)$')
+    lines = _iter_lines(text)
+    timestamp_pattern = _BRACKETED_TIMESTAMP_LINE_RE
+    speaker_pattern = _SPEAKER_RE
 
     segments = []
-    current_timestamp = None
+    current_start = None  # seconds, parsed once per timestamp line
     current_speaker = None
+    # Lines of the current segment; appends are amortized O(1) and the
+    # ' '.join() at flush copies each line once
     current_text = []
 
-    participants = {}  # Track unique speakers
+    participants = {}  # speaker -> participant dict, shared by their segments
     participant_id = 100
 
     for line in lines:
@@ -302,12 +331,12 @@ def parse_bracketed_to_combined_format(text: str) -> list[dict[str, Any]]:
             if current_speaker and current_text:
                 segments.append({
                     'speaker': current_speaker,
-                    'timestamp': current_timestamp,
+                    'start': current_start,
                     'text': ' '.join(current_text)
                 })
                 current_text = []
 
-            current_timestamp = timestamp_match.group(1)
+            current_start = parse_timestamp(timestamp_match.group(1))
             continue
 
         # Check if it's a speaker line
@@ -317,7 +346,7 @@ def parse_bracketed_to_combined_format(text: str) -> list[dict[str, Any]]:
             if current_speaker and current_text:
                 segments.append({
                     'speaker': current_speaker,
-                    'timestamp': current_timestamp,
+                    'start': current_start,
                     'text': ' '.join(current_text)
                 })
                 current_text = []
@@ -328,7 +357,9 @@ def parse_bracketed_to_combined_format(text: str) -> list[dict[str, Any]]:
 
             # Track participant
             if current_speaker not in participants:
-                participants[current_speaker] = participant_id
+                participants[current_speaker] = _participant_record(
+                    participant_id, current_speaker, None
+                )
                 participant_id += 1
 
             continue
@@ -341,7 +372,7 @@ def parse_bracketed_to_combined_format(text: str) -> list[dict[str, Any]]:
     if current_speaker and current_text:
         segments.append({
             'speaker': current_speaker,
-            'timestamp': current_timestamp,
+            'start': current_start,
             'text': ' '.join(current_text)
         })
 
@@ -350,31 +381,24 @@ def parse_bracketed_to_combined_format(text: str) -> list[dict[str, Any]]:
 
     for i, segment in enumerate(segments):
         # Calculate timestamps
-        if segment['timestamp']:
-            start_seconds = parse_timestamp(f"[{segment['timestamp']}]")
-        else:
+        start_seconds = segment['start']
+        if start_seconds is None:
             # If no timestamp, estimate based on previous segment
             start_seconds = combined_transcript[-1]['end_timestamp']['relative'] if combined_transcript else 0
 
         # End timestamp is either the next segment's start or estimated from text length
-        if i + 1 < len(segments) and segments[i + 1]['timestamp']:
-            end_seconds = parse_timestamp(f"[{segments[i + 1]['timestamp']}]")
+        next_start = segments[i + 1]['start'] if i + 1 < len(segments) else None
+        if next_start is not None:
+            end_seconds = next_start
         else:
-            # Estimate 2 seconds per sentence
-            estimated_duration = max(len(segment['text'].split('.')), 1) * 2
+            # Estimate 2 seconds per sentence (pieces between periods)
+            estimated_duration = (segment['text'].count('.') + 1) * 2
             end_seconds = start_seconds + estimated_duration
 
         word_count = len(segment['text'].split())
 
         combined_segment = {
-            'participant': {
-                'id': participants[segment['speaker']],
-                'name': segment['speaker'],
-                'is_host': None,
-                'platform': None,
-                'email': None,
-                'extra_data': None
-            },
+            'participant': participants[segment['speaker']],
             'text': segment['text'],
             'start_timestamp': {
                 'relative': start_seconds,
@@ -392,7 +416,9 @@ def parse_bracketed_to_combined_format(text: str) -> list[dict[str, Any]]:
     return combined_transcript
 
 
-def parse_text_to_combined_format(text: str) -> list[dict[str, Any]]:
+def parse_text_to_combined_format(
+    text: str, detection: dict[str, Any] | None = None
+) -> list[dict[str, Any]]:
     """
     Auto-detect format and parse text transcript into combined JSON format.
 
@@ -402,6 +428,8 @@ def parse_text_to_combined_format(text: str) -> list[dict[str, Any]]:
 
     Args:
         text: Raw text transcript
+        detection: Result of detect_text_transcript_format(text) if the
+            caller already ran it; detected here otherwise
 
     Returns:
         List of segments in combined format
@@ -409,16 +437,17 @@ def parse_text_to_combined_format(text: str) -> list[dict[str, Any]]:
     Raises:
         ValueError: If format is not recognized
     """
-    detection = detect_text_transcript_format(text)
+    if detection is None:
+        detection = detect_text_transcript_format(text)
 
     if not detection['is_transcript']:
         raise ValueError("Text does not appear to be a valid transcript format")
 
     if detection['format'] == 'vtt':
-        print("📄 Parsing VTT (Zoom) format...")
+        logger.info("Parsing VTT (Zoom) format")
         return parse_vtt_to_combined_format(text)
     elif detection['format'] in ['google_meet', 'generic_text', 'zoom_text']:
-        print(f"📄 Parsing bracketed timestamp format ({detection['format']})...")
+        logger.info("Parsing bracketed timestamp format (%s)", detection['format'])
         return parse_bracketed_to_combined_format(text)
     else:
         raise ValueError(f"Unsupported transcript format: {detection['format']}")
@@ -6,16 +6,12 @@ maintaining 100% backward compatibility while conforming to the
 BasePromptEngine interface.
 """
 
-import json
-import os
-import sys
 from typing import Any
 
-# Add parent directory to path for imports
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../..'))
+from meeting_transcription.utils import fast_json
 
-from pipeline import educational_prompts
-from pipeline.core import BasePromptEngine, PromptContext
+from .. import educational_prompts
+from ..core import BasePromptEngine, PromptContext
 
 
 class EducationalPromptEngine(BasePromptEngine):
@@ -76,10 +72,9 @@ class EducationalPromptEngine(BasePromptEngine):
         Returns:
             str: Formatted prompt for LLM
         """
-        # Convert chunk analyses to JSON strings for the prompt
-        chunk_summaries = []
-        for analysis in chunk_analyses:
-            chunk_summaries.append(json.dumps(analysis, indent=2))
+        # Convert chunk analyses to JSON strings for the prompt (each is
+        # serialized once; the prompt joins them without re-encoding)
+        chunk_summaries = [fast_json.dumps(analysis, indent=True).decode() for analysis in chunk_analyses]
 
         # Build metadata dict for the existing function
         metadata = {
@@ -116,7 +111,7 @@ class EducationalPromptEngine(BasePromptEngine):
             str: Formatted prompt for LLM
         """
         # Convert summary to JSON string for the prompt
-        summary_json = json.dumps(overall_summary, indent=2)
+        summary_json = fast_json.dumps(overall_summary, indent=True).decode()
 
         # Delegate to existing function
         return educational_prompts.create_action_items_prompt(summary_json)
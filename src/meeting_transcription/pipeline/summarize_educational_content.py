@@ -12,6 +12,9 @@ Supports multiple LLM providers:
 import json
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
+
+from meeting_transcription.utils import fast_json, llm_cache
 
 # Import prompts - handle both direct run and module import
 try:
@@ -54,6 +57,68 @@ try:
 except ImportError:
     pass
 
+# Per-chunk lists whose entries are keyed by 'name' and commonly repeat
+# across chunks (the same concept or tool comes up again later)
+_MERGEABLE_LISTS = ('key_concepts', 'tools_frameworks')
+
+
+def _entry_key(name: str) -> str:
+    """Normalize an entry name so case/whitespace variants compare equal.
+
+    Punctuation is kept: it is meaningful in tool names (C, C++, C#, .NET).
+    """
+    return ' '.join(name.casefold().split())
+
+
+def merge_repeated_entries(chunk_analyses: list[dict]) -> list[dict]:
+    """
+    Fold concepts/tools repeated in later chunks into their first mention.
+
+    The overall summary prompt carries every chunk analysis, so an entry
+    repeated in several chunks is sent (and deduplicated by the LLM) once
+    per chunk. Later entries with the same normalized name are dropped;
+    the first one records the other chunks in 'also_in_chunks' and gains
+    their examples_mentioned, so the repetition signal is kept.
+
+    The analyses passed in are not modified.
+
+    Args:
+        chunk_analyses: Per-chunk analyses in chunk order
+
+    Returns:
+        Analyses with repeated entries removed (shallow copies)
+    """
+    merged = []
+    first_seen: dict[tuple[str, str], dict] = {}
+    for analysis in chunk_analyses:
+        analysis = dict(analysis)
+        chunk_number = analysis.get('chunk_number')
+        for field in _MERGEABLE_LISTS:
+            entries = analysis.get(field)
+            if not isinstance(entries, list):
+                continue
+            kept = []
+            for entry in entries:
+                name = entry.get('name') if isinstance(entry, dict) else None
+                if not isinstance(name, str) or not name.strip():
+                    kept.append(entry)
+                    continue
+                key = (field, _entry_key(name))
+                first = first_seen.get(key)
+                if first is None:
+                    first_seen[key] = entry = dict(entry)
+                    kept.append(entry)
+                    continue
+                first.setdefault('also_in_chunks', []).append(chunk_number)
+                examples = entry.get('examples_mentioned')
+                if isinstance(examples, list) and isinstance(first.get('examples_mentioned'), list):
+                    first['examples_mentioned'] = first['examples_mentioned'] + [
+                        e for e in examples if e not in first['examples_mentioned']
+                    ]
+            analysis[field] = kept
+        merged.append(analysis)
+    return merged
+
 
 class EducationalSummarizer:
     """Summarize educational content using LLM."""
@@ -153,19 +218,23 @@ class EducationalSummarizer:
 
         print(f"✅ Using Anthropic: {self.model}")
 
-    def call_llm(self, prompt: str, max_tokens: int = 4096) -> str:
+    def call_llm(self, prompt: str, max_tokens: int = 4096, cache_prefix: str = "") -> str:
         """
         Call LLM with prompt using unified LLMClient.
 
         Args:
             prompt: The prompt to send
             max_tokens: Maximum tokens in response
+            cache_prefix: Static text sent ahead of prompt, shared with
+                other calls and cached by the provider (see LLMClient.call)
 
         Returns:
             LLM response text
         """
         try:
-            return self.client.call(prompt=prompt, max_tokens=max_tokens, temperature=0.7)
+            return self.client.call(
+                prompt=prompt, max_tokens=max_tokens, temperature=0.7, cache_prefix=cache_prefix
+            )
         except Exception as e:
             print(f"❌ LLM API error: {e}")
             return None
@@ -246,9 +315,9 @@ class EducationalSummarizer:
             else:
                 json_str = response.strip()
 
-            return json.loads(json_str)
+            return fast_json.loads(json_str)
 
-        except json.JSONDecodeError as e:
+        except fast_json.JSONDecodeError as e:
             print(f"⚠️ JSON parse error: {e}")
             return None
 
@@ -267,14 +336,24 @@ class EducationalSummarizer:
         time_range = chunk_data['time_range']
         print(f"   Analyzing chunk {chunk_num} ({time_range})...")
 
-        # Format prompt
-        prompt = prompts.format_chunk_for_llm_analysis(chunk_data, instructor)
+        # Format prompt: the instructions are identical for every chunk, so
+        # they go out as a cached prefix ahead of the chunk's transcript
+        instructions, transcript = prompts.chunk_analysis_prompt_parts(chunk_data, instructor)
 
-        # Call LLM
-        response = self.call_llm(prompt, max_tokens=4096)
+        # Reuse the analysis from an earlier run of the same prompt
+        # (see LLM_CACHE_DIR); only successfully parsed responses are cached
+        cache_key = llm_cache.cache_key(self.client.model, instructions + transcript)
+        analysis = llm_cache.get(cache_key)
+        if analysis is not None:
+            print(f"   Chunk {chunk_num}: cached analysis")
+        else:
+            # Call LLM
+            response = self.call_llm(transcript, max_tokens=4096, cache_prefix=instructions)
 
-        # Parse response
-        analysis = self._parse_json_response(response)
+            # Parse response
+            analysis = self._parse_json_response(response)
+            if analysis:
+                llm_cache.put(cache_key, analysis)
 
         if analysis:
             analysis['chunk_number'] = chunk_num
@@ -292,7 +371,8 @@ class EducationalSummarizer:
     def create_overall_summary(
         self,
         chunk_analyses: list[dict],
-        metadata: dict
+        metadata: dict,
+        include_action_items: bool = False
     ) -> dict:
         """
         Create overall summary from chunk analyses.
@@ -300,6 +380,8 @@ class EducationalSummarizer:
         Args:
             chunk_analyses: List of chunk analysis dictionaries
             metadata: Meeting metadata
+            include_action_items: Also ask for the action items, returned
+                under 'action_items' in the same response
 
         Returns:
             Overall summary dictionary
@@ -310,10 +392,13 @@ class EducationalSummarizer:
         chunk_summaries = [json.dumps(a, indent=2) for a in chunk_analyses]
 
         # Create prompt
-        prompt = prompts.create_overall_summary_prompt(chunk_summaries, metadata)
+        prompt = prompts.create_overall_summary_prompt(
+            chunk_summaries, metadata, include_action_items=include_action_items
+        )
 
-        # Call LLM with larger context
-        response = self.call_llm(prompt, max_tokens=8192)
+        # Call LLM with larger context (plus the action items' usual budget)
+        max_tokens = 8192 + 2048 if include_action_items else 8192
+        response = self.call_llm(prompt, max_tokens=max_tokens)
 
         # Parse response
         summary = self._parse_json_response(response)
@@ -354,7 +439,11 @@ def summarize_educational_content(
     output_file: str,
     provider: str = 'vertex_ai',
     model: str | None = None,
-    sample_chunks: int | None = None
+    sample_chunks: int | None = None,
+    max_concurrency: int = 4,
+    combine_action_items: bool = True,
+    merge_repeats: bool = True,
+    chunks_data: dict | None = None
 ):
     """
     Main function to summarize educational content.
@@ -365,11 +454,27 @@ def summarize_educational_content(
         provider: LLM provider ('vertex_ai', 'azure_openai', 'anthropic', 'openai')
         model: Model name (optional, uses defaults)
         sample_chunks: If set, only process first N chunks (for testing)
+        max_concurrency: Maximum chunk analyses in flight at once (1 = sequential)
+        combine_action_items: Extract action items in the overall summary
+            call instead of a separate one (falls back to the separate call
+            if the response doesn't include them)
+        merge_repeats: Fold concepts/tools repeated across chunks into
+            their first mention before the overall summary call (see
+            merge_repeated_entries); the saved chunk_analyses are unchanged
+        chunks_data: The chunks document, if the caller already has it in
+            memory (e.g. as returned by create_educational_content_chunks);
+            chunks_file is then not read
+
+    Returns:
+        The summary document written to output_file
     """
     # Load chunks
-    print(f"📂 Loading chunks from {chunks_file}...")
-    with open(chunks_file) as f:
-        data = json.load(f)
+    if chunks_data is not None:
+        data = chunks_data
+    else:
+        print(f"📂 Loading chunks from {chunks_file}...")
+        with open(chunks_file, 'rb') as f:
+            data = fast_json.loads(f.read())
 
     metadata = data['metadata']
     chunks = data['chunks']
@@ -382,20 +487,29 @@ def summarize_educational_content(
     print(f"\n🤖 Initializing {provider} LLM...")
     summarizer = EducationalSummarizer(provider=provider, model=model)
 
-    # Analyze each chunk
+    # Analyze each chunk. The calls are independent and network-bound, so
+    # they run concurrently; results come back in chunk order.
     print(f"\n📊 Analyzing {len(chunks)} chunks...")
+    instructor = metadata.get('instructor', 'Unknown')
+    max_workers = max(1, min(len(chunks), max_concurrency))
     chunk_analyses = []
-    for i, chunk in enumerate(chunks, 1):
-        analysis = summarizer.analyze_chunk(chunk, metadata.get('instructor', 'Unknown'))
-        chunk_analyses.append(analysis)
-        print(f"   ✓ Chunk {i}/{len(chunks)} complete")
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        analyses = executor.map(lambda chunk: summarizer.analyze_chunk(chunk, instructor), chunks)
+        for i, analysis in enumerate(analyses, 1):
+            chunk_analyses.append(analysis)
+            print(f"   ✓ Chunk {i}/{len(chunks)} complete")
 
     # Create overall summary
     print("\n📝 Generating summary...")
-    overall_summary = summarizer.create_overall_summary(chunk_analyses, metadata)
+    summary_input = merge_repeated_entries(chunk_analyses) if merge_repeats else chunk_analyses
+    overall_summary = summarizer.create_overall_summary(
+        summary_input, metadata, include_action_items=combine_action_items
+    )
 
     # Extract action items
-    action_items = summarizer.extract_action_items(overall_summary)
+    action_items = overall_summary.pop('action_items', None) if combine_action_items else None
+    if not isinstance(action_items, dict):
+        action_items = summarizer.extract_action_items(overall_summary)
 
     # Combine everything
     final_output = {
@@ -411,9 +525,9 @@ def summarize_educational_content(
         }
     }
 
-    # Save output
-    with open(output_file, 'w') as f:
-        json.dump(final_output, f, indent=2)
+    # Save output (user-facing, so always indented)
+    with open(output_file, 'wb') as f:
+        f.write(fast_json.dumps(final_output, indent=True))
 
     print(f"\n✅ Summary saved to: {output_file}")
     print("\n📋 Summary Stats:")
@@ -13,6 +13,7 @@ from .plugin_registry import (
     has_plugin,
     list_plugins,
     register_plugin,
+    register_plugin_lazy,
 )
 from .transcript_plugin_protocol import TranscriptPlugin
 
@@ -20,6 +21,7 @@ __all__ = [
     'TranscriptPlugin',
     'PluginRegistry',
     'register_plugin',
+    'register_plugin_lazy',
     'get_plugin',
     'list_plugins',
     'has_plugin',
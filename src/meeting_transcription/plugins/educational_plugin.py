@@ -10,8 +10,9 @@ Generates comprehensive study guides with:
 - Assignments
 """
 
+import copy
 import os
-from typing import Any
+from typing import Any, ClassVar
 
 from meeting_transcription.pipeline import (
     create_educational_chunks,
@@ -24,6 +25,91 @@ from meeting_transcription.pipeline import (
 class EducationalPlugin:
     """Plugin for processing educational class/workshop transcripts."""
 
+    # Schemas are built once per class; the properties hand out copies so
+    # callers can't change them for every other instance
+    _METADATA_SCHEMA: ClassVar[dict[str, Any]] = {
+        "instructor_name": {
+            "type": "string",
+            "required": False,
+            "label": "Instructor Name",
+            "description": "Name of the class instructor or workshop leader",
+            "default": "Instructor"
+        },
+        "course_name": {
+            "type": "string",
+            "required": False,
+            "label": "Course/Workshop Name",
+            "description": "e.g., 'AI Solutions Architect Session 3'",
+            "default": ""
+        },
+        "session_number": {
+            "type": "integer",
+            "required": False,
+            "label": "Session Number",
+            "description": "Which session in the course series (if applicable)",
+            "default": None
+        }
+    }
+
+    _SETTINGS_SCHEMA: ClassVar[dict[str, Any]] = {
+        "chunk_duration_minutes": {
+            "type": "integer",
+            "default": 10,
+            "min": 5,
+            "max": 30,
+            "label": "Chunk Duration (minutes)",
+            "description": "How long each segment should be for detailed analysis",
+            "user_configurable": True,
+            "meeting_override": True
+        },
+        "include_code_examples": {
+            "type": "boolean",
+            "default": True,
+            "label": "Extract Code Examples",
+            "description": "Identify and extract code demonstrations from the class",
+            "user_configurable": True,
+            "meeting_override": False
+        },
+        "summarization_depth": {
+            "type": "select",
+            "default": "detailed",
+            "options": ["brief", "standard", "detailed"],
+            "label": "Summarization Depth",
+            "description": (
+                "Brief = key points only, "
+                "Standard = balanced overview, "
+                "Detailed = comprehensive analysis"
+            ),
+            "user_configurable": True,
+            "meeting_override": True
+        },
+        "generate_pdf": {
+            "type": "boolean",
+            "default": True,
+            "label": "Generate PDF",
+            "description": "Create PDF version of study guide (in addition to Markdown)",
+            "user_configurable": True,
+            "meeting_override": True
+        },
+        "max_concurrent_chunks": {
+            "type": "integer",
+            "default": 4,
+            "min": 1,
+            "max": 16,
+            "label": "Concurrent Chunk Analyses",
+            "description": "How many chunks are sent to the LLM at once (bounded by provider rate limits)",
+            "user_configurable": False,
+            "meeting_override": False
+        }
+    }
+
+    # Settings configure() copies onto the instance
+    _SETTINGS_KEYS = tuple(_SETTINGS_SCHEMA)
+
+    # The settings are the only instance state; no per-instance __dict__,
+    # and a misspelt attribute assignment raises instead of passing silently
+    __slots__ = _SETTINGS_KEYS
+
     def __init__(self):
         """Initialize educational plugin with default settings."""
         # Default settings
@@ -31,6 +117,7 @@ class EducationalPlugin:
         self.include_code_examples = True
         self.summarization_depth = "detailed"
         self.generate_pdf = True
+        self.max_concurrent_chunks = 4
 
     @property
     def name(self) -> str:
@@ -54,74 +141,12 @@ class EducationalPlugin:
     @property
     def metadata_schema(self) -> dict[str, Any]:
         """Define metadata fields needed for educational sessions."""
-        return {
-            "instructor_name": {
-                "type": "string",
-                "required": False,
-                "label": "Instructor Name",
-                "description": "Name of the class instructor or workshop leader",
-                "default": "Instructor"
-            },
-            "course_name": {
-                "type": "string",
-                "required": False,
-                "label": "Course/Workshop Name",
-                "description": "e.g., 'AI Solutions Architect Session 3'",
-                "default": ""
-            },
-            "session_number": {
-                "type": "integer",
-                "required": False,
-                "label": "Session Number",
-                "description": "Which session in the course series (if applicable)",
-                "default": None
-            }
-        }
+        return copy.deepcopy(self._METADATA_SCHEMA)
 
     @property
     def settings_schema(self) -> dict[str, Any]:
         """Define user-configurable settings."""
-        return {
-            "chunk_duration_minutes": {
-                "type": "integer",
-                "default": 10,
-                "min": 5,
-                "max": 30,
-                "label": "Chunk Duration (minutes)",
-                "description": "How long each segment should be for detailed analysis",
-                "user_configurable": True,
-                "meeting_override": True
-            },
-            "include_code_examples": {
-                "type": "boolean",
-                "default": True,
-                "label": "Extract Code Examples",
-                "description": "Identify and extract code demonstrations from the class",
-                "user_configurable": True,
-                "meeting_override": False
-            },
-            "summarization_depth": {
-                "type": "select",
-                "default": "detailed",
-                "options": ["brief", "standard", "detailed"],
-                "label": "Summarization Depth",
-                "description": (
-                    "Brief = key points only, "
-                    "Standard = balanced overview, "
-                    "Detailed = comprehensive analysis"
-                ),
-                "user_configurable": True,
-                "meeting_override": True
-            },
-            "generate_pdf": {
-                "type": "boolean",
-                "default": True,
-                "label": "Generate PDF",
-                "description": "Create PDF version of study guide (in addition to Markdown)",
-                "user_configurable": True,
-                "meeting_override": True
-            }
-        }
+        return copy.deepcopy(self._SETTINGS_SCHEMA)
 
     def configure(self, settings: dict[str, Any]) -> None:
         """
@@ -130,22 +155,9 @@ class EducationalPlugin:
         Args:
             settings: Combined user preferences and meeting overrides
         """
-        self.chunk_duration_minutes = settings.get(
-            'chunk_duration_minutes',
-            self.chunk_duration_minutes
-        )
-        self.include_code_examples = settings.get(
-            'include_code_examples',
-            self.include_code_examples
-        )
-        self.summarization_depth = settings.get(
-            'summarization_depth',
-            self.summarization_depth
-        )
-        self.generate_pdf = settings.get(
-            'generate_pdf',
-            self.generate_pdf
-        )
+        for key in self._SETTINGS_KEYS:
+            if key in settings:
+                setattr(self, key, settings[key])
 
         print("📚 Educational plugin configured:")
         print(f"   - Chunk duration: {self.chunk_duration_minutes} minutes")
@@ -184,7 +196,10 @@ class EducationalPlugin:
         # Step 1: Create educational chunks
         print(f"📦 Creating educational chunks ({self.chunk_duration_minutes} min each)...")
         chunks_path = os.path.join(output_dir, "transcript_chunks.json")
-        create_educational_chunks.create_educational_content_chunks(
+        # Each stage still writes its file (they are returned as outputs),
+        # but hands its result to the next stage in memory instead of
+        # having it re-read and re-parse the file
+        chunks_data = create_educational_chunks.create_educational_content_chunks(
             combined_transcript_path,
             chunks_path,
             chunk_minutes=self.chunk_duration_minutes
@@ -194,21 +209,25 @@ class EducationalPlugin:
         # Step 2: Multi-stage LLM summarization with deduplication
         print("🤖 Generating AI summary (multi-stage with deduplication)...")
         summary_path = os.path.join(output_dir, "summary.json")
-        summarize_educational_content.summarize_educational_content(
+        summary_data = summarize_educational_content.summarize_educational_content(
             chunks_path,
             summary_path,
-            provider=llm_provider
+            provider=llm_provider,
+            max_concurrency=self.max_concurrent_chunks,
+            chunks_data=chunks_data
         )
         # Note: This internally does:
-        # - Analyze each chunk (N LLM calls)
-        # - Consolidate + deduplicate (1 LLM call with OVERALL_SUMMARY_PROMPT)
-        # - Extract action items (1 LLM call)
+        # - Analyze each chunk (N LLM calls, up to max_concurrent_chunks at once)
+        # - Consolidate + deduplicate and extract action items (1 LLM call;
+        #   a second one only if the action items are missing)
         outputs["summary"] = summary_path
 
         # Step 3: Create study guide (Markdown)
         print("📚 Creating study guide...")
         study_guide_md = os.path.join(output_dir, "study_guide.md")
-        create_study_guide.create_markdown_study_guide(summary_path, study_guide_md)
+        create_study_guide.create_markdown_study_guide(
+            summary_path, study_guide_md, summary_data=summary_data
+        )
         outputs["study_guide_md"] = study_guide_md
 
         # Step 4: Generate PDF (optional)
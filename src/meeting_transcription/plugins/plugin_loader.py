@@ -5,30 +5,42 @@ Automatically discovers and registers plugins from the plugins/ directory.
 This allows plugins to be installed by simply copying files - no code changes needed.
 """
 
+import importlib.metadata
 import importlib.util
 import os
 import sys
+import traceback
+from functools import lru_cache
 from pathlib import Path
+from typing import Any
 
-from .plugin_registry import register_plugin
+from .plugin_registry import register_plugin, register_plugin_lazy
+
+# Entry point group installed packages use to provide plugins
+ENTRY_POINT_GROUP = "meeting_transcription.plugins"
+
+
+@lru_cache(maxsize=1)
+def _parse_disabled_plugins(env_value: str) -> frozenset[str]:
+    """Parse a DISABLED_PLUGINS value (cached; keyed on the raw string)."""
+    return frozenset(p.strip().lower() for p in env_value.split(',') if p.strip())
 
 
 def _is_plugin_disabled(plugin_name: str) -> bool:
     """
     Check if a plugin is disabled via DISABLED_PLUGINS env var.
 
+    The env var is read on every call, so changes take effect immediately;
+    only the parsing is cached.
+
     Args:
         plugin_name: Name of the plugin to check (uses plugin.name property)
 
     Returns:
         True if plugin is in the disabled list, False otherwise
     """
-    disabled_plugins = os.getenv('DISABLED_PLUGINS', '').strip()
-    if not disabled_plugins:
-        return False
-
-    disabled_list = [p.strip().lower() for p in disabled_plugins.split(',')]
-    return plugin_name.lower() in disabled_list
+    disabled = _parse_disabled_plugins(os.getenv('DISABLED_PLUGINS', ''))
+    return plugin_name.lower() in disabled
 
 
 def discover_and_register_plugins(plugins_base_dir: str | None = None) -> list[str]:
@@ -53,6 +65,10 @@ def discover_and_register_plugins(plugins_base_dir: str | None = None) -> list[s
     Each plugin directory should contain a `plugin.py` file that defines
     a `get_plugin()` function returning a plugin instance.
 
+    Installed packages can provide plugins too, through the
+    "meeting_transcription.plugins" entry point group (see
+    _register_entry_point_plugins); those are registered first.
+
     Args:
         plugins_base_dir: Base directory containing plugins.
                          Defaults to 'plugins/' in project root.
@@ -82,7 +98,7 @@ def discover_and_register_plugins(plugins_base_dir: str | None = None) -> list[s
     else:
         plugins_base_dir = Path(plugins_base_dir)
 
-    registered_plugins = []
+    registered_plugins = _register_entry_point_plugins()
 
     # Check if plugins directory exists
     if not plugins_base_dir.exists():
@@ -96,63 +112,50 @@ def discover_and_register_plugins(plugins_base_dir: str | None = None) -> list[s
     print("   See plugins/README.md for security information.")
     print()
 
-    # Iterate through directories in plugins/
+    # Collect plugin directories (skipping non-directories and hidden ones)
+    plugin_dirs = []
     for plugin_dir in plugins_base_dir.iterdir():
-        # Skip non-directories and hidden directories
         if not plugin_dir.is_dir() or plugin_dir.name.startswith('.'):
             continue
 
-        # Look for plugin.py in this directory
-        plugin_file = plugin_dir / "plugin.py"
-
-        if not plugin_file.exists():
+        if not (plugin_dir / "plugin.py").exists():
             print(f"⚠️  Skipping {plugin_dir.name} - no plugin.py found")
             continue
 
-        # Import the plugin module
-        try:
-            # Add plugin directory to sys.path temporarily
-            plugin_parent = str(plugin_dir.parent)
-            if plugin_parent not in sys.path:
-                sys.path.insert(0, plugin_parent)
-
-            # Import plugin.py module
-            module_name = f"{plugin_dir.name}.plugin"
-            spec = importlib.util.spec_from_file_location(module_name, plugin_file)
-
-            if spec is None or spec.loader is None:
-                print(f"❌ Failed to load {plugin_dir.name} - invalid module spec")
+        plugin_dirs.append(plugin_dir)
+
+    if plugin_dirs:
+        # Plugin packages import relative to the plugins directory
+        plugin_parent = str(plugins_base_dir)
+        if plugin_parent not in sys.path:
+            sys.path.insert(0, plugin_parent)
+
+        # Plugin modules are imported one at a time: exec_module runs
+        # arbitrary plugin code and writes sys.modules, so import order
+        # must stay deterministic
+        for plugin_dir in plugin_dirs:
+            plugin, error = _load_plugin_dir(plugin_dir)
+            if error is not None:
+                print(error)
                 continue
 
-            module = importlib.util.module_from_spec(spec)
-            sys.modules[module_name] = module
-            spec.loader.exec_module(module)
+            try:
+                # Check if plugin is disabled
+                if _is_plugin_disabled(plugin.name):
+                    print(f"⏭️  Skipped {plugin_dir.name}/ - '{plugin.name}' is disabled (DISABLED_PLUGINS)")
+                    continue
 
-            # Look for get_plugin() function
-            if not hasattr(module, 'get_plugin'):
-                print(f"❌ {plugin_dir.name}/plugin.py must define a get_plugin() function")
-                continue
+                # Register the plugin
+                register_plugin(plugin)
+                registered_plugins.append(plugin.name)
 
-            # Get plugin instance
-            plugin = module.get_plugin()
+                print(f"✅ Loaded plugin '{plugin.name}' from {plugin_dir.name}/")
 
-            # Check if plugin is disabled
-            if _is_plugin_disabled(plugin.name):
-                print(f"⏭️  Skipped {plugin_dir.name}/ - '{plugin.name}' is disabled (DISABLED_PLUGINS)")
+            except Exception as e:
+                print(f"❌ Error loading plugin from {plugin_dir.name}: {e}")
+                traceback.print_exc()
                 continue
 
-            # Register the plugin
-            register_plugin(plugin)
-            registered_plugins.append(plugin.name)
-
-            print(f"✅ Loaded plugin '{plugin.name}' from {plugin_dir.name}/")
-
-        except Exception as e:
-            print(f"❌ Error loading plugin from {plugin_dir.name}: {e}")
-            import traceback
-            traceback.print_exc()
-            continue
-
     if registered_plugins:
         print(f"📦 Registered {len(registered_plugins)} plugin(s): {', '.join(registered_plugins)}")
     else:
@@ -161,6 +164,70 @@ def discover_and_register_plugins(plugins_base_dir: str | None = None) -> list[s
     return registered_plugins
 
 
+def _load_plugin_dir(plugin_dir: Path) -> tuple[Any, str | None]:
+    """
+    Import plugin_dir/plugin.py and call its get_plugin().
+
+    Returns:
+        (plugin, None) on success, or (None, message) if loading failed
+    """
+    try:
+        # Import plugin.py module
+        module_name = f"{plugin_dir.name}.plugin"
+        spec = importlib.util.spec_from_file_location(module_name, plugin_dir / "plugin.py")
+
+        if spec is None or spec.loader is None:
+            return None, f"❌ Failed to load {plugin_dir.name} - invalid module spec"
+
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[module_name] = module
+        spec.loader.exec_module(module)
+
+        # Look for get_plugin() function
+        if not hasattr(module, 'get_plugin'):
+            return None, f"❌ {plugin_dir.name}/plugin.py must define a get_plugin() function"
+
+        # Get plugin instance
+        return module.get_plugin(), None
+
+    except Exception as e:
+        return None, f"❌ Error loading plugin from {plugin_dir.name}: {e}\n{traceback.format_exc()}"
+
+
+def _register_entry_point_plugins() -> list[str]:
+    """
+    Register plugins that installed packages advertise as entry points.
+
+    Each entry point in the "meeting_transcription.plugins" group names a
+    plugin class or a get_plugin()-style factory:
+
+        [project.entry-points."meeting_transcription.plugins"]
+        my_plugin = "my_package.plugin:MyPlugin"
+
+    The group index comes from installed package metadata, so this costs
+    no directory scanning; nothing is imported unless a package declares
+    a plugin.
+
+    Returns:
+        List of registered plugin names
+    """
+    registered = []
+    for entry_point in importlib.metadata.entry_points(group=ENTRY_POINT_GROUP):
+        try:
+            plugin = entry_point.load()()
+
+            if _is_plugin_disabled(plugin.name):
+                print(f"⏭️  Skipped entry point '{entry_point.name}' - '{plugin.name}' is disabled (DISABLED_PLUGINS)")
+                continue
+
+            register_plugin(plugin)
+            registered.append(plugin.name)
+            print(f"✅ Loaded plugin '{plugin.name}' from entry point {entry_point.value}")
+        except Exception as e:
+            print(f"❌ Error loading plugin from entry point {entry_point.value}: {e}")
+    return registered
+
+
 def register_builtin_plugins():
     """
     Register built-in plugins that come with meeting-transcription.
@@ -173,14 +240,19 @@ def register_builtin_plugins():
         print("📚 Built-in plugins disabled (ENABLE_BUILTIN_PLUGINS=false)")
         return
 
-    from .educational_plugin import EducationalPlugin
-
     print("📚 Registering built-in plugins...")
 
-    # Educational plugin
-    educational = EducationalPlugin()
-    if _is_plugin_disabled(educational.name):
-        print(f"⏭️  Skipped '{educational.name}' - disabled (DISABLED_PLUGINS)")
+    # Educational plugin (created on first use: importing it loads the
+    # LLM pipeline and provider SDKs)
+    if _is_plugin_disabled('educational'):
+        print("⏭️  Skipped 'educational' - disabled (DISABLED_PLUGINS)")
     else:
-        register_plugin(educational)
-        print(f"✅ Registered '{educational.name}' plugin")
+        register_plugin_lazy('educational', _create_educational_plugin)
+        print("✅ Registered 'educational' plugin")
+
+
+def _create_educational_plugin():
+    """Factory for the built-in educational plugin."""
+    from .educational_plugin import EducationalPlugin
+
+    return EducationalPlugin()
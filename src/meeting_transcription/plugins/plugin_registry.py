@@ -4,6 +4,9 @@ Plugin registry for managing transcript processing plugins.
 Handles plugin registration, discovery, and retrieval.
 """
 
+import threading
+from collections.abc import Callable
+
 from .transcript_plugin_protocol import TranscriptPlugin
 
 
@@ -13,6 +16,10 @@ class PluginRegistry:
     def __init__(self):
         """Initialize empty plugin registry."""
         self._plugins: dict[str, TranscriptPlugin] = {}
+        # Factories for plugins registered lazily, called on first use
+        self._factories: dict[str, Callable[[], TranscriptPlugin]] = {}
+        # Serializes lazy loads so concurrent first get()s create one instance
+        self._load_lock = threading.Lock()
 
     def register(self, plugin: TranscriptPlugin) -> None:
         """
@@ -24,15 +31,54 @@ class PluginRegistry:
         Raises:
             ValueError: If plugin name is already registered
         """
-        if plugin.name in self._plugins:
-            raise ValueError(
-                f"Plugin '{plugin.name}' is already registered. "
-                f"Existing: {self._plugins[plugin.name].display_name}"
-            )
+        self._check_not_registered(plugin.name)
 
         self._plugins[plugin.name] = plugin
         print(f"✅ Registered plugin: {plugin.display_name} ({plugin.name})")
 
+    def register_lazy(self, name: str, factory: Callable[[], TranscriptPlugin]) -> None:
+        """
+        Register a plugin without creating it yet.
+
+        factory is called the first time the plugin is requested, so its
+        imports (e.g. the LLM pipeline) are deferred until then.
+
+        Args:
+            name: Plugin identifier; must match the created plugin's name
+            factory: Zero-argument callable returning the plugin instance
+
+        Raises:
+            ValueError: If plugin name is already registered
+        """
+        self._check_not_registered(name)
+        self._factories[name] = factory
+
+    def _check_not_registered(self, name: str) -> None:
+        """Raise ValueError if a plugin called name is already registered."""
+        if name in self._plugins:
+            raise ValueError(
+                f"Plugin '{name}' is already registered. "
+                f"Existing: {self._plugins[name].display_name}"
+            )
+        if name in self._factories:
+            raise ValueError(f"Plugin '{name}' is already registered.")
+
+    def _load(self, name: str) -> TranscriptPlugin:
+        """Create a lazily registered plugin and keep the instance."""
+        with self._load_lock:
+            # Another thread may have loaded it while we waited
+            plugin = self._plugins.get(name)
+            if plugin is not None:
+                return plugin
+            plugin = self._factories[name]()
+            if plugin.name != name:
+                raise ValueError(
+                    f"Plugin registered as '{name}' is named '{plugin.name}'"
+                )
+            self._plugins[name] = plugin
+            del self._factories[name]
+            return plugin
+
     def get(self, name: str) -> TranscriptPlugin:
         """
         Get a registered plugin by name.
@@ -46,14 +92,17 @@ class PluginRegistry:
         Raises:
             ValueError: If plugin not found
         """
-        if name not in self._plugins:
-            available = ', '.join(self._plugins.keys())
-            raise ValueError(
-                f"Plugin '{name}' not found. "
-                f"Available plugins: {available}"
-            )
-
-        return self._plugins[name]
+        plugin = self._plugins.get(name)
+        if plugin is not None:
+            return plugin
+        if name in self._factories:
+            return self._load(name)
+
+        available = ', '.join([*self._plugins, *self._factories])
+        raise ValueError(
+            f"Plugin '{name}' not found. "
+            f"Available plugins: {available}"
+        )
 
     def list(self) -> list[dict[str, str]]:
         """
@@ -69,6 +118,8 @@ class PluginRegistry:
                 }
             ]
         """
+        for name in list(self._factories):
+            self._load(name)
         return [
             {
                 "name": plugin.name,
@@ -88,7 +139,7 @@ class PluginRegistry:
         Returns:
             True if plugin is registered
         """
-        return name in self._plugins
+        return name in self._plugins or name in self._factories
 
     def unregister(self, name: str) -> None:
         """
@@ -100,6 +151,10 @@ class PluginRegistry:
         Raises:
             ValueError: If plugin not found
         """
+        if name in self._factories:
+            del self._factories[name]
+            print(f"❌ Unregistered plugin: {name}")
+            return
         if name not in self._plugins:
             raise ValueError(f"Plugin '{name}' not found")
 
@@ -117,6 +172,11 @@ def register_plugin(plugin: TranscriptPlugin) -> None:
     _registry.register(plugin)
 
 
+def register_plugin_lazy(name: str, factory: Callable[[], TranscriptPlugin]) -> None:
+    """Register a plugin factory in the global registry (created on first use)."""
+    _registry.register_lazy(name, factory)
+
+
 def get_plugin(name: str) -> TranscriptPlugin:
     """Get a plugin from the global registry."""
     return _registry.get(name)
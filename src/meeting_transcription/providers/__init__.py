@@ -31,21 +31,22 @@ from .registry import (
     has_provider,
     list_providers,
     register_provider,
+    register_provider_lazy,
 )
 
 
 def register_builtin_providers() -> None:
-    """Register all built-in providers."""
-    from .google_meet_provider import GoogleMeetProvider
-    from .manual_provider import ManualUploadProvider
-    from .recall_provider import RecallProvider
-    from .zoom_provider import ZoomProvider
+    """
+    Register all built-in providers.
 
+    Registered by import path: a provider's module (and whatever SDK it
+    uses) is only imported when that provider is first requested.
+    """
     # Register providers (order doesn't matter)
-    register_provider(RecallProvider)
-    register_provider(GoogleMeetProvider)
-    register_provider(ZoomProvider)
-    register_provider(ManualUploadProvider)
+    register_provider_lazy(ProviderType.RECALL, f"{__name__}.recall_provider:RecallProvider")
+    register_provider_lazy(ProviderType.GOOGLE_MEET, f"{__name__}.google_meet_provider:GoogleMeetProvider")
+    register_provider_lazy(ProviderType.ZOOM, f"{__name__}.zoom_provider:ZoomProvider")
+    register_provider_lazy(ProviderType.MANUAL, f"{__name__}.manual_provider:ManualUploadProvider")
 
 
 # Auto-register built-in providers on import
@@ -59,6 +60,7 @@ __all__ = [
     # Registry functions
     "get_provider",
     "register_provider",
+    "register_provider_lazy",
     "list_providers",
     "has_provider",
     "get_registry",
@@ -5,7 +5,9 @@ Handles provider registration, discovery, and retrieval based on
 environment configuration.
 """
 
+import importlib
 import os
+import threading
 
 from .base import ProviderType, TranscriptProvider
 
@@ -16,6 +18,10 @@ class ProviderRegistry:
     def __init__(self):
         """Initialize empty provider registry."""
         self._providers: dict[ProviderType, type[TranscriptProvider]] = {}
+        # Registered by "module:Class" path, imported on first use
+        self._lazy_providers: dict[ProviderType, str] = {}
+        # Serializes lazy imports so concurrent first get()s don't race
+        self._load_lock = threading.Lock()
         self._instances: dict[ProviderType, TranscriptProvider] = {}
 
     def register(self, provider_class: type[TranscriptProvider]) -> None:
@@ -51,16 +57,60 @@ class ProviderRegistry:
                 f"Provider class {provider_class.__name__} must define provider_type"
             )
 
-        if provider_type in self._providers:
-            existing = self._providers[provider_type]
-            raise ValueError(
-                f"Provider type '{provider_type.value}' is already registered "
-                f"to {existing.__name__}. Cannot register {provider_class.__name__}."
-            )
+        self._check_not_registered(provider_type, provider_class.__name__)
 
         self._providers[provider_type] = provider_class
         print(f"✅ Registered provider: {provider_class.__name__} ({provider_type.value})")
 
+    def register_lazy(self, provider_type: ProviderType, class_path: str) -> None:
+        """
+        Register a provider class by import path without importing it.
+
+        The module is imported the first time the provider is requested,
+        so registering providers doesn't pull in their dependencies.
+
+        Args:
+            provider_type: Type the provider implements
+            class_path: "package.module:ClassName"
+
+        Raises:
+            ValueError: If provider type is already registered
+        """
+        self._check_not_registered(provider_type, class_path)
+        self._lazy_providers[provider_type] = class_path
+
+    def _check_not_registered(self, provider_type: ProviderType, new: str) -> None:
+        """Raise ValueError if provider_type already has a provider."""
+        if provider_type in self._providers:
+            existing = self._providers[provider_type].__name__
+        elif provider_type in self._lazy_providers:
+            existing = self._lazy_providers[provider_type]
+        else:
+            return
+        raise ValueError(
+            f"Provider type '{provider_type.value}' is already registered "
+            f"to {existing}. Cannot register {new}."
+        )
+
+    def _provider_class(self, provider_type: ProviderType) -> type[TranscriptProvider]:
+        """Get the class for a registered type, importing it if registered lazily."""
+        provider_class = self._providers.get(provider_type)
+        if provider_class is not None:
+            return provider_class
+        with self._load_lock:
+            # Another thread may have imported it while we waited
+            provider_class = self._providers.get(provider_type)
+            if provider_class is None:
+                module_name, _, class_name = self._lazy_providers[provider_type].partition(':')
+                provider_class = getattr(importlib.import_module(module_name), class_name)
+                self._providers[provider_type] = provider_class
+                del self._lazy_providers[provider_type]
+        return provider_class
+
+    def _registered_types(self) -> list[ProviderType]:
+        """All registered provider types, loaded or not."""
+        return [*self._providers, *self._lazy_providers]
+
     def get(self, provider_type: ProviderType | str) -> TranscriptProvider:
         """
         Get a provider instance by type.
@@ -79,25 +129,27 @@ class ProviderRegistry:
             try:
                 provider_type = ProviderType(provider_type)
             except ValueError:
-                available = ', '.join(p.value for p in self._providers)
+                available = ', '.join(p.value for p in self._registered_types())
                 raise ValueError(
                     f"Unknown provider type '{provider_type}'. "
                     f"Available: {available}"
                 ) from None
 
-        if provider_type not in self._providers:
-            available = ', '.join(p.value for p in self._providers)
+        if not self.has(provider_type):
+            available = ', '.join(p.value for p in self._registered_types())
             raise ValueError(
                 f"Provider type '{provider_type.value}' not registered. "
                 f"Available: {available}"
             )
 
-        # Return cached instance or create new one
-        if provider_type not in self._instances:
-            provider_class = self._providers[provider_type]
-            self._instances[provider_type] = provider_class()
+        # Return cached instance or create new one (setdefault, so threads
+        # racing on the first get() all end up with the same instance)
+        provider = self._instances.get(provider_type)
+        if provider is None:
+            provider_class = self._provider_class(provider_type)
+            provider = self._instances.setdefault(provider_type, provider_class())
 
-        return self._instances[provider_type]
+        return provider
 
     def get_default(self) -> TranscriptProvider:
         """
@@ -116,6 +168,9 @@ class ProviderRegistry:
         """
         List all registered providers.
 
+        Display names come from provider instances, so listing imports and
+        instantiates every lazily registered provider (and its SDK).
+
         Returns:
             List of provider info dictionaries:
             [
@@ -127,18 +182,23 @@ class ProviderRegistry:
             ]
         """
         result = []
-        for provider_type, provider_class in self._providers.items():
-            # Get name from class (may need instantiation)
+        for provider_type in self._registered_types():
+            # Lazy entries are only dropped once the loaded class is stored
+            class_path = self._lazy_providers.get(provider_type)
+            if class_path is not None:
+                class_name = class_path.partition(':')[2]
+            else:
+                class_name = self._providers[provider_type].__name__
+            # Fall back to the class name if the provider can't be loaded
             try:
-                instance = self.get(provider_type)
-                name = instance.name
+                name = self.get(provider_type).name
             except Exception:
-                name = provider_class.__name__
+                name = class_name
 
             result.append({
                 "type": provider_type.value,
                 "name": name,
-                "class": provider_class.__name__
+                "class": class_name
             })
         return result
 
@@ -158,7 +218,7 @@ class ProviderRegistry:
             except ValueError:
                 return False
 
-        return provider_type in self._providers
+        return provider_type in self._providers or provider_type in self._lazy_providers
 
     def unregister(self, provider_type: ProviderType) -> None:
         """
@@ -170,12 +230,15 @@ class ProviderRegistry:
         Raises:
             ValueError: If provider not found
         """
-        if provider_type not in self._providers:
+        if provider_type in self._lazy_providers:
+            provider_name = self._lazy_providers.pop(provider_type)
+        elif provider_type in self._providers:
+            provider_name = self._providers.pop(provider_type).__name__
+        else:
             raise ValueError(f"Provider type '{provider_type.value}' not registered")
 
-        provider_class = self._providers.pop(provider_type)
         self._instances.pop(provider_type, None)
-        print(f"❌ Unregistered provider: {provider_class.__name__} ({provider_type.value})")
+        print(f"❌ Unregistered provider: {provider_name} ({provider_type.value})")
 
 
 # Global registry instance
@@ -188,6 +251,11 @@ def register_provider(provider_class: type[TranscriptProvider]) -> None:
     _registry.register(provider_class)
 
 
+def register_provider_lazy(provider_type: ProviderType, class_path: str) -> None:
+    """Register a provider by "module:Class" path in the global registry."""
+    _registry.register_lazy(provider_type, class_path)
+
+
 def get_provider(provider_type: ProviderType | str | None = None) -> TranscriptProvider:
     """
     Get a provider from the global registry.
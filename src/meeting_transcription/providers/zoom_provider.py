@@ -7,11 +7,19 @@ for meeting recordings and transcripts.
 Implementation pending Epic 2: Zoom Integration.
 """
 
-from typing import Any
+from typing import Any, NoReturn
 
 from .base import ProviderType, TranscriptProvider
 
 
+def _not_implemented() -> NoReturn:
+    """Raise the error every ZoomProvider operation raises until Epic 2."""
+    raise NotImplementedError(
+        "Zoom integration not yet implemented. "
+        "See Epic 2: Zoom Integration for roadmap."
+    )
+
+
 class ZoomProvider(TranscriptProvider):
     """
     Transcript provider using Zoom's native API.
@@ -42,53 +50,13 @@ class ZoomProvider(TranscriptProvider):
         return ProviderType.ZOOM
 
     async def create_meeting(self, meeting_url: str, **kwargs) -> str:
-        """
-        Register a Zoom meeting for transcript retrieval.
-
-        Not yet implemented - will be added in Epic 2.
-
-        Args:
-            meeting_url: Zoom meeting URL
-            **kwargs: Additional options
-
-        Raises:
-            NotImplementedError: Always (stub implementation)
-        """
-        raise NotImplementedError(
-            "Zoom integration not yet implemented. "
-            "See Epic 2: Zoom Integration for roadmap."
-        )
+        """Register a Zoom meeting for transcript retrieval (not yet implemented)."""
+        _not_implemented()
 
     async def get_transcript(self, meeting_id: str) -> dict[str, Any]:
-        """
-        Fetch transcript from Zoom Cloud Recordings.
-
-        Not yet implemented - will be added in Epic 2.
-
-        Args:
-            meeting_id: Meeting identifier
-
-        Raises:
-            NotImplementedError: Always (stub implementation)
-        """
-        raise NotImplementedError(
-            "Zoom integration not yet implemented. "
-            "See Epic 2: Zoom Integration for roadmap."
-        )
+        """Fetch transcript from Zoom Cloud Recordings (not yet implemented)."""
+        _not_implemented()
 
     async def get_status(self, meeting_id: str) -> str:
-        """
-        Get meeting/recording status.
-
-        Not yet implemented - will be added in Epic 2.
-
-        Args:
-            meeting_id: Meeting identifier
-
-        Raises:
-            NotImplementedError: Always (stub implementation)
-        """
-        raise NotImplementedError(
-            "Zoom integration not yet implemented. "
-            "See Epic 2: Zoom Integration for roadmap."
-        )
+        """Get meeting/recording status (not yet implemented)."""
+        _not_implemented()
@@ -0,0 +1,46 @@
+"""
+JSON encoding/decoding with an optional orjson fast path.
+
+orjson parses and serializes several times faster than the stdlib json
+module. It is not a hard dependency: when it isn't installed these helpers
+fall back to json and produce equivalent documents.
+
+Both paths raise json.JSONDecodeError on invalid input (orjson's error
+type subclasses it).
+"""
+
+import json
+from typing import Any
+
+try:
+    import orjson
+
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+JSONDecodeError = json.JSONDecodeError
+
+
+def loads(data: bytes | bytearray | memoryview | str) -> Any:
+    """Deserialize a JSON document from bytes or str."""
+    if HAS_ORJSON:
+        return orjson.loads(data)
+    return json.loads(bytes(data) if isinstance(data, memoryview) else data)
+
+
+def dumps(obj: Any, *, indent: bool = False) -> bytes:
+    """
+    Serialize obj to UTF-8 encoded JSON bytes.
+
+    Output is compact unless indent is set, in which case it is pretty
+    printed with two-space indentation (like json.dumps(indent=2)).
+    """
+    if HAS_ORJSON:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, option=option)
+    if indent:
+        return json.dumps(obj, ensure_ascii=False, indent=2).encode()
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode()
@@ -0,0 +1,63 @@
+"""
+On-disk cache of parsed LLM results, keyed by model and prompt.
+
+Re-running the pipeline on the same transcript (retries, debugging,
+formatter-only changes) would otherwise repeat every LLM call. The key is
+a SHA-256 of the model name and the full prompt, so any change to the
+transcript text, the prompt template or the model is a miss.
+
+Disabled unless LLM_CACHE_DIR is set. Entries are written atomically and
+never expire; delete the directory to clear it.
+"""
+
+import hashlib
+import logging
+import os
+import threading
+from pathlib import Path
+from typing import Any
+
+from meeting_transcription.utils import fast_json
+
+logger = logging.getLogger(__name__)
+
+
+def cache_key(model: str, prompt: str) -> str:
+    """Key for the result of sending prompt to model."""
+    return hashlib.sha256(f"{model}\0{prompt}".encode()).hexdigest()
+
+
+def _entry_path(key: str) -> Path | None:
+    cache_dir = os.getenv("LLM_CACHE_DIR")
+    if not cache_dir:
+        return None
+    # Fan out over 256 subdirectories to keep directory listings short
+    return Path(cache_dir) / key[:2] / f"{key}.json"
+
+
+def get(key: str) -> Any:
+    """Return the cached result for key, or None on a miss (or when disabled)."""
+    path = _entry_path(key)
+    if path is None:
+        return None
+    try:
+        return fast_json.loads(path.read_bytes())
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError) as e:
+        logger.warning("Ignoring unreadable LLM cache entry %s: %s", path, e)
+        return None
+
+
+def put(key: str, value: Any) -> None:
+    """Store a JSON-serializable result under key (no-op when disabled)."""
+    path = _entry_path(key)
+    if path is None:
+        return
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}-{threading.get_ident()}.tmp")
+        tmp_path.write_bytes(fast_json.dumps(value))
+        os.replace(tmp_path, path)
+    except OSError as e:
+        logger.warning("Could not write LLM cache entry %s: %s", path, e)
@@ -10,11 +10,21 @@ Set AI_MODEL environment variable to choose which model to use:
 - AI_MODEL=google:gemini-3-pro-preview
 - AI_MODEL=anthropic:claude-sonnet-4-5
 - AI_MODEL=openai:gpt-4o
+
+Prompt caching: callers can mark a prompt as cacheable, or pass the static
+leading part of a prompt shared by many calls as cache_prefix. Anthropic
+prompts are then sent with an explicit cache breakpoint; OpenAI and Gemini
+cache identical prompt prefixes automatically. Set LLM_PROMPT_CACHING=false
+to disable the explicit breakpoint.
 """
 import json
 import os
+import threading
+from functools import lru_cache
 from typing import Any
 
+from meeting_transcription.utils import fast_json
+
 try:
     import aisuite as ai
     HAS_AISUITE = True
@@ -122,6 +132,10 @@ class LLMClient:
 
         # Get model from parameter or environment
         self.model = model or os.getenv("AI_MODEL", "google:gemini-3-pro-preview")
+        self.prompt_caching = os.getenv("LLM_PROMPT_CACHING", "true").lower() == "true"
+
+        # Per-thread, so a shared client reports each caller its own usage
+        self._local = threading.local()
 
         # Print which provider/model we're using
         provider_name = self.model.split(":")[0] if ":" in self.model else "unknown"
@@ -151,7 +165,19 @@ class LLMClient:
             else:
                 print("   Direct Anthropic API")
 
-    def call(self, prompt: str, max_tokens: int = 4096, temperature: float = 0.7) -> str:
+    @property
+    def last_usage(self) -> dict[str, int]:
+        """Token usage of this thread's most recent call (when the provider reports it)."""
+        return getattr(self._local, "usage", {})
+
+    def call(
+        self,
+        prompt: str,
+        max_tokens: int = 4096,
+        temperature: float = 0.7,
+        cache_prompt: bool = False,
+        cache_prefix: str = ""
+    ) -> str:
         """
         Call LLM with prompt and return text response.
 
@@ -159,11 +185,18 @@ class LLMClient:
             prompt: The prompt to send
             max_tokens: Maximum tokens in response (default: 4096)
             temperature: Sampling temperature 0-1 (default: 0.7)
+            cache_prompt: Mark the prompt as reusable so retries and re-runs
+                of the same prompt hit the provider's prompt cache
+            cache_prefix: Static text sent ahead of prompt and shared by
+                other calls (e.g. instructions); it is cached on its own so
+                those calls read it from the provider's prompt cache
 
         Returns:
             LLM response as text string
         """
-        messages = [{"role": "user", "content": prompt}]
+        provider = self.model.split(":")[0] if ":" in self.model else ""
+        cache = (cache_prompt or bool(cache_prefix)) and self.prompt_caching and provider == "anthropic"
+        messages = [_user_message(prompt, cache=cache, prefix=cache_prefix)]
 
         response = self.client.chat.completions.create(
             model=self.model,
@@ -172,6 +205,7 @@ class LLMClient:
             temperature=temperature
         )
 
+        self._local.usage = _usage_counts(getattr(response, "usage", None))
         return response.choices[0].message.content
 
     def call_structured(
@@ -179,7 +213,8 @@ class LLMClient:
         prompt: str,
         response_schema: dict[str, Any],
         max_tokens: int = 8000,
-        temperature: float = 0.7
+        temperature: float = 0.7,
+        cache_prompt: bool = False
     ) -> dict[str, Any]:
         """
         Call LLM with prompt and return structured JSON response.
@@ -189,6 +224,7 @@ class LLMClient:
             response_schema: JSON schema for expected response structure
             max_tokens: Maximum tokens in response (default: 8000)
             temperature: Sampling temperature 0-1 (default: 0.7)
+            cache_prompt: Mark the prompt as cacheable (see call())
 
         Returns:
             Parsed JSON response as dictionary
@@ -200,7 +236,7 @@ class LLMClient:
             f"{json.dumps(response_schema, indent=2)}"
         )
 
-        response_text = self.call(json_prompt, max_tokens, temperature)
+        response_text = self.call(json_prompt, max_tokens, temperature, cache_prompt=cache_prompt)
         return self._parse_json_response(response_text)
 
     def _parse_json_response(self, response: str) -> dict[str, Any]:
@@ -216,12 +252,125 @@ class LLMClient:
         Raises:
             json.JSONDecodeError: If response cannot be parsed as JSON
         """
-        # Extract JSON from markdown code blocks if present
-        if '```json' in response:
-            json_str = response.split('```json')[1].split('```')[0].strip()
-        elif '```' in response:
-            json_str = response.split('```')[1].split('```')[0].strip()
-        else:
-            json_str = response.strip()
-
-        return json.loads(json_str)
+        return parse_json_response(response)
+
+
+def parse_json_response(response: str) -> Any:
+    """
+    Parse JSON from an LLM response, unwrapping a markdown code block.
+
+    The body of the first ```json (or plain ```) block is parsed if there
+    is one, otherwise the whole response.
+    """
+    # partition finds each fence once without building split() lists
+    # over the whole (possibly large) response
+    if '```json' in response:
+        body = response.partition('```json')[2].partition('```')[0]
+    elif '```' in response:
+        body = response.partition('```')[2].partition('```')[0]
+    else:
+        body = response
+    return fast_json.loads(body.strip())
+
+
+def get_llm_client(model: str | None = None) -> LLMClient:
+    """
+    Return a shared LLMClient for model (None = AI_MODEL).
+
+    aisuite keeps its provider SDK clients, with their credentials and
+    HTTP connection pools, for the life of the client, so reusing one
+    avoids redoing that setup for every transcript. Clients are keyed on
+    the environment they are built from as well, so changing AI_MODEL,
+    LLM_PROMPT_CACHING or provider credentials gets a new client.
+    """
+    return _get_cached_llm_client(model, _llm_client_config())
+
+
+# Environment variables LLMClient reads besides the Google project/region
+_LLM_CLIENT_ENV = (
+    "GOOGLE_APPLICATION_CREDENTIALS",
+    "OPENAI_API_KEY",
+    "OPENAI_ENDPOINT",
+    "OPENAI_DEPLOYMENT",
+    "OPENAI_API_VERSION",
+    "ANTHROPIC_API_KEY",
+    "ANTHROPIC_ENDPOINT",
+    "AI_MODEL",
+    "LLM_PROMPT_CACHING",
+)
+
+
+def _llm_client_config() -> tuple[str | None, ...]:
+    """Resolve the environment settings an LLMClient would be built from."""
+    # Project and region resolved as LLMClient does (it writes the resolved
+    # values back to GOOGLE_PROJECT_ID/GOOGLE_REGION, which keeps this stable)
+    google_project = (
+        os.getenv("GOOGLE_CLOUD_PROJECT") or os.getenv("GCP_PROJECT") or os.getenv("GOOGLE_PROJECT_ID")
+    )
+    google_region = os.getenv("GOOGLE_REGION") or os.getenv("GCP_REGION", "global")
+    return (google_project, google_region, *(os.getenv(name) for name in _LLM_CLIENT_ENV))
+
+
+@lru_cache(maxsize=8)
+def _get_cached_llm_client(model: str | None, config: tuple[str | None, ...]) -> LLMClient:
+    """Build the LLMClient for a (model, environment config) pair once."""
+    return LLMClient(model=model)
+
+
+# Usage fields worth recording: prompt-cache writes/reads (Anthropic) and
+# cached prompt tokens (OpenAI, nested under prompt_tokens_details)
+_USAGE_FIELDS = (
+    "prompt_tokens",
+    "completion_tokens",
+    "input_tokens",
+    "output_tokens",
+    "cache_creation_input_tokens",
+    "cache_read_input_tokens",
+)
+
+
+def _user_message(prompt: str, cache: bool = False, prefix: str = "") -> dict[str, Any]:
+    """
+    Build the user message, with an ephemeral cache breakpoint if requested.
+
+    With a prefix, the breakpoint goes after the prefix rather than the
+    whole prompt, so every prompt starting with it can reuse the cache.
+    """
+    if not cache:
+        return {"role": "user", "content": prefix + prompt}
+    if prefix:
+        return {
+            "role": "user",
+            "content": [
+                {"type": "text", "text": prefix, "cache_control": {"type": "ephemeral"}},
+                {"type": "text", "text": prompt},
+            ],
+        }
+    return {
+        "role": "user",
+        "content": [
+            {"type": "text", "text": prompt, "cache_control": {"type": "ephemeral"}}
+        ],
+    }
+
+
+def _usage_counts(usage: Any) -> dict[str, int]:
+    """Extract integer token counts from a provider usage object or dict."""
+    if usage is None:
+        return {}
+
+    def field(obj: Any, name: str) -> Any:
+        return obj.get(name) if isinstance(obj, dict) else getattr(obj, name, None)
+
+    counts = {}
+    for name in _USAGE_FIELDS:
+        value = field(usage, name)
+        if isinstance(value, int):
+            counts[name] = value
+
+    details = field(usage, "prompt_tokens_details")
+    cached = field(details, "cached_tokens") if details is not None else None
+    if isinstance(cached, int):
+        counts["cached_tokens"] = cached
+
+    return counts
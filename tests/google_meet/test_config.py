@@ -3,10 +3,12 @@
 import os
 from unittest.mock import patch
 
+from meeting_transcription.google_meet import config as config_module
 from meeting_transcription.google_meet.config import (
     GOOGLE_MEET_SCOPES,
     GoogleOAuthConfig,
     GoogleOAuthMode,
+    get_google_oauth_config,
 )
 
 
@@ -67,6 +69,25 @@ class TestGoogleOAuthConfig:
             assert config.pubsub_topic_path == "projects/my-project/topics/my-topic"
             assert config.pubsub_subscription_path == "projects/my-project/subscriptions/my-sub"
 
+    def test_pubsub_push_oidc_token(self):
+        env = {
+            "GOOGLE_PUBSUB_PUSH_AUDIENCE": "https://example.com/webhook/google-meet",
+            "GCP_PROJECT_NUMBER": "123",
+        }
+        with patch.dict(os.environ, env, clear=True):
+            config = GoogleOAuthConfig()
+            assert config.pubsub_push_oidc_token == {
+                "service_account_email": "123-compute@developer.gserviceaccount.com",
+                "audience": "https://example.com/webhook/google-meet",
+            }
+
+    def test_push_audience_without_project_number(self):
+        env = {"GOOGLE_PUBSUB_PUSH_AUDIENCE": "https://example.com/webhook/google-meet"}
+        with patch.dict(os.environ, env, clear=True):
+            config = GoogleOAuthConfig()
+            assert config.pubsub_push_oidc_token is None
+            assert any("GCP_PROJECT_NUMBER" in e for e in config.validate())
+
     def test_scopes_include_meet(self):
         with patch.dict(os.environ, {}, clear=True):
             config = GoogleOAuthConfig()
@@ -93,6 +114,20 @@ class TestGoogleOAuthConfig:
             assert config.mode == GoogleOAuthMode.SHARED
 
 
+class TestGetGoogleOAuthConfig:
+    """Tests for the get_google_oauth_config() singleton."""
+
+    def test_returns_cached_instance(self, monkeypatch):
+        monkeypatch.setattr(config_module, "_config", None)
+
+        first = get_google_oauth_config()
+        with patch.object(config_module, "GoogleOAuthConfig") as mock_cls:
+            second = get_google_oauth_config()
+
+        assert first is second
+        mock_cls.assert_not_called()
+
+
 class TestGoogleMeetScopes:
     """Tests for scope constants."""
 
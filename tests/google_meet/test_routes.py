@@ -0,0 +1,200 @@
+"""Tests for the Google Meet Pub/Sub webhook and subscription renewal routes."""
+
+import base64
+import json
+from unittest.mock import MagicMock, patch
+
+import pytest
+from flask import Flask
+from meeting_transcription.google_meet import config as config_module
+from meeting_transcription.google_meet import pubsub
+from meeting_transcription.google_meet.routes import google_meet_bp
+
+
+@pytest.fixture
+def client():
+    app = Flask(__name__)
+    app.register_blueprint(google_meet_bp)
+    with (
+        patch("meeting_transcription.api.storage.MeetingStorage"),
+        patch("meeting_transcription.google_meet.routes.MeetSessionHandler"),
+    ):
+        yield app.test_client()
+
+
+class TestGoogleMeetWebhook:
+    """Tests for POST /webhook/google-meet."""
+
+    def test_invalid_body_rejected(self, client):
+        resp = client.post("/webhook/google-meet", data=b"{not json")
+
+        assert resp.status_code == 400
+        assert resp.get_json() == {"error": "No data"}
+
+    def test_empty_body_rejected(self, client):
+        resp = client.post("/webhook/google-meet", data=b"")
+
+        assert resp.status_code == 400
+
+    def test_unhandled_event_acknowledged(self, client):
+        event = {"eventType": "google.workspace.meet.conference.v2.started"}
+        push = {
+            "message": {
+                "data": base64.b64encode(json.dumps(event).encode()).decode(),
+                "messageId": "msg-1",
+            },
+        }
+
+        resp = client.post("/webhook/google-meet", json=push)
+
+        assert resp.status_code == 200
+        assert resp.mimetype == "application/json"
+        assert resp.get_json()["status"] == "skipped"
+
+
+class TestPushAuthentication:
+    """Tests for OIDC verification on the webhook when an audience is set."""
+
+    AUDIENCE = "https://example.com/webhook/google-meet"
+
+    @pytest.fixture(autouse=True)
+    def _push_audience(self, monkeypatch):
+        from meeting_transcription.google_meet import routes
+
+        # api.auth refuses to import without a JWT secret outside development
+        monkeypatch.setenv("JWT_SECRET", "test-secret")
+        config = routes.get_google_oauth_config()
+        monkeypatch.setattr(config, "pubsub_push_audience", self.AUDIENCE)
+        monkeypatch.setattr(
+            config,
+            "pubsub_push_service_account",
+            "123-compute@developer.gserviceaccount.com",
+        )
+
+    def test_missing_token_rejected(self, client):
+        with patch("meeting_transcription.api.auth.verify_oidc_token") as verify:
+            resp = client.post("/webhook/google-meet", json={"message": {}})
+
+        assert resp.status_code == 401
+        verify.assert_not_called()
+
+    def test_invalid_token_rejected_before_work(self, client):
+        with (
+            patch(
+                "meeting_transcription.api.auth.verify_oidc_token", return_value=False
+            ) as verify,
+            patch("meeting_transcription.google_meet.routes.MeetWebhookHandler") as handler,
+        ):
+            resp = client.post(
+                "/webhook/google-meet",
+                json={"message": {}},
+                headers={"Authorization": "Bearer bad-token"},
+            )
+
+        assert resp.status_code == 401
+        verify.assert_called_once_with("bad-token", self.AUDIENCE)
+        handler.assert_not_called()
+
+    def test_valid_token_accepted(self, client):
+        with patch("meeting_transcription.api.auth.verify_oidc_token", return_value=True):
+            resp = client.post(
+                "/webhook/google-meet",
+                data=b"",
+                headers={"Authorization": "Bearer good-token"},
+            )
+
+        # Authenticated, then rejected on the (empty) payload
+        assert resp.status_code == 400
+
+
+class TestPushConfigAgreement:
+    """The subscription and the webhook agree on whether pushes are authenticated."""
+
+    @pytest.mark.parametrize(
+        "audience,project_number",
+        [
+            ("https://example.com/webhook/google-meet", "123"),
+            ("https://example.com/webhook/google-meet", ""),
+            ("", "123"),
+            ("", ""),
+        ],
+    )
+    def test_subscription_and_webhook_agree(
+        self, client, monkeypatch, audience, project_number
+    ):
+        monkeypatch.setenv("JWT_SECRET", "test-secret")
+        monkeypatch.setenv("GOOGLE_PUBSUB_PUSH_AUDIENCE", audience)
+        monkeypatch.setenv("GCP_PROJECT_NUMBER", project_number)
+        monkeypatch.setattr(config_module, "_config", None)
+        subscriber = MagicMock()
+        monkeypatch.setattr(pubsub, "HAS_PUBSUB", True)
+        monkeypatch.setattr(pubsub, "_get_publisher", MagicMock)
+        monkeypatch.setattr(pubsub, "_get_subscriber", lambda: subscriber)
+
+        pubsub.ensure_pubsub_resources("https://example.com/webhook/google-meet")
+        request = subscriber.create_subscription.call_args.kwargs["request"]
+        oidc_token = request["push_config"].get("oidc_token")
+
+        with patch(
+            "meeting_transcription.api.auth.verify_oidc_token", return_value=True
+        ) as verify:
+            unauthenticated = client.post("/webhook/google-meet", data=b"")
+            authenticated = client.post(
+                "/webhook/google-meet",
+                data=b"",
+                headers={"Authorization": "Bearer token"},
+            )
+
+        if oidc_token:
+            assert unauthenticated.status_code == 401
+            verify.assert_called_once_with("token", oidc_token["audience"])
+        else:
+            assert unauthenticated.status_code == 400
+            verify.assert_not_called()
+        assert authenticated.status_code == 400
+
+
+class TestSubscriptionRenewal:
+    """Tests for POST /api/google-meet/subscriptions/renew."""
+
+    URL = "/api/google-meet/subscriptions/renew"
+
+    @pytest.fixture(autouse=True)
+    def _env(self, monkeypatch):
+        # api.auth refuses to import without a JWT secret outside development
+        monkeypatch.setenv("JWT_SECRET", "test-secret")
+        monkeypatch.setenv("SERVICE_URL", "https://example.com/")
+
+    @pytest.fixture
+    def manager(self):
+        with patch("meeting_transcription.google_meet.routes.WorkspaceEventsManager") as manager_cls:
+            yield manager_cls.return_value
+
+    def test_missing_token_rejected(self, client, manager):
+        resp = client.post(self.URL)
+
+        assert resp.status_code == 401
+        manager.renew_expiring_subscriptions.assert_not_called()
+
+    def test_invalid_token_rejected(self, client, manager):
+        with patch(
+            "meeting_transcription.api.auth.verify_oidc_token", return_value=False
+        ) as verify:
+            resp = client.post(self.URL, headers={"Authorization": "Bearer bad-token"})
+
+        assert resp.status_code == 401
+        verify.assert_called_once_with("bad-token", "https://example.com" + self.URL)
+        manager.renew_expiring_subscriptions.assert_not_called()
+
+    def test_renews_expiring(self, client, manager):
+        manager.renew_expiring_subscriptions.return_value = {
+            "user-1": {"name": "subscriptions/1"},
+            "user-2": None,
+            "user-3": {"name": "subscriptions/3"},
+        }
+
+        with patch("meeting_transcription.api.auth.verify_oidc_token", return_value=True):
+            resp = client.post(self.URL, headers={"Authorization": "Bearer good-token"})
+
+        assert resp.status_code == 200
+        assert resp.get_json() == {"renewed": 2, "failed": 1}
@@ -0,0 +1,183 @@
+"""Tests for Google Meet session handler (transcript -> meeting -> queue)."""
+
+import io
+import json
+from unittest.mock import MagicMock, patch
+
+import pytest
+from meeting_transcription.google_meet import session_handler
+from meeting_transcription.google_meet.session_handler import MeetSessionHandler
+
+
+@pytest.fixture
+def mock_storage() -> MagicMock:
+    """Mock MeetingStorage instance."""
+    return MagicMock()
+
+
+def _make_handler(storage: MagicMock) -> MeetSessionHandler:
+    with patch.object(session_handler, "MeetApiClient"):
+        return MeetSessionHandler(storage=storage, service_url="https://example.com")
+
+
+@pytest.fixture
+def handler(mock_storage: MagicMock) -> MeetSessionHandler:
+    """MeetSessionHandler with a mocked storage and Meet client."""
+    return _make_handler(mock_storage)
+
+
+@pytest.fixture
+def mock_tasks_client(monkeypatch: pytest.MonkeyPatch) -> MagicMock:
+    """Shared Cloud Tasks client stub."""
+    client = MagicMock()
+    client.queue_path.return_value = "queue-path"
+    monkeypatch.setattr(session_handler, "_tasks_client", client)
+    return client
+
+
+@pytest.fixture
+def tasks_handler(
+    mock_storage: MagicMock, mock_tasks_client: MagicMock, monkeypatch: pytest.MonkeyPatch
+) -> MeetSessionHandler:
+    """Handler configured for a GCP project with Cloud Tasks."""
+    monkeypatch.setenv("GOOGLE_CLOUD_PROJECT", "test-project")
+    monkeypatch.setenv("GCP_PROJECT_NUMBER", "987654")
+    return _make_handler(mock_storage)
+
+
+class TestCreateCloudTask:
+    """Tests for _create_cloud_task."""
+
+    def test_single_task(self, tasks_handler: MeetSessionHandler, mock_tasks_client: MagicMock):
+        tasks_handler._create_cloud_task("gmeet-1", "Google Meet 2024-01-15 10:00")
+
+        mock_tasks_client.create_task.assert_called_once()
+        request = mock_tasks_client.create_task.call_args.kwargs["request"]
+        assert request["parent"] == "queue-path"
+        http_request = request["task"]["http_request"]
+        assert http_request["url"] == "https://example.com/api/transcripts/process/gmeet-1"
+        assert http_request["oidc_token"]["service_account_email"] == (
+            "987654-compute@developer.gserviceaccount.com"
+        )
+
+    def test_error_is_raised(
+        self, tasks_handler: MeetSessionHandler, mock_tasks_client: MagicMock
+    ):
+        mock_tasks_client.create_task.side_effect = RuntimeError("quota")
+
+        with pytest.raises(RuntimeError, match="quota"):
+            tasks_handler._create_cloud_task("gmeet-1", "Title")
+
+    def test_queue_path_resolved_once(
+        self, tasks_handler: MeetSessionHandler, mock_tasks_client: MagicMock
+    ):
+        tasks_handler._create_cloud_task("gmeet-1", "A")
+        tasks_handler._create_cloud_task("gmeet-2", "B")
+
+        assert mock_tasks_client.create_task.call_count == 2
+        mock_tasks_client.queue_path.assert_called_once()
+
+    def test_no_project_skips(
+        self,
+        mock_storage: MagicMock,
+        mock_tasks_client: MagicMock,
+        monkeypatch: pytest.MonkeyPatch,
+    ):
+        monkeypatch.delenv("GOOGLE_CLOUD_PROJECT", raising=False)
+        handler = _make_handler(mock_storage)
+
+        handler._create_cloud_task("gmeet-1", "A")
+
+        mock_tasks_client.create_task.assert_not_called()
+
+
+class TestHandleTranscriptReady:
+    """Tests for handle_transcript_ready()."""
+
+    TRANSCRIPT_NAME = "conferenceRecords/abc/transcripts/def"
+
+    @pytest.fixture(autouse=True)
+    def _no_bucket(self, monkeypatch: pytest.MonkeyPatch):
+        monkeypatch.delenv("OUTPUT_BUCKET", raising=False)
+
+    @pytest.fixture
+    def meet_client(self, handler: MeetSessionHandler) -> MagicMock:
+        client = handler.meet_client
+        client.iter_transcript_entries.side_effect = lambda *_: iter([
+            {
+                "participant": "conferenceRecords/abc/participants/p1",
+                "text": "Hello",
+                "startTime": "2024-01-15T10:00:05Z",
+                "endTime": "2024-01-15T10:00:07Z",
+            }
+        ])
+        client.get_participants.return_value = [
+            {
+                "name": "conferenceRecords/abc/participants/p1",
+                "signedinUser": {"displayName": "Alice"},
+            }
+        ]
+        client.get_conference_record.return_value = {
+            "space": "spaces/xyz",
+            "startTime": "2024-01-15T10:00:00Z",
+            "endTime": "2024-01-15T11:00:00Z",
+        }
+        return client
+
+    def test_creates_meeting(
+        self, handler: MeetSessionHandler, meet_client: MagicMock, mock_storage: MagicMock
+    ):
+        meeting_id = handler.handle_transcript_ready("user-1", self.TRANSCRIPT_NAME, {})
+
+        assert meeting_id.startswith("gmeet-")
+        meet_client.get_participants.assert_called_once_with("user-1", "abc")
+        meet_client.get_conference_record.assert_called_once_with("user-1", "abc")
+        create_kwargs = mock_storage.create_meeting.call_args.kwargs
+        assert create_kwargs["bot_name"] == "Google Meet 2024-01-15 10:00"
+        assert create_kwargs["meeting_url"] == "spaces/xyz"
+
+    def test_metadata_failures_are_not_fatal(
+        self, handler: MeetSessionHandler, meet_client: MagicMock, mock_storage: MagicMock
+    ):
+        meet_client.get_participants.side_effect = ValueError("403")
+        meet_client.get_conference_record.side_effect = ValueError("403")
+
+        meeting_id = handler.handle_transcript_ready("user-1", self.TRANSCRIPT_NAME, {})
+
+        assert meeting_id.startswith("gmeet-")
+        assert mock_storage.create_meeting.call_args.kwargs["bot_name"] == "Google Meet abc"
+
+    def test_conference_meta_fetch_disabled(
+        self, handler: MeetSessionHandler, meet_client: MagicMock, mock_storage: MagicMock
+    ):
+        handler.fetch_conference_meta = False
+
+        handler.handle_transcript_ready("user-1", self.TRANSCRIPT_NAME, {})
+
+        meet_client.get_conference_record.assert_not_called()
+        assert mock_storage.create_meeting.call_args.kwargs["bot_name"] == "Google Meet abc"
+
+    def test_no_entries_raises(self, handler: MeetSessionHandler, meet_client: MagicMock):
+        meet_client.iter_transcript_entries.side_effect = lambda *_: iter([])
+
+        with pytest.raises(ValueError, match="No transcript entries"):
+            handler.handle_transcript_ready("user-1", self.TRANSCRIPT_NAME, {})
+
+
+class TestWriteJsonArray:
+    """Tests for _write_json_array()."""
+
+    def test_round_trip(self):
+        segments = [{"participant": "Alice", "text": "Hi"}, {"participant": "Bob", "text": "Yo"}]
+        buf = io.StringIO()
+
+        count = session_handler._write_json_array(buf, iter(segments))
+
+        assert count == 2
+        assert json.loads(buf.getvalue()) == segments
+
+    def test_empty(self):
+        buf = io.StringIO()
+
+        assert session_handler._write_json_array(buf, []) == 0
+        assert buf.getvalue() == "[]"
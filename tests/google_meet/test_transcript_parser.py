@@ -1,6 +1,7 @@
 """Tests for Google Meet transcript parser."""
 
 from meeting_transcription.google_meet.transcript_parser import (
+    iter_meet_transcript,
     meet_transcript_to_text,
     parse_meet_transcript,
 )
@@ -184,6 +185,60 @@ class TestParseMeetTranscript:
 
         assert result[0]["participant"] == "Guest 1"
 
+    def test_phone_participant(self):
+        entries = [
+            {
+                "participant": "conferenceRecords/abc/participants/p1",
+                "text": "Hello",
+                "startTime": "2024-01-15T10:00:00Z",
+                "endTime": "2024-01-15T10:00:02Z",
+            }
+        ]
+        participants = [
+            {
+                "name": "conferenceRecords/abc/participants/p1",
+                "phoneUser": {"displayName": "+1 555-0100"},
+            }
+        ]
+
+        result = parse_meet_transcript(entries, participants)
+
+        assert result[0]["participant"] == "+1 555-0100"
+
+
+class TestIterMeetTranscript:
+    """Tests for iter_meet_transcript()."""
+
+    def test_consumes_generator_lazily(self):
+        consumed = []
+
+        def entries():
+            for i, speaker in enumerate(["p1", "p1", "p2", "p3"]):
+                consumed.append(i)
+                yield {
+                    "participant": speaker,
+                    "text": f"Line {i}",
+                    "startTime": f"2024-01-15T10:00:0{i}Z",
+                    "endTime": f"2024-01-15T10:00:0{i + 1}Z",
+                }
+
+        participants = [
+            {"name": name, "signedinUser": {"displayName": name.upper()}}
+            for name in ("p1", "p2", "p3")
+        ]
+
+        segments = iter_meet_transcript(entries(), participants)
+        first = next(segments)
+
+        # The first segment is only complete once the speaker changes
+        assert first["text"] == "Line 0 Line 1"
+        assert first["end_timestamp"] == 2.0
+        assert consumed == [0, 1, 2]
+        assert [s["text"] for s in segments] == ["Line 2", "Line 3"]
+
+    def test_empty_iterable(self):
+        assert list(iter_meet_transcript(iter([]))) == []
+
 
 class TestMeetTranscriptToText:
     """Tests for meet_transcript_to_text()."""
@@ -2,8 +2,11 @@
 
 import base64
 import json
+from typing import ClassVar
+from unittest.mock import MagicMock
 
 import pytest
+from meeting_transcription.google_meet import webhook_handler
 from meeting_transcription.google_meet.webhook_handler import MeetWebhookHandler
 
 
@@ -20,6 +23,13 @@ def _make_push_message(event_data: dict, subscription: str = "") -> dict:
     }
 
 
+@pytest.fixture(autouse=True)
+def _clear_recent_messages():
+    webhook_handler._recent_messages.clear()
+    yield
+    webhook_handler._recent_messages.clear()
+
+
 class TestMeetWebhookHandler:
     """Tests for MeetWebhookHandler."""
 
@@ -84,6 +94,43 @@ class TestMeetWebhookHandler:
         with pytest.raises(ValueError, match="Failed to decode"):
             handler.handle_push_message(msg)
 
+    def test_wrapped_base64_accepted(self):
+        handler = MeetWebhookHandler()
+        event = json.dumps({"eventType": "other", "pad": "x" * 100}).encode()
+        data = base64.encodebytes(event).decode()  # newline every 76 chars
+
+        result = handler.handle_push_message({"message": {"data": data}})
+
+        assert result["status"] == "skipped"
+
+    @pytest.mark.parametrize(
+        "data",
+        [base64.b64encode(b"not json").decode(), "bm90IGpzb24=\u00e9"],
+        ids=["invalid-json", "non-ascii"],
+    )
+    def test_undecodable_payload_raises(self, data):
+        handler = MeetWebhookHandler()
+
+        with pytest.raises(ValueError, match="Failed to decode"):
+            handler.handle_push_message({"message": {"data": data}})
+
+    def test_non_object_payload_raises(self):
+        handler = MeetWebhookHandler()
+        data = base64.b64encode(b'["not", "an", "object"]').decode()
+
+        with pytest.raises(ValueError, match="not a JSON object"):
+            handler.handle_push_message({"message": {"data": data}})
+
+    def test_null_transcript_treated_as_missing(self):
+        event_data = {
+            "eventType": "google.workspace.meet.transcript.v2.fileGenerated",
+            "event": {"transcript": None},
+        }
+
+        result = MeetWebhookHandler().handle_push_message(_make_push_message(event_data))
+
+        assert result["status"] == "error"
+
     def test_transcript_without_name(self):
         handler = MeetWebhookHandler()
 
@@ -136,3 +183,129 @@ class TestPushMessageFormat:
         result = handler.handle_push_message(_make_push_message(event_data))
 
         assert result["conference_record_id"] == "my-conf-id"
+
+    @pytest.mark.parametrize(
+        ("transcript_name", "expected"),
+        [("conferenceRecords/abc", "abc"), ("conferenceRecords", "")],
+    )
+    def test_conference_record_id_short_names(self, transcript_name, expected):
+        event_data = {
+            "eventType": "google.workspace.meet.transcript.v2.fileGenerated",
+            "event": {"transcript": {"name": transcript_name}},
+        }
+
+        result = MeetWebhookHandler().handle_push_message(_make_push_message(event_data))
+
+        assert result["conference_record_id"] == expected
+
+
+class TestResolveUserFromSubscription:
+    """Tests for _resolve_user_from_subscription()."""
+
+    @pytest.fixture(autouse=True)
+    def _clear_cache(self):
+        webhook_handler._subscription_users.clear()
+        yield
+        webhook_handler._subscription_users.clear()
+
+    @pytest.fixture
+    def db(self, monkeypatch: pytest.MonkeyPatch) -> MagicMock:
+        db = MagicMock()
+        query = db.collection.return_value.where.return_value.limit.return_value
+        query.stream.side_effect = lambda: iter([MagicMock(id="user-1")])
+        monkeypatch.setattr(webhook_handler, "_firestore_client", db)
+        return db
+
+    def test_lookup_is_cached(self, db: MagicMock):
+        handler = MeetWebhookHandler()
+
+        assert handler._resolve_user_from_subscription("sub-1") == "user-1"
+        assert handler._resolve_user_from_subscription("sub-1") == "user-1"
+        db.collection.assert_called_once_with("google_meet_subscriptions")
+
+    def test_forget_user_invalidates(self, db: MagicMock):
+        handler = MeetWebhookHandler()
+        handler._resolve_user_from_subscription("sub-1")
+
+        webhook_handler.forget_subscription_user("user-1")
+        handler._resolve_user_from_subscription("sub-1")
+
+        assert db.collection.call_count == 2
+
+    def test_misses_are_not_cached(self, db: MagicMock):
+        query = db.collection.return_value.where.return_value.limit.return_value
+        query.stream.side_effect = lambda: iter([])
+        handler = MeetWebhookHandler()
+
+        assert handler._resolve_user_from_subscription("sub-new") is None
+        assert handler._resolve_user_from_subscription("sub-new") is None
+        assert db.collection.call_count == 2
+
+    def test_no_firestore_returns_none(self, monkeypatch: pytest.MonkeyPatch):
+        monkeypatch.setattr(webhook_handler, "_firestore_client", None)
+        monkeypatch.delenv("GOOGLE_CLOUD_PROJECT", raising=False)
+
+        assert MeetWebhookHandler()._resolve_user_from_subscription("sub-1") is None
+
+
+class TestSubscriptionUserCache:
+    """Tests for the subscription -> user LRU."""
+
+    def test_evicts_least_recently_used(self):
+        cache = webhook_handler._SubscriptionUserCache(maxsize=2)
+        cache.put("a", "u1")
+        cache.put("b", "u2")
+        cache.get("a")
+        cache.put("c", "u3")
+
+        assert cache.get("a") == "u1"
+        assert cache.get("b") is None
+        assert cache.get("c") == "u3"
+
+    def test_expired_entries_dropped(self):
+        cache = webhook_handler._SubscriptionUserCache(ttl=0)
+        cache.put("a", "u1")
+
+        assert cache.get("a") is None
+
+
+class TestDuplicateDelivery:
+    """Tests for messageId-based redelivery dedup."""
+
+    EVENT: ClassVar[dict] = {
+        "eventType": "google.workspace.meet.transcript.v2.fileGenerated",
+        "event": {"transcript": {"name": "conferenceRecords/abc/transcripts/def"}},
+    }
+
+    def test_redelivery_skipped(self):
+        handler = MeetWebhookHandler()
+        msg = _make_push_message(self.EVENT)
+
+        assert handler.handle_push_message(msg)["status"] == "processed"
+        assert handler.handle_push_message(msg)["status"] == "duplicate"
+
+    def test_failed_message_can_be_retried(self, monkeypatch: pytest.MonkeyPatch):
+        handler = MeetWebhookHandler()
+        msg = _make_push_message(self.EVENT)
+        monkeypatch.setattr(
+            handler, "_resolve_user_from_subscription", MagicMock(side_effect=RuntimeError("down"))
+        )
+
+        with pytest.raises(RuntimeError):
+            handler.handle_push_message(msg)
+        monkeypatch.setattr(handler, "_resolve_user_from_subscription", lambda _sub: None)
+
+        assert handler.handle_push_message(msg)["status"] == "processed"
+
+    def test_recent_ids_bounded(self):
+        recent = webhook_handler._RecentMessageIds(maxsize=2)
+
+        assert recent.add("a") and recent.add("b") and recent.add("c")
+        assert recent.add("a") is True
+        assert recent.add("c") is False
+
+    def test_recent_ids_expire(self):
+        recent = webhook_handler._RecentMessageIds(ttl=0)
+
+        assert recent.add("a") is True
+        assert recent.add("a") is True
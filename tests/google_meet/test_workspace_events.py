@@ -0,0 +1,300 @@
+"""Tests for Workspace Events subscription management."""
+
+import threading
+from datetime import UTC, datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import MagicMock, patch
+
+import pytest
+from meeting_transcription.google_meet import workspace_events
+from meeting_transcription.google_meet.workspace_events import WorkspaceEventsManager
+
+
+@pytest.fixture(autouse=True)
+def in_memory_store(monkeypatch: pytest.MonkeyPatch) -> dict:
+    """Keep subscription storage in memory."""
+    subs: dict = {}
+    monkeypatch.setattr(workspace_events, "_firestore_client", None)
+    monkeypatch.setattr(workspace_events, "_in_memory_subs", subs)
+    monkeypatch.delenv("GOOGLE_CLOUD_PROJECT", raising=False)
+    return subs
+
+
+@pytest.fixture
+def session(monkeypatch: pytest.MonkeyPatch) -> MagicMock:
+    """Shared HTTP session stub."""
+    session = MagicMock()
+    monkeypatch.setattr(workspace_events, "_session", session)
+    return session
+
+
+@pytest.fixture
+def manager() -> WorkspaceEventsManager:
+    """Manager with a stubbed OAuth flow."""
+    with patch.object(workspace_events, "GoogleOAuthFlow") as flow_cls:
+        flow_cls.return_value.get_valid_access_token.return_value = "token"
+        return WorkspaceEventsManager()
+
+
+class TestSession:
+    """Tests for the shared Workspace Events session."""
+
+    def test_session_not_built_for_storage_only_paths(
+        self, monkeypatch: pytest.MonkeyPatch, manager: WorkspaceEventsManager, in_memory_store: dict
+    ):
+        monkeypatch.setattr(workspace_events, "_session", None)
+        in_memory_store["user-1"] = {"name": "subscriptions/abc"}
+
+        assert manager.is_subscribed("user-1")
+        assert manager.get_subscription("user-1") == {"name": "subscriptions/abc"}
+        assert workspace_events._session is None
+
+    def test_session_is_shared(self, monkeypatch: pytest.MonkeyPatch):
+        monkeypatch.setattr(workspace_events, "_session", None)
+
+        assert workspace_events._get_session() is workspace_events._get_session()
+
+
+class TestDeleteSubscription:
+    """Tests for delete_subscription()."""
+
+    def test_deletes_remote_and_local(
+        self, manager: WorkspaceEventsManager, session: MagicMock, in_memory_store: dict
+    ):
+        in_memory_store["user-1"] = {"name": "subscriptions/abc"}
+        session.delete.return_value.status_code = 200
+
+        assert manager.delete_subscription("user-1") is True
+        assert session.delete.call_args.args[0].endswith("/subscriptions/abc")
+        assert session.delete.call_args.kwargs["headers"] == {"Authorization": "Bearer token"}
+        assert "user-1" not in in_memory_store
+
+    def test_already_deleted_is_ok(
+        self, manager: WorkspaceEventsManager, session: MagicMock, in_memory_store: dict
+    ):
+        in_memory_store["user-1"] = {"name": "subscriptions/abc"}
+        session.delete.return_value.status_code = 404
+
+        assert manager.delete_subscription("user-1") is True
+
+    def test_persistent_503_returns_false_and_clears_local(
+        self, monkeypatch: pytest.MonkeyPatch, manager: WorkspaceEventsManager, in_memory_store: dict
+    ):
+        requests_seen = []
+
+        class _Unavailable(BaseHTTPRequestHandler):
+            def do_DELETE(self):
+                requests_seen.append(self.path)
+                self.send_response(503)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+
+            def log_message(self, *args):
+                pass
+
+        server = ThreadingHTTPServer(("127.0.0.1", 0), _Unavailable)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        try:
+            # Real session and retry policy, pointed at the local server
+            monkeypatch.setattr(workspace_events, "_session", None)
+            session = workspace_events._get_session()
+            session.trust_env = False
+            session.mount("http://", session.get_adapter(workspace_events.WORKSPACE_EVENTS_API))
+            monkeypatch.setattr(
+                workspace_events, "WORKSPACE_EVENTS_API", f"http://127.0.0.1:{server.server_port}"
+            )
+            monkeypatch.setattr("urllib3.util.retry.time.sleep", lambda _seconds: None)
+            in_memory_store["user-1"] = {"name": "subscriptions/abc"}
+
+            assert manager.delete_subscription("user-1") is False
+        finally:
+            server.shutdown()
+            server.server_close()
+
+        assert len(requests_seen) == 4
+        assert "user-1" not in in_memory_store
+
+
+class TestRenewMany:
+    """Tests for the bulk renewal behind renew_expiring_subscriptions()."""
+
+    @pytest.fixture(autouse=True)
+    def expiring(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        items = [(f"user-{i}", {"name": f"subscriptions/{i}"}) for i in range(1, 4)]
+        monkeypatch.setattr(workspace_events, "iter_expiring_subscriptions", lambda hours: iter(items))
+
+    def test_renews_each_user(self, manager: WorkspaceEventsManager, in_memory_store: dict):
+        with patch.object(
+            manager, "renew_subscription", side_effect=lambda uid, sub, store: {"name": f"sub-{uid}"}
+        ):
+            result = manager.renew_expiring_subscriptions()
+
+        assert result == {f"user-{i}": {"name": f"sub-user-{i}"} for i in range(1, 4)}
+        assert in_memory_store["user-2"]["name"] == "sub-user-2"
+
+    def test_failures_are_isolated(self, manager: WorkspaceEventsManager):
+        def renew(user_id, sub, store):
+            if user_id == "user-2":
+                raise ValueError("User has not connected their Google account")
+            return {"name": user_id}
+
+        with patch.object(manager, "renew_subscription", side_effect=renew):
+            result = manager.renew_expiring_subscriptions()
+
+        assert result == {"user-1": {"name": "user-1"}, "user-2": None, "user-3": {"name": "user-3"}}
+
+    def test_empty(self, manager: WorkspaceEventsManager, monkeypatch: pytest.MonkeyPatch):
+        monkeypatch.setattr(workspace_events, "iter_expiring_subscriptions", lambda hours: iter([]))
+
+        assert manager.renew_expiring_subscriptions() == {}
+
+
+class TestExpiringSubscriptions:
+    """Tests for iter_expiring_subscriptions() / renew_expiring_subscriptions()."""
+
+    @pytest.fixture
+    def subs(self, in_memory_store: dict) -> dict:
+        now = datetime.now(UTC)
+        in_memory_store.update(
+            {
+                "soon": {"name": "subscriptions/soon", "expireTime": _rfc3339(now + timedelta(hours=2))},
+                "later": {"name": "subscriptions/later", "expireTime": _rfc3339(now + timedelta(days=5))},
+                "no-expiry": {"name": "subscriptions/none"},
+            }
+        )
+        return in_memory_store
+
+    def test_in_memory_filter(self, subs: dict):
+        result = dict(workspace_events.iter_expiring_subscriptions(horizon_hours=24))
+
+        assert list(result) == ["soon"]
+
+    def test_firestore_query(self, monkeypatch: pytest.MonkeyPatch):
+        db = MagicMock()
+        doc = MagicMock(id="user-1")
+        doc.to_dict.return_value = {"name": "subscriptions/abc"}
+        db.collection.return_value.where.return_value.stream.return_value = iter([doc])
+        monkeypatch.setattr(workspace_events, "_firestore_client", db)
+
+        result = list(workspace_events.iter_expiring_subscriptions())
+
+        assert result == [("user-1", {"name": "subscriptions/abc"})]
+        field, op, cutoff = db.collection.return_value.where.call_args.args
+        assert (field, op) == ("expire_at", "<")
+        assert isinstance(cutoff, datetime)
+        assert cutoff.tzinfo is not None
+
+    def test_in_memory_filter_mixed_precision(self, in_memory_store: dict):
+        # As strings, "...:00.5Z" sorts before "...:00Z"; parsed, it's later
+        cutoff = (datetime.now(UTC) + timedelta(hours=24)).replace(microsecond=0)
+        nanos = cutoff - timedelta(seconds=1)
+        offset = (cutoff - timedelta(hours=1)).astimezone(timezone(timedelta(hours=2)))
+        fraction = cutoff + timedelta(hours=1)
+        in_memory_store.update(
+            {
+                "nanos": {"expireTime": nanos.strftime("%Y-%m-%dT%H:%M:%S.123456789Z")},
+                "offset": {"expireTime": offset.isoformat()},
+                "fraction": {"expireTime": fraction.strftime("%Y-%m-%dT%H:%M:%S.5Z")},
+            }
+        )
+
+        result = dict(workspace_events.iter_expiring_subscriptions(horizon_hours=24))
+
+        assert sorted(result) == ["nanos", "offset"]
+
+    def test_renews_with_loaded_subscription(self, manager: WorkspaceEventsManager, subs: dict):
+        stored = subs["soon"]
+        with patch.object(manager, "renew_subscription", return_value={"name": "new"}) as renew:
+            result = manager.renew_expiring_subscriptions()
+
+        assert result == {"soon": {"name": "new"}}
+        renew.assert_called_once_with("soon", stored, store=False)
+        assert subs["soon"] == {"name": "new"}
+
+
+def _rfc3339(dt: datetime) -> str:
+    return dt.strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+class TestSubscriptionStorage:
+    """Tests for the Firestore-backed subscription helpers."""
+
+    def test_client_created_once(self, monkeypatch: pytest.MonkeyPatch):
+        firestore = MagicMock()
+        monkeypatch.setattr(workspace_events, "firestore", firestore, raising=False)
+        monkeypatch.setattr(workspace_events, "HAS_FIRESTORE", True)
+        monkeypatch.setenv("GOOGLE_CLOUD_PROJECT", "test-project")
+
+        workspace_events._store_subscription("user-1", {"name": "subscriptions/abc"})
+        workspace_events._get_stored_subscription("user-1")
+        workspace_events._delete_stored_subscription("user-1")
+
+        firestore.Client.assert_called_once_with()
+        collection = firestore.Client.return_value.collection
+        assert collection.call_count == 3
+
+
+class TestIsSubscribed:
+    """Tests for is_subscribed()."""
+
+    @pytest.mark.parametrize(
+        ("expire_time", "expected"),
+        [
+            ("2999-01-01T00:00:00Z", True),
+            ("2999-01-01T00:00:00.123456789Z", True),
+            ("2000-01-01T00:00:00.5Z", False),
+            ("not-a-date", True),
+        ],
+    )
+    def test_expiry(
+        self, manager: WorkspaceEventsManager, in_memory_store: dict, expire_time, expected
+    ):
+        in_memory_store["user-1"] = {"name": "subscriptions/abc", "expireTime": expire_time}
+
+        assert manager.is_subscribed("user-1") is expected
+
+    def test_not_subscribed(self, manager: WorkspaceEventsManager):
+        assert manager.is_subscribed("user-1") is False
+
+
+class TestStoreSubscriptionsBulk:
+    """Tests for _store_subscriptions_bulk()."""
+
+    def test_batches_of_500(self, monkeypatch: pytest.MonkeyPatch):
+        db = MagicMock()
+        monkeypatch.setattr(workspace_events, "_firestore_client", db)
+
+        workspace_events._store_subscriptions_bulk(
+            [(f"user-{i}", {"name": f"subscriptions/{i}"}) for i in range(501)]
+        )
+
+        assert db.batch.call_count == 2
+        assert db.batch.return_value.set.call_count == 501
+        assert db.batch.return_value.commit.call_count == 2
+
+    def test_stores_expiry_timestamp(self, monkeypatch: pytest.MonkeyPatch):
+        db = MagicMock()
+        monkeypatch.setattr(workspace_events, "_firestore_client", db)
+
+        workspace_events._store_subscriptions_bulk(
+            [
+                ("user-1", {"expireTime": "2030-01-01T00:00:00Z"}),
+                ("user-2", {"expireTime": "2030-01-01T00:00:00.123456789Z"}),
+                ("user-3", {"expireTime": "2030-01-01T02:00:00.5+02:00"}),
+                ("user-4", {"name": "subscriptions/none"}),
+            ]
+        )
+
+        records = [c.args[1] for c in db.batch.return_value.set.call_args_list]
+        assert [r.get("expire_at") for r in records] == [
+            datetime(2030, 1, 1, tzinfo=UTC),
+            datetime(2030, 1, 1, 0, 0, 0, 123456, tzinfo=UTC),
+            datetime(2030, 1, 1, 0, 0, 0, 500000, tzinfo=UTC),
+            None,
+        ]
+        assert records[1]["expireTime"] == "2030-01-01T00:00:00.123456789Z"
+
+    def test_in_memory(self, in_memory_store: dict):
+        workspace_events._store_subscriptions_bulk([("user-1", {"name": "subscriptions/abc"})])
+
+        assert in_memory_store == {"user-1": {"name": "subscriptions/abc"}}
@@ -0,0 +1,142 @@
+"""
+Tests for BasePromptablePlugin helpers.
+
+Test coverage:
+- Transcript formatting for the extraction prompt
+- Response schema resolved once per plugin instance; chunker built per run
+- chunks.json and summary.json written indented
+- chunks.json skipped when should_save_chunks() is False
+"""
+
+import json
+
+from meeting_transcription.pipeline.core import base_promptable_plugin
+from meeting_transcription.pipeline.core.base_promptable_plugin import BasePromptablePlugin
+
+
+class _Plugin(BasePromptablePlugin):
+    def get_extraction_prompt(self, transcript_text, metadata):
+        return transcript_text
+
+    def process_llm_response(self, llm_response, output_dir, metadata):
+        return {}
+
+
+def _segment(name, start, text):
+    return {'participant': {'name': name}, 'start_timestamp': {'relative': start}, 'text': text}
+
+
+class TestFormatTranscriptForPrompt:
+    """Tests for _format_transcript_for_prompt()."""
+
+    def test_formats_all_chunks(self):
+        chunked = {
+            'chunks': [
+                {'segments': [_segment('Ana', 0, 'Hi'), _segment('Ben', 65.9, 'Hello')]},
+                {'segments': [_segment('Ana', 3725.2, 'Bye')]},
+                {},
+            ]
+        }
+
+        text = _Plugin()._format_transcript_for_prompt(chunked)
+
+        assert text == "[00:00] Ana: Hi\n[01:05] Ben: Hello\n[62:05] Ana: Bye"
+
+    def test_empty(self):
+        assert _Plugin()._format_transcript_for_prompt({'chunks': []}) == ""
+
+    def test_offsets_outside_lookup_table(self):
+        chunked = {'chunks': [{'segments': [_segment('Ana', 7199.9, 'a'), _segment('Ana', 7200, 'b')]}]}
+
+        text = _Plugin()._format_transcript_for_prompt(chunked)
+
+        assert text == "[119:59] Ana: a\n[120:00] Ana: b"
+
+
+class TestCachedHooks:
+    """Tests for the per-instance schema cache."""
+
+    def test_chunker_built_per_run(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(base_promptable_plugin, 'get_llm_client', _FakeLLMClient)
+        chunkers = []
+
+        class _CountingPlugin(_Plugin):
+            def get_chunker(self):
+                chunkers.append(super().get_chunker())
+                return chunkers[-1]
+
+        segment = _segment('Ana', 0, 'Hi')
+        segment['end_timestamp'] = {'relative': 60}
+        transcript_path = tmp_path / "transcript.json"
+        transcript_path.write_text(json.dumps([segment]))
+        plugin = _CountingPlugin()
+
+        plugin.process_transcript(str(transcript_path), str(tmp_path), {})
+        plugin.process_transcript(str(transcript_path), str(tmp_path), {})
+
+        assert len(chunkers) == 2
+        assert chunkers[0] is not chunkers[1]
+
+    def test_response_schema_resolved_once(self):
+        calls = []
+
+        class _SchemaPlugin(_Plugin):
+            def get_response_schema(self):
+                calls.append(1)
+                return None
+
+        plugin = _SchemaPlugin()
+
+        assert plugin._response_schema is None
+        assert plugin._response_schema is None
+        assert len(calls) == 1
+
+
+class _FakeLLMClient:
+    """Stands in for the LLM client; free-form calls return a fixed object."""
+
+    def __init__(self, model=None):
+        self.model = model or "anthropic:test"
+        self.last_usage = {}
+
+    def call(self, prompt, max_tokens, temperature, cache_prompt):
+        return '{"ok": true}'
+
+
+class TestProcessTranscriptOutput:
+    """Tests for the JSON files written by process_transcript()."""
+
+    def _run(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(base_promptable_plugin, 'get_llm_client', _FakeLLMClient)
+        segment = _segment('Ana', 0, 'Hi')
+        segment['end_timestamp'] = {'relative': 60}
+        transcript_path = tmp_path / "transcript.json"
+        transcript_path.write_text(json.dumps([segment]))
+
+        _Plugin().process_transcript(str(transcript_path), str(tmp_path), {'title': 'T'})
+
+        return (tmp_path / "chunks.json").read_text(), (tmp_path / "summary.json").read_text()
+
+    def test_written_indented(self, tmp_path, monkeypatch):
+        chunks, summary = self._run(tmp_path, monkeypatch)
+
+        assert chunks.startswith('{\n  "metadata"')
+        assert summary.startswith('{\n  "metadata"')
+        assert json.loads(summary)['llm_response'] == {'ok': True}
+        assert json.loads(summary)['metadata']['chunking'] == {'strategy': 'whole_session', 'total_chunks': 1}
+        assert json.loads(chunks)['metadata']['chunk_strategy'] == 'whole_session'
+
+    def test_chunks_not_saved_when_disabled(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(base_promptable_plugin, 'get_llm_client', _FakeLLMClient)
+        monkeypatch.setattr(_Plugin, 'should_save_chunks', lambda self: False)
+        segment = _segment('Ana', 0, 'Hi')
+        segment['end_timestamp'] = {'relative': 60}
+        transcript_path = tmp_path / "transcript.json"
+        transcript_path.write_text(json.dumps([segment]))
+
+        outputs = _Plugin().process_transcript(str(transcript_path), str(tmp_path), {})
+
+        assert 'chunks' not in outputs
+        assert not (tmp_path / "chunks.json").exists()
+        assert (tmp_path / "summary.json").exists()
+
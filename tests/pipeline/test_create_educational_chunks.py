@@ -0,0 +1,133 @@
+"""
+Tests for create_educational_chunks module.
+
+Test coverage:
+- Time-window chunking with instructor/student word split
+- Segments overlapping several windows appear in each
+- Participant statistics gathered alongside the chunks
+- EducationalTimeBasedChunker metadata
+- create_educational_content_chunks file output (always indented)
+"""
+
+import json
+
+from meeting_transcription.pipeline.chunkers.educational_chunker import (
+    EducationalTimeBasedChunker,
+)
+from meeting_transcription.pipeline.create_educational_chunks import (
+    create_educational_chunks,
+    create_educational_chunks_with_stats,
+    create_educational_content_chunks,
+)
+
+
+def _segment(name, start, end, words, text="..."):
+    return {
+        'participant': {'name': name},
+        'start_timestamp': {'relative': start, 'absolute': None},
+        'end_timestamp': {'relative': end, 'absolute': None},
+        'word_count': words,
+        'text': text,
+    }
+
+
+TRANSCRIPT = [
+    _segment('Prof', 0, 300, 500, "Welcome to class"),
+    _segment('Ana', 300, 330, 20, "Question?"),
+    _segment('Prof', 330, 900, 800, "Answer"),
+]
+
+
+class TestCreateEducationalChunksWithStats:
+    """Tests for create_educational_chunks_with_stats()."""
+
+    def test_chunks_and_stats(self):
+        chunks, participants = create_educational_chunks_with_stats(TRANSCRIPT, 'Prof', 10)
+
+        assert [c['total_words'] for c in chunks] == [1320, 800]
+        assert chunks[0]['instructor_words'] == 1300
+        assert chunks[0]['student_speakers'] == ['Ana']
+        assert chunks[0]['segments'][1] == {
+            'speaker': 'Ana',
+            'is_instructor': False,
+            'text': "Question?",
+            'timestamp': "05:00",
+            'word_count': 20,
+            'start_seconds': 300,
+            'end_seconds': 330,
+        }
+        assert participants == {
+            'Prof': {'name': 'Prof', 'is_instructor': True, 'total_words': 1300, 'total_segments': 2},
+            'Ana': {'name': 'Ana', 'is_instructor': False, 'total_words': 20, 'total_segments': 1},
+        }
+
+    def test_matches_create_educational_chunks(self):
+        chunks, _ = create_educational_chunks_with_stats(TRANSCRIPT, 'Prof', 5)
+
+        assert chunks == create_educational_chunks(TRANSCRIPT, 'Prof', 5)
+
+    def test_segment_spanning_windows(self):
+        transcript = [
+            _segment('Prof', 0, 1250, 900, "Long lecture"),
+            _segment('Ana', 600, 610, 5, "Exactly at a boundary"),
+            _segment('Prof', 1250, 1300, 30, "Wrap up"),
+        ]
+
+        chunks, _ = create_educational_chunks_with_stats(transcript, 'Prof', 10)
+
+        assert [c['time_range'] for c in chunks] == ["00:00 - 10:00", "10:00 - 20:00", "20:00 - 21:40"]
+        assert [[s['text'] for s in c['segments']] for c in chunks] == [
+            ["Long lecture"],
+            ["Long lecture", "Exactly at a boundary"],
+            ["Long lecture", "Wrap up"],
+        ]
+        assert chunks[0]['segments'][0] is not chunks[1]['segments'][0]
+
+    def test_empty(self):
+        assert create_educational_chunks_with_stats([], 'Prof') == ([], {})
+
+
+class TestEducationalTimeBasedChunker:
+    """Tests for EducationalTimeBasedChunker.chunk_transcript()."""
+
+    def test_metadata(self):
+        chunker = EducationalTimeBasedChunker(chunk_minutes=10)
+
+        result = chunker.chunk_transcript(TRANSCRIPT)
+
+        metadata = result['metadata'].additional_metadata
+        assert metadata['instructor'] == 'Prof'
+        assert metadata['total_participants'] == 2
+        assert metadata['participants'][0]['total_segments'] == 2
+        assert chunker.get_chunk_count() == len(result['chunks']) == 2
+
+
+class TestCreateEducationalContentChunks:
+    """Tests for create_educational_content_chunks()."""
+
+    def test_writes_chunks_and_participants(self, tmp_path):
+        input_file = tmp_path / "combined.json"
+        output_file = tmp_path / "chunks.json"
+        input_file.write_text(json.dumps(TRANSCRIPT))
+
+        create_educational_content_chunks(str(input_file), str(output_file), 10)
+
+        output = json.loads(output_file.read_text())
+        assert output['chunks'] == create_educational_chunks(TRANSCRIPT, 'Prof', 10)
+        assert output['metadata']['instructor'] == 'Prof'
+        assert output['metadata']['total_words'] == 2120
+        assert output['metadata']['participants'] == [
+            {'name': 'Prof', 'is_instructor': True, 'total_words': 1300, 'speaking_turns': 2},
+            {'name': 'Ana', 'is_instructor': False, 'total_words': 20, 'speaking_turns': 1},
+        ]
+        assert (tmp_path / "chunks_sample.txt").exists()
+
+    def test_output_indented(self, tmp_path):
+        input_file = tmp_path / "combined.json"
+        output_file = tmp_path / "chunks.json"
+        input_file.write_text(json.dumps(TRANSCRIPT))
+
+        create_educational_content_chunks(str(input_file), str(output_file), 10)
+        text = output_file.read_text()
+
+        assert text == json.dumps(json.loads(text), ensure_ascii=False, indent=2)
@@ -0,0 +1,138 @@
+"""
+Tests for create_study_guide module.
+
+Test coverage:
+- Q&A consolidation (near-duplicate questions dropped, order kept)
+- Markdown study guide output and its summary log line
+- Concepts and tools merged across chunks in the markdown guide
+- In-memory summary used instead of the file, and left unchanged
+"""
+
+import json
+import logging
+
+from meeting_transcription.pipeline.create_study_guide import (
+    consolidate_qa_exchanges,
+    create_markdown_study_guide,
+)
+
+
+def _qa(question):
+    return {'question': question, 'answer_summary': '...'}
+
+
+class TestConsolidateQaExchanges:
+    """Tests for consolidate_qa_exchanges()."""
+
+    def test_near_duplicates_dropped(self):
+        qa = [
+            _qa("How do I configure the vector database index?"),
+            _qa("What is a transformer?"),
+            _qa("how do I configure the vector database index?"),
+            _qa("So how do I configure the vector database index?"),
+        ]
+
+        result = consolidate_qa_exchanges(qa)
+
+        assert result == qa[:2]
+
+    def test_partial_overlap_kept(self):
+        qa = [
+            _qa("What is a transformer model?"),
+            _qa("What is a diffusion model?"),
+        ]
+
+        assert consolidate_qa_exchanges(qa) == qa
+
+    def test_compares_against_all_earlier_questions(self):
+        qa = [_qa(f"question number {i} about topic {i}") for i in range(50)]
+        qa.append(_qa("question number 7 about topic 7"))
+
+        assert len(consolidate_qa_exchanges(qa)) == 50
+
+    def test_blank_questions(self):
+        qa = [_qa(""), {'answer_summary': 'no question'}, _qa("Real question here")]
+
+        assert consolidate_qa_exchanges(qa) == [qa[0], qa[2]]
+
+
+class TestCreateMarkdownStudyGuide:
+    """Tests for create_markdown_study_guide()."""
+
+    def test_writes_markdown(self, tmp_path, caplog):
+        summary = {
+            'metadata': {'instructor': 'Prof'},
+            'overall_summary': {'class_metadata': {'topic': 'Intro to RAG'}},
+            'chunk_analyses': [
+                {
+                    'chunk_number': 1,
+                    'time_range': '00:00 - 10:00',
+                    'main_theme': 'Retrieval',
+                    'qa_exchanges': [{'question': 'What is RAG?', 'answer_summary': 'Retrieval.'}],
+                }
+            ],
+        }
+        summary_file = tmp_path / "summary.json"
+        summary_file.write_text(json.dumps(summary))
+        output_file = tmp_path / "guide.md"
+
+        with caplog.at_level(logging.INFO, logger="meeting_transcription.pipeline.create_study_guide"):
+            create_markdown_study_guide(str(summary_file), str(output_file))
+
+        assert "1 Q&A exchanges, 1 time segments" in caplog.text
+        content = output_file.read_text()
+        assert content.startswith("# Intro to RAG\n\n## Class Information\n")
+        assert "### Q1: What is RAG?" in content
+        assert content.endswith("*\n")
+
+    def test_merges_concepts_and_tools_across_chunks(self, tmp_path):
+        chunks = [
+            {
+                'chunk_number': n,
+                'time_range': f'{n}0:00',
+                'key_concepts': [{'name': 'Embeddings', 'definition': 'Vectors'}],
+                'tools_frameworks': [{'name': 'FAISS', 'context': f'ctx {n}'}],
+            }
+            for n in (1, 2)
+        ]
+        summary_file = tmp_path / "summary.json"
+        summary_file.write_text(json.dumps({'chunk_analyses': chunks}))
+        output_file = tmp_path / "guide.md"
+
+        create_markdown_study_guide(str(summary_file), str(output_file))
+
+        content = output_file.read_text()
+        assert content.count("| **FAISS** | ctx 1 |") == 1
+        assert "ctx 2" not in content
+        assert content.count("### 1. Embeddings") == 1
+        assert "*Covered in: Chunk(s) 1, 2*" in content
+
+    def test_null_sections(self, tmp_path):
+        summary = {'metadata': None, 'overall_summary': {'class_metadata': None}, 'action_items': None}
+        summary_file = tmp_path / "summary.json"
+        summary_file.write_text(json.dumps(summary))
+        output_file = tmp_path / "guide.md"
+
+        create_markdown_study_guide(str(summary_file), str(output_file))
+
+        content = output_file.read_text()
+        assert content.startswith("# AI Solutions Architect Class\n")
+        assert "- **Instructor**: Unknown" in content
+
+    def test_summary_data_used_instead_of_file(self, tmp_path):
+        summary = {'overall_summary': {'class_metadata': {'topic': 'In Memory'}}}
+        output_file = tmp_path / "guide.md"
+
+        create_markdown_study_guide(str(tmp_path / "missing.json"), str(output_file), summary_data=summary)
+
+        assert output_file.read_text().startswith("# In Memory\n")
+
+    def test_summary_data_not_mutated(self, tmp_path):
+        qa = {'question': 'What is RAG?', 'answer_summary': 'Retrieval.'}
+        summary = {'chunk_analyses': [{'chunk_number': 1, 'time_range': '00:00', 'qa_exchanges': [qa]}]}
+        output_file = tmp_path / "guide.md"
+
+        create_markdown_study_guide(str(tmp_path / "missing.json"), str(output_file), summary_data=summary)
+
+        assert "### Q1: What is RAG?" in output_file.read_text()
+        assert qa == {'question': 'What is RAG?', 'answer_summary': 'Retrieval.'}
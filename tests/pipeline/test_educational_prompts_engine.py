@@ -0,0 +1,37 @@
+"""
+Tests for EducationalPromptEngine.
+
+Test coverage:
+- Overall summary prompt lists every chunk analysis in order
+- Non-ASCII text is embedded as-is rather than escaped
+"""
+
+import json
+
+from meeting_transcription.pipeline.core import ContentType, PromptContext
+from meeting_transcription.pipeline.prompts import EducationalPromptEngine
+
+
+class TestCreateOverallSummaryPrompt:
+    """Tests for create_overall_summary_prompt()."""
+
+    def test_includes_each_chunk_in_order(self):
+        analyses = [{'chunk_number': 1, 'main_theme': 'RAG'}, {'chunk_number': 2, 'main_theme': 'Agents'}]
+        context = PromptContext(content_type=ContentType.EDUCATIONAL, session_metadata={'instructor': 'Ana'})
+
+        prompt = EducationalPromptEngine().create_overall_summary_prompt(analyses, context)
+
+        first = f"\n=== CHUNK 1 ===\n{json.dumps(analyses[0], indent=2)}\n"
+        second = f"\n=== CHUNK 2 ===\n{json.dumps(analyses[1], indent=2)}\n"
+        assert first + second in prompt
+        assert "You have analyzed 2 chunks" in prompt
+        assert '"instructor": "Ana"' in prompt
+
+    def test_non_ascii_is_not_escaped(self):
+        analyses = [{'chunk_number': 1, 'main_theme': 'Análisis de señales'}]
+        context = PromptContext(content_type=ContentType.EDUCATIONAL, session_metadata={})
+
+        prompt = EducationalPromptEngine().create_overall_summary_prompt(analyses, context)
+
+        assert '"main_theme": "Análisis de señales"' in prompt
+        assert '\\u' not in prompt
@@ -0,0 +1,172 @@
+"""
+Tests for markdown_to_pdf.
+
+Test coverage:
+- Missing libraries reported once and cached
+- One renderer built per thread
+- Shared stylesheet and font configuration passed to every render
+- Unchanged markdown reuses the existing PDF unless forced
+- Markdown extensions enabled only when used; no-op HTML stripped
+"""
+
+import sys
+import threading
+from types import ModuleType, SimpleNamespace
+from typing import ClassVar
+
+import pytest
+from meeting_transcription.pipeline import markdown_to_pdf
+
+
+@pytest.fixture(autouse=True)
+def _reset_renderer(monkeypatch):
+    monkeypatch.setattr(markdown_to_pdf, "_pdf_renderer", threading.local())
+
+
+def _use_renderer(renderer):
+    """Install a fake renderer for the current thread."""
+    markdown_to_pdf._pdf_renderer.value = renderer
+
+
+class _FakeHTML:
+    renders: ClassVar[list] = []
+
+    def __init__(self, string):
+        self.string = string
+
+    def write_pdf(self, target, stylesheets, font_config):
+        self.renders.append((self.string, target, stylesheets, font_config))
+
+
+class TestConvertMarkdownToPdf:
+    """Tests for convert_markdown_to_pdf()."""
+
+    def test_missing_libraries_reported_once(self, tmp_path, monkeypatch, caplog):
+        monkeypatch.setitem(sys.modules, "weasyprint", None)
+        md_file = tmp_path / "guide.md"
+        md_file.write_text("# Title")
+
+        assert markdown_to_pdf.convert_markdown_to_pdf(str(md_file)) is None
+        assert markdown_to_pdf.convert_markdown_to_pdf(str(md_file)) is None
+
+        assert caplog.text.count("Missing required library") == 1
+
+    def test_one_renderer_per_thread(self, monkeypatch):
+        weasyprint = ModuleType("weasyprint")
+        weasyprint.CSS = lambda string, font_config: ("css", font_config)
+        weasyprint.HTML = _FakeHTML
+        fonts = ModuleType("weasyprint.text.fonts")
+        fonts.FontConfiguration = object
+        monkeypatch.setitem(sys.modules, "markdown", ModuleType("markdown"))
+        monkeypatch.setitem(sys.modules, "weasyprint", weasyprint)
+        monkeypatch.setitem(sys.modules, "weasyprint.text", ModuleType("weasyprint.text"))
+        monkeypatch.setitem(sys.modules, "weasyprint.text.fonts", fonts)
+        renderers = []
+
+        def load_twice():
+            renderers.append(markdown_to_pdf._get_pdf_renderer())
+            renderers.append(markdown_to_pdf._get_pdf_renderer())
+
+        load_twice()
+        thread = threading.Thread(target=load_twice)
+        thread.start()
+        thread.join()
+
+        assert renderers[0] is renderers[1]
+        assert renderers[2] is renderers[3]
+        assert renderers[0] is not renderers[2]
+        assert renderers[0][3] is not renderers[2][3]
+
+    def test_reuses_stylesheet_and_fonts(self, tmp_path, monkeypatch):
+        markdown = SimpleNamespace(markdown=lambda text, extensions: f"<p>{text}</p><!-- x -->")
+        stylesheet, font_config = object(), object()
+        _use_renderer((markdown, _FakeHTML, stylesheet, font_config))
+        monkeypatch.setattr(_FakeHTML, "renders", [])
+        md_file = tmp_path / "guide.md"
+        md_file.write_text("Hello")
+
+        for _ in range(2):
+            pdf = markdown_to_pdf.convert_markdown_to_pdf(str(md_file))
+
+        assert pdf == str(tmp_path / "guide.pdf")
+        assert len(_FakeHTML.renders) == 2
+        html, target, stylesheets, fonts = _FakeHTML.renders[0]
+        assert html.startswith("<!DOCTYPE html>")
+        assert "<body>\n<p>Hello</p>\n</body>" in html
+        assert "<style>" not in html
+        assert "<!--" not in html
+        assert target == pdf
+        assert stylesheets == [stylesheet]
+        assert fonts is font_config
+
+    def test_body_placeholder_in_content_kept(self, tmp_path, monkeypatch):
+        markdown = SimpleNamespace(markdown=lambda text, extensions: f"<p>{text}</p>")
+        _use_renderer((markdown, _FakeHTML, object(), object()))
+        monkeypatch.setattr(_FakeHTML, "renders", [])
+        md_file = tmp_path / "guide.md"
+        md_file.write_text("Use {BODY} literally")
+
+        markdown_to_pdf.convert_markdown_to_pdf(str(md_file))
+
+        assert "<p>Use {BODY} literally</p>" in _FakeHTML.renders[0][0]
+
+
+class _WritingHTML(_FakeHTML):
+    def write_pdf(self, target, stylesheets, font_config):
+        super().write_pdf(target, stylesheets, font_config)
+        with open(target, "wb") as f:
+            f.write(b"%PDF")
+
+
+class TestPdfDigestCache:
+    """Tests for skipping renders of unchanged markdown."""
+
+    @pytest.fixture
+    def md_file(self, tmp_path, monkeypatch):
+        markdown = SimpleNamespace(markdown=lambda text, extensions: f"<p>{text}</p>")
+        _use_renderer((markdown, _WritingHTML, object(), object()))
+        monkeypatch.setattr(_FakeHTML, "renders", [])
+        md_file = tmp_path / "guide.md"
+        md_file.write_text("Hello")
+        return md_file
+
+    def test_unchanged_markdown_not_rendered_again(self, md_file):
+        first = markdown_to_pdf.convert_markdown_to_pdf(str(md_file))
+        second = markdown_to_pdf.convert_markdown_to_pdf(str(md_file))
+
+        assert first == second == str(md_file.with_suffix(".pdf"))
+        assert len(_FakeHTML.renders) == 1
+
+    def test_changed_markdown_rendered(self, md_file):
+        markdown_to_pdf.convert_markdown_to_pdf(str(md_file))
+        md_file.write_text("Hello again")
+        markdown_to_pdf.convert_markdown_to_pdf(str(md_file))
+
+        assert len(_FakeHTML.renders) == 2
+
+    def test_missing_pdf_or_force_rendered(self, md_file):
+        markdown_to_pdf.convert_markdown_to_pdf(str(md_file))
+        markdown_to_pdf.convert_markdown_to_pdf(str(md_file), force=True)
+        md_file.with_suffix(".pdf").unlink()
+        markdown_to_pdf.convert_markdown_to_pdf(str(md_file))
+
+        assert len(_FakeHTML.renders) == 3
+
+
+class TestMarkdownExtensions:
+    """Tests for _markdown_extensions()."""
+
+    def test_plain_document(self):
+        assert markdown_to_pdf._markdown_extensions("# Title\n\n- item") == []
+
+    def test_tables_and_code(self):
+        md = "| a | b |\n|---|---|\n\n```\ncode\n```"
+
+        assert markdown_to_pdf._markdown_extensions(md) == ['tables', 'fenced_code']
+
+    def test_same_html_as_all_extensions(self):
+        markdown = pytest.importorskip("markdown")
+        for md in ("# Title\n\nText *em*", "| a |\n|---|\n| 1 |", "```\nx = 1\n```"):
+            assert markdown.markdown(md, extensions=markdown_to_pdf._markdown_extensions(md)) == (
+                markdown.markdown(md, extensions=['tables', 'fenced_code'])
+            )
@@ -5,7 +5,7 @@ Test coverage:
 - VTT format detection and parsing
 - Bracketed timestamp format detection and parsing
 - Edge cases: Empty files, malformed timestamps, missing speakers
-- Format auto-detection
+- Format auto-detection (and reuse of a caller's detection result)
 """
 
 import pytest
@@ -41,6 +41,22 @@ class TestTimestampParsing:
         result = parse_vtt_timestamp("00:05:30.500")
         assert result == 330.5  # 5*60 + 30 + 0.5
 
+    def test_parse_timestamp_fraction_digits(self) -> None:
+        """Fractions keep their place value, like float('0.' + digits)."""
+        assert parse_timestamp("00:00:01.5") == 1.5
+        assert parse_timestamp("01:23:45.123") == 5025.123
+        assert parse_timestamp("[00:00:02.05]") == 2.05
+
+    # =========================================================================
+    # ERROR TESTS
+    # =========================================================================
+
+    @pytest.mark.parametrize("value", ["", "[08]", "1:2:3:4", "00:0a:08", "00:00:05.000 extra"])
+    def test_parse_timestamp_invalid(self, value: str) -> None:
+        """Malformed timestamps raise ValueError."""
+        with pytest.raises(ValueError):
+            parse_timestamp(value)
+
 
 class TestFormatDetection:
     """Tests for format detection."""
@@ -102,6 +118,18 @@ Other Speaker: Goodbye
         assert result['is_transcript'] is True
         assert result['format'] == 'generic_text'
 
+    @pytest.mark.parametrize("header", ["Zoom Meeting Notes", "exported from ZOOM"])
+    def test_detect_zoom_text_format(self, header: str) -> None:
+        """A Zoom mention in any case should mark a bracketed transcript as zoom_text."""
+        text = f"""{header}
+
+[00:00:05]
+Speaker: Hello world
+"""
+        result = detect_text_transcript_format(text)
+
+        assert result['format'] == 'zoom_text'
+
     # =========================================================================
     # NEGATIVE CASES
     # =========================================================================
@@ -151,6 +179,18 @@ John Anderson: Morning Sarah
         assert result[1]['participant']['name'] == 'John Anderson'
         assert result[1]['text'] == 'Morning Sarah'
 
+    def test_parse_vtt_from_file(self, tmp_path) -> None:
+        """A text file object parses the same as its contents."""
+        vtt_text = "WEBVTT\r\n\r\n00:00:05.000 --> 00:00:08.000\r\nSarah Chen: Good morning\r\n"
+        path = tmp_path / "meeting.vtt"
+        path.write_bytes(vtt_text.encode())
+
+        with open(path, newline='') as f:
+            result = parse_vtt_to_combined_format(f)
+
+        assert result == parse_vtt_to_combined_format(vtt_text)
+        assert result[0]['text'] == 'Good morning'
+
     def test_parse_vtt_with_multiline_text(self) -> None:
         """Parse VTT with text spanning multiple lines."""
         vtt_text = """WEBVTT
@@ -205,6 +245,17 @@ and even more
         assert 'continues on the next line' in result[0]['text']
         assert 'even more' in result[0]['text']
 
+    def test_parse_bracketed_long_monologue(self) -> None:
+        """Continuation lines should be joined with single spaces, in order."""
+        body = [f"line {i}" for i in range(1000)]
+        text = "[00:00:05]\nSarah Chen: start\n" + "\n".join(body) + "\n[00:10:00]\nJohn: done\n"
+
+        result = parse_bracketed_to_combined_format(text)
+
+        assert result[0]['text'] == "start " + " ".join(body)
+        assert result[0]['word_count'] == 2001
+        assert result[1]['text'] == 'done'
+
     def test_parse_bracketed_with_mm_ss(self) -> None:
         """Parse bracketed format with MM:SS timestamps (no hours)."""
         text = """[05:30]
@@ -215,6 +266,20 @@ Speaker: At 5 minutes 30 seconds
         assert len(result) == 1
         assert result[0]['start_timestamp']['relative'] == 330.0
 
+    def test_parse_bracketed_shared_and_missing_timestamps(self) -> None:
+        """Speakers after one timestamp share it; untimed leading text starts at 0."""
+        text = """Host: Before any timestamp.
+[00:00:10]
+Alice: Hi.
+Bob: Hello there. How are you.
+[00:00:20]
+Alice: Bye.
+"""
+        result = parse_bracketed_to_combined_format(text)
+
+        times = [(s['start_timestamp']['relative'], s['end_timestamp']['relative']) for s in result]
+        assert times == [(0, 10), (10, 10), (10, 20), (20, 24)]
+
 
 class TestAutoDetectParsing:
     """Tests for auto-detect parsing function."""
@@ -245,6 +310,23 @@ Speaker: Hello
         assert len(result) > 0
         assert result[0]['participant']['name'] == 'Speaker'
 
+    def test_auto_parse_reuses_detection(self, monkeypatch) -> None:
+        """A detection result from the caller should not be recomputed."""
+        from meeting_transcription.pipeline import parse_text_transcript
+
+        text = """[00:00:05]
+Speaker: Hello
+"""
+        detection = detect_text_transcript_format(text)
+
+        def fail(_text):
+            raise AssertionError("format detected twice")
+
+        monkeypatch.setattr(parse_text_transcript, 'detect_text_transcript_format', fail)
+        result = parse_text_to_combined_format(text, detection)
+
+        assert result[0]['text'] == 'Hello'
+
     # =========================================================================
     # NEGATIVE CASES
     # =========================================================================
@@ -291,6 +373,27 @@ Speaker: Test message
         assert 'relative' in segment['start_timestamp']
         assert 'absolute' in segment['start_timestamp']
 
+    def test_participant_shared_per_speaker(self) -> None:
+        """Segments by the same speaker share one participant dict."""
+        text = """WEBVTT
+
+00:00:01.000 --> 00:00:02.000
+Alice: One
+
+00:00:02.000 --> 00:00:03.000
+Bob: Two
+
+00:00:03.000 --> 00:00:04.000
+Alice: Three
+"""
+        result = parse_vtt_to_combined_format(text)
+
+        assert result[0]['participant'] is result[2]['participant']
+        assert result[0]['participant'] == {
+            'id': 100, 'name': 'Alice', 'is_host': None, 'platform': 'zoom', 'email': None, 'extra_data': None
+        }
+        assert result[1]['participant']['id'] == 101
+
     def test_word_count_calculated(self) -> None:
         """Word count should be calculated correctly."""
         text = """[00:00:05]
@@ -300,6 +403,22 @@ Speaker: One two three four five
 
         assert result[0]['word_count'] == 5
 
+    def test_word_count_ignores_repeated_whitespace(self) -> None:
+        """Runs of spaces or tabs inside a line should not count as words."""
+        text = "[00:00:05]\nSpeaker: One  two\tthree\n"
+
+        result = parse_text_to_combined_format(text)
+
+        assert result[0]['word_count'] == 3
+
+    def test_last_segment_duration_estimated_per_sentence(self) -> None:
+        """The last segment should last 2 seconds per period-separated piece."""
+        text = "[00:00:05]\nSpeaker: First. Second. Third\n"
+
+        result = parse_text_to_combined_format(text)
+
+        assert result[0]['end_timestamp']['relative'] == 5.0 + 6
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
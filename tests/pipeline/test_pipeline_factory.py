@@ -0,0 +1,61 @@
+"""
+Tests for PipelineFactory.
+
+Test coverage:
+- Content type detection from hints and metadata
+- Educational config uses the package's own component classes
+- PipelineConfig is immutable and slotted
+- No second copy of the pipeline package imported via sys.path
+"""
+
+import dataclasses
+import sys
+
+import pytest
+from meeting_transcription.pipeline.chunkers import EducationalTimeBasedChunker
+from meeting_transcription.pipeline.core import ContentType, PipelineConfig
+from meeting_transcription.pipeline.factories import PipelineFactory
+
+
+class TestDetectContentType:
+    """Tests for detect_content_type()."""
+
+    def test_hint_wins(self):
+        assert PipelineFactory.detect_content_type({'instructor': 'Ana'}, 'therapy') == ContentType.THERAPY
+
+    def test_metadata_indicators(self):
+        assert PipelineFactory.detect_content_type({'client_id': '1'}) == ContentType.THERAPY
+        assert PipelineFactory.detect_content_type({'course_id': '1'}) == ContentType.EDUCATIONAL
+
+    def test_default(self):
+        assert PipelineFactory.detect_content_type() == ContentType.EDUCATIONAL
+
+
+class TestCreatePipelineConfig:
+    """Tests for create_pipeline_config()."""
+
+    def test_educational_config(self):
+        config = PipelineFactory.create_pipeline_config(chunk_minutes=5)
+
+        # Same classes as the package imports (not a second copy loaded
+        # from a sys.path entry)
+        assert isinstance(config, PipelineConfig)
+        assert config.content_type is ContentType.EDUCATIONAL
+        assert config.chunker_class is EducationalTimeBasedChunker
+        assert config.chunker_params == {'chunk_minutes': 5}
+
+    def test_config_is_frozen_and_slotted(self):
+        config = PipelineFactory.create_pipeline_config()
+
+        assert not hasattr(config, '__dict__')
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            config.generate_pdf = False
+
+    def test_components_imported_within_package(self):
+        config = PipelineFactory.create_pipeline_config()
+
+        assert config.formatter_class.__module__ == 'meeting_transcription.pipeline.formatters.study_guide_formatter'
+        assert config.prompt_engine_class.__module__ == (
+            'meeting_transcription.pipeline.prompts.educational_prompts_engine'
+        )
+        assert 'pipeline' not in sys.modules
@@ -0,0 +1,94 @@
+"""
+Tests for StudyGuideFormatter.
+
+Test coverage:
+- ChunkMetadata flattened into summary.json, written indented
+- Partial metadata (missing attributes, plain dicts) doesn't raise
+- summary.json replaced atomically and only when its content changes
+"""
+
+import json
+from types import SimpleNamespace
+
+from meeting_transcription.pipeline.core import ChunkMetadata, ChunkStrategy, ContentType
+from meeting_transcription.pipeline.formatters import StudyGuideFormatter
+from meeting_transcription.pipeline.formatters.study_guide_formatter import (
+    _metadata_to_dict,
+    _write_if_changed,
+)
+
+
+class TestMetadataToDict:
+    """Tests for _metadata_to_dict()."""
+
+    def test_chunk_metadata(self):
+        metadata = ChunkMetadata(
+            content_type=ContentType.EDUCATIONAL,
+            chunk_strategy=ChunkStrategy.TIME_BASED,
+            total_chunks=3,
+            total_duration_minutes=30,
+            additional_metadata={'instructor': 'Ana'},
+        )
+
+        assert _metadata_to_dict(metadata) == {
+            'content_type': str(ContentType.EDUCATIONAL),
+            'chunk_strategy': str(ChunkStrategy.TIME_BASED),
+            'total_chunks': 3,
+            'meeting_duration_minutes': 30,
+            'instructor': 'Ana',
+        }
+
+    def test_missing_attributes(self):
+        metadata = SimpleNamespace(total_chunks=2)
+
+        assert _metadata_to_dict(metadata) == {
+            'content_type': None,
+            'chunk_strategy': None,
+            'total_chunks': 2,
+            'meeting_duration_minutes': None,
+        }
+
+    def test_dict_metadata(self):
+        metadata = {'content_type': 'educational', 'total_duration_minutes': 12}
+
+        result = _metadata_to_dict(metadata)
+
+        assert result['content_type'] == 'educational'
+        assert result['meeting_duration_minutes'] == 12
+
+
+class TestWriteIfChanged:
+    """Tests for _write_if_changed()."""
+
+    def test_writes_new_and_changed_content(self, tmp_path):
+        path = tmp_path / "summary.json"
+
+        assert _write_if_changed(path, b'{"a":1}') is True
+        assert _write_if_changed(path, b'{"a":2}') is True
+
+        assert path.read_bytes() == b'{"a":2}'
+        assert list(tmp_path.iterdir()) == [path]
+
+    def test_skips_identical_content(self, tmp_path):
+        path = tmp_path / "summary.json"
+        _write_if_changed(path, b'{"a":1}')
+        mtime = path.stat().st_mtime_ns
+
+        assert _write_if_changed(path, b'{"a":1}') is False
+        assert path.stat().st_mtime_ns == mtime
+
+
+class TestFormatOutput:
+    """Tests for format_output()."""
+
+    def test_writes_summary_json_with_flat_metadata(self, tmp_path):
+        summary = {'metadata': SimpleNamespace(total_chunks=1), 'executive_summary': 'Hi'}
+
+        outputs = StudyGuideFormatter(generate_pdf=False).format_output(summary, tmp_path)
+
+        text = (tmp_path / "summary.json").read_text()
+        written = json.loads(text)
+        assert text == json.dumps(written, ensure_ascii=False, indent=2)
+        assert written['metadata']['total_chunks'] == 1
+        assert written['executive_summary'] == 'Hi'
+        assert outputs == {'study_guide_md': str(tmp_path / "study_guide.md")}
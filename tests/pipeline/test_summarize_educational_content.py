@@ -0,0 +1,255 @@
+"""
+Tests for summarize_educational_content.
+
+Test coverage:
+- Chunk analyses run concurrently and are kept in chunk order
+- Action items taken from the overall summary call, with a fallback call
+- Chunks document passed in memory instead of read from disk
+- summary.json written indented
+- Chunk analyses reused from the LLM cache
+- Chunk instructions sent as a shared cacheable prefix
+- Concepts/tools repeated across chunks merged before the summary call
+"""
+
+import json
+import threading
+from types import SimpleNamespace
+from typing import ClassVar
+
+from meeting_transcription.pipeline import summarize_educational_content as sec
+
+
+class _FakeSummarizer:
+    """Stands in for EducationalSummarizer without any LLM."""
+
+    barrier: threading.Barrier | None = None
+
+    def __init__(self, provider=None, model=None):
+        self.model = 'fake-model'
+
+    def analyze_chunk(self, chunk_data, instructor):
+        if self.barrier is not None:
+            # Only passes if the other chunk's analysis is running too
+            self.barrier.wait()
+        return {'chunk_number': chunk_data['chunk_number'], 'instructor': instructor}
+
+    combined_action_items: dict | None = None
+    action_item_calls = 0
+
+    def create_overall_summary(self, chunk_analyses, metadata, include_action_items=False):
+        summary = {'chunks': [a['chunk_number'] for a in chunk_analyses]}
+        if include_action_items and self.combined_action_items is not None:
+            summary['action_items'] = self.combined_action_items
+        return summary
+
+    def extract_action_items(self, overall_summary):
+        type(self).action_item_calls += 1
+        return {'student_assignments': ['separate call']}
+
+
+class TestSummarizeEducationalContent:
+    """Tests for summarize_educational_content()."""
+
+    def _write_chunks(self, tmp_path, count):
+        chunks_file = tmp_path / "chunks.json"
+        chunks_file.write_text(json.dumps({
+            'metadata': {'instructor': 'Ana'},
+            'chunks': [{'chunk_number': i, 'time_range': ''} for i in range(1, count + 1)],
+        }))
+        return str(chunks_file)
+
+    def test_chunks_analyzed_concurrently_in_order(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(sec, 'EducationalSummarizer', _FakeSummarizer)
+        monkeypatch.setattr(_FakeSummarizer, 'barrier', threading.Barrier(2, timeout=5))
+        chunks_file = self._write_chunks(tmp_path, 2)
+
+        result = sec.summarize_educational_content(
+            chunks_file, str(tmp_path / "summary.json"), max_concurrency=2
+        )
+
+        assert [a['chunk_number'] for a in result['chunk_analyses']] == [1, 2]
+        assert result['chunk_analyses'][0]['instructor'] == 'Ana'
+        assert result['overall_summary'] == {'chunks': [1, 2]}
+
+    def test_sequential(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(sec, 'EducationalSummarizer', _FakeSummarizer)
+        chunks_file = self._write_chunks(tmp_path, 3)
+
+        result = sec.summarize_educational_content(
+            chunks_file, str(tmp_path / "summary.json"), max_concurrency=1
+        )
+
+        assert [a['chunk_number'] for a in result['chunk_analyses']] == [1, 2, 3]
+
+    def test_action_items_from_summary_call(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(sec, 'EducationalSummarizer', _FakeSummarizer)
+        monkeypatch.setattr(_FakeSummarizer, 'action_item_calls', 0)
+        action_items = {'student_assignments': [{'assignment': 'Read chapter 2'}]}
+        monkeypatch.setattr(_FakeSummarizer, 'combined_action_items', action_items)
+
+        result = sec.summarize_educational_content(
+            self._write_chunks(tmp_path, 1), str(tmp_path / "summary.json")
+        )
+
+        assert result['action_items'] == action_items
+        assert 'action_items' not in result['overall_summary']
+        assert _FakeSummarizer.action_item_calls == 0
+
+    def test_action_items_fallback_call(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(sec, 'EducationalSummarizer', _FakeSummarizer)
+        monkeypatch.setattr(_FakeSummarizer, 'action_item_calls', 0)
+
+        result = sec.summarize_educational_content(
+            self._write_chunks(tmp_path, 1), str(tmp_path / "summary.json")
+        )
+
+        assert result['action_items'] == {'student_assignments': ['separate call']}
+        assert _FakeSummarizer.action_item_calls == 1
+
+    def test_chunks_data_used_instead_of_file(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(sec, 'EducationalSummarizer', _FakeSummarizer)
+        data = {'metadata': {'instructor': 'Ana'}, 'chunks': [{'chunk_number': 1}]}
+
+        result = sec.summarize_educational_content(
+            str(tmp_path / "missing.json"), str(tmp_path / "summary.json"), chunks_data=data
+        )
+
+        assert result['overall_summary'] == {'chunks': [1]}
+        # summary.json is user-facing, so it is written indented
+        assert (tmp_path / "summary.json").read_text() == json.dumps(
+            result, ensure_ascii=False, indent=2
+        )
+
+    def test_combined_prompt_asks_for_action_items(self):
+        prompt = sec.prompts.create_overall_summary_prompt(['{}'], {}, include_action_items=True)
+
+        assert prompt.startswith(sec.prompts.create_overall_summary_prompt(['{}'], {}))
+        assert 'top-level\n"action_items" key' in prompt
+        assert '"student_assignments": [' in prompt
+
+
+class TestAnalyzeChunkCache:
+    """Tests for EducationalSummarizer.analyze_chunk() with LLM_CACHE_DIR set."""
+
+    def test_second_run_uses_cache(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("LLM_CACHE_DIR", str(tmp_path / "cache"))
+        calls = []
+
+        def call(prompt, max_tokens, temperature, cache_prefix=""):
+            calls.append(cache_prefix + prompt)
+            return '{"main_theme": "RAG"}'
+
+        summarizer = sec.EducationalSummarizer.__new__(sec.EducationalSummarizer)
+        summarizer.client = SimpleNamespace(model='fake:model', call=call)
+        chunk = {
+            'chunk_number': 1, 'time_range': '00:00 - 10:00', 'duration_minutes': 10.0,
+            'speakers': ['Ana'], 'has_student_interaction': False,
+            'segments': [{'timestamp': '00:00', 'is_instructor': True, 'speaker': 'Ana', 'text': 'Hi'}],
+        }
+
+        first = summarizer.analyze_chunk(chunk, 'Ana')
+        second = summarizer.analyze_chunk(dict(chunk, chunk_number=7), 'Ana')
+
+        assert len(calls) == 1
+        assert first['main_theme'] == second['main_theme'] == 'RAG'
+        assert second['chunk_number'] == 7
+
+    def test_instructions_sent_as_prefix(self, tmp_path, monkeypatch):
+        monkeypatch.delenv("LLM_CACHE_DIR", raising=False)
+        calls = []
+
+        def call(prompt, max_tokens, temperature, cache_prefix=""):
+            calls.append((cache_prefix, prompt))
+            return '{}'
+
+        summarizer = sec.EducationalSummarizer.__new__(sec.EducationalSummarizer)
+        summarizer.client = SimpleNamespace(model='fake:model', call=call)
+        chunk = {
+            'chunk_number': 1, 'time_range': '00:00 - 10:00', 'duration_minutes': 10.0,
+            'speakers': ['Ana'], 'has_student_interaction': False,
+            'segments': [{'timestamp': '00:00', 'is_instructor': True, 'speaker': 'Ana', 'text': 'Hi'}],
+        }
+
+        summarizer.analyze_chunk(chunk, 'Ana')
+        summarizer.analyze_chunk(dict(chunk, segments=[]), 'Ana')
+
+        (prefix1, prompt1), (prefix2, prompt2) = calls
+        assert prefix1 == prefix2 == sec.prompts.chunk_analysis_instructions('Ana')
+        assert prefix1 + prompt1 == sec.prompts.format_chunk_for_llm_analysis(chunk, 'Ana')
+        assert 'INSTRUCTOR (Ana): Hi' in prompt1
+        assert prompt1 != prompt2
+
+
+class TestMergeRepeatedEntries:
+    """Tests for merge_repeated_entries()."""
+
+    ANALYSES: ClassVar[list[dict]] = [
+        {
+            'chunk_number': 1,
+            'key_concepts': [{'name': 'RAG', 'definition': 'Retrieval', 'examples_mentioned': ['Chatbot']}],
+            'tools_frameworks': [{'name': 'LangChain'}],
+        },
+        {
+            'chunk_number': 2,
+            'key_concepts': [
+                {'name': ' rag ', 'definition': 'Again', 'examples_mentioned': ['Chatbot', 'Docs Q&A']},
+                {'name': 'Embeddings'},
+            ],
+            'tools_frameworks': [{'name': 'Langchain'}, 'Pinecone'],
+        },
+        {'chunk_number': 3, 'main_theme': 'Error parsing response'},
+    ]
+
+    def test_repeats_folded_into_first_mention(self):
+        merged = sec.merge_repeated_entries(self.ANALYSES)
+
+        assert merged[0]['key_concepts'] == [{
+            'name': 'RAG', 'definition': 'Retrieval',
+            'examples_mentioned': ['Chatbot', 'Docs Q&A'], 'also_in_chunks': [2],
+        }]
+        assert merged[0]['tools_frameworks'] == [{'name': 'LangChain', 'also_in_chunks': [2]}]
+        assert merged[1]['key_concepts'] == [{'name': 'Embeddings'}]
+        assert merged[1]['tools_frameworks'] == ['Pinecone']
+        assert merged[2] == self.ANALYSES[2]
+
+    def test_punctuation_distinguishes_tools(self):
+        analyses = [
+            {'chunk_number': 1, 'tools_frameworks': [{'name': 'C++', 'use_case': 'Systems'}]},
+            {'chunk_number': 2, 'tools_frameworks': [
+                {'name': 'C#', 'use_case': '.NET apps'}, {'name': 'C'}, {'name': 'c++'},
+            ]},
+        ]
+
+        merged = sec.merge_repeated_entries(analyses)
+
+        assert merged[0]['tools_frameworks'] == [{'name': 'C++', 'use_case': 'Systems', 'also_in_chunks': [2]}]
+        assert merged[1]['tools_frameworks'] == [{'name': 'C#', 'use_case': '.NET apps'}, {'name': 'C'}]
+
+    def test_input_unchanged(self):
+        before = json.dumps(self.ANALYSES)
+
+        sec.merge_repeated_entries(self.ANALYSES)
+
+        assert json.dumps(self.ANALYSES) == before
+
+    def test_summary_call_gets_merged_analyses(self, tmp_path, monkeypatch):
+        seen = []
+
+        class Summarizer(_FakeSummarizer):
+            def analyze_chunk(self, chunk_data, instructor):
+                return {'chunk_number': chunk_data['chunk_number'], 'tools_frameworks': [{'name': 'Git'}]}
+
+            def create_overall_summary(self, chunk_analyses, metadata, include_action_items=False):
+                seen.extend(chunk_analyses)
+                return {}
+
+        monkeypatch.setattr(sec, 'EducationalSummarizer', Summarizer)
+        chunks_file = tmp_path / "chunks.json"
+        chunks_file.write_text(json.dumps({
+            'metadata': {}, 'chunks': [{'chunk_number': 1}, {'chunk_number': 2}],
+        }))
+
+        result = sec.summarize_educational_content(str(chunks_file), str(tmp_path / "summary.json"))
+
+        assert [a['tools_frameworks'] for a in seen] == [[{'name': 'Git', 'also_in_chunks': [2]}], []]
+        assert result['chunk_analyses'][1]['tools_frameworks'] == [{'name': 'Git'}]
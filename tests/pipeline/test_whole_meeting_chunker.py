@@ -0,0 +1,81 @@
+"""
+Tests for WholeMeetingChunker.
+
+Test coverage:
+- Single chunk covering the full meeting
+- Per-participant word and turn statistics
+- Empty transcripts
+- Chunk metadata
+"""
+
+from meeting_transcription.pipeline.chunkers.whole_meeting_chunker import WholeMeetingChunker
+from meeting_transcription.pipeline.core.types import ChunkStrategy, ContentType
+
+
+def _segment(name, start, end, words, is_host=False):
+    return {
+        'participant': {'name': name, 'is_host': is_host},
+        'start_timestamp': {'relative': start},
+        'end_timestamp': {'relative': end},
+        'word_count': words,
+    }
+
+
+class TestWholeMeetingChunker:
+    """Tests for WholeMeetingChunker.chunk_transcript()."""
+
+    def test_single_chunk_with_participant_stats(self):
+        transcript = [
+            _segment('Therapist', 0, 30, 40, is_host=True),
+            _segment('Client', 30, 90, 100),
+            _segment('Therapist', 90, 150, 25, is_host=True),
+        ]
+
+        result = WholeMeetingChunker().chunk_transcript(transcript)
+
+        assert len(result['chunks']) == 1
+        chunk = result['chunks'][0]
+        assert chunk['total_words'] == 165
+        assert chunk['duration_minutes'] == 2
+        assert chunk['participants'] == [
+            {'name': 'Therapist', 'is_host': True, 'word_count': 65, 'turn_count': 2},
+            {'name': 'Client', 'is_host': False, 'word_count': 100, 'turn_count': 1},
+        ]
+
+    def test_missing_word_count_counts_as_zero(self):
+        segment = _segment('Client', 0, 10, 0)
+        del segment['word_count']
+
+        chunk = WholeMeetingChunker().chunk_transcript([segment])['chunks'][0]
+
+        assert chunk['total_words'] == 0
+        assert chunk['participants'][0]['turn_count'] == 1
+
+    def test_empty_transcript(self):
+        result = WholeMeetingChunker().chunk_transcript([])
+
+        assert result['chunks'] == []
+        assert result['metadata'].total_chunks == 1
+
+    def test_metadata_defaults_to_therapy(self):
+        metadata = WholeMeetingChunker().chunk_transcript([_segment('Client', 0, 600, 10)])['metadata']
+
+        assert metadata.content_type == ContentType.THERAPY
+        assert metadata.chunk_strategy == ChunkStrategy.WHOLE_SESSION
+        assert metadata.total_duration_minutes == 10
+
+    def test_metadata_does_not_alias_caller_options(self):
+        options = {'content_type': ContentType.EDUCATIONAL, 'session_id': 's-1'}
+
+        metadata = WholeMeetingChunker().chunk_transcript([], **options)['metadata']
+        metadata.additional_metadata['session_id'] = 'changed'
+
+        assert metadata.content_type == ContentType.EDUCATIONAL
+        assert options['session_id'] == 's-1'
+
+    def test_metadata_to_dict_matches_asdict(self):
+        from dataclasses import asdict
+
+        metadata = WholeMeetingChunker().chunk_transcript([], session_id='s-1')['metadata']
+
+        assert metadata.to_dict() == asdict(metadata)
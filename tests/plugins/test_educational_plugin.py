@@ -7,6 +7,7 @@ import os
 import tempfile
 from unittest.mock import patch
 
+import pytest
 from meeting_transcription.plugins.educational_plugin import EducationalPlugin
 
 
@@ -50,6 +51,43 @@ class TestEducationalPlugin:
         assert "generate_pdf" in schema
         assert schema["generate_pdf"]["type"] == "boolean"
 
+    def test_schemas_not_shared_with_callers(self):
+        """Changing a returned schema doesn't change it for other instances."""
+        first, second = EducationalPlugin(), EducationalPlugin()
+
+        first.settings_schema["chunk_duration_minutes"]["default"] = 99
+        schema = first.metadata_schema
+        schema["instructor_name"]["default"] = "Changed"
+        schema.pop("course_name")
+
+        assert second.settings_schema["chunk_duration_minutes"]["default"] == 10
+        assert second.metadata_schema == first.metadata_schema != schema
+        assert json.loads(json.dumps(first.settings_schema)) == first.settings_schema
+
+    def test_default_settings_match_schema(self):
+        """Instance defaults agree with the settings schema."""
+        plugin = EducationalPlugin()
+
+        for key, field in plugin.settings_schema.items():
+            assert getattr(plugin, key) == field["default"]
+
+    def test_configure_ignores_unknown_settings(self):
+        """Keys outside the settings schema are not copied onto the plugin."""
+        plugin = EducationalPlugin()
+
+        plugin.configure({"max_concurrent_chunks": 2, "unknown": 1})
+
+        assert plugin.max_concurrent_chunks == 2
+        assert not hasattr(plugin, "unknown")
+
+    def test_slots(self):
+        """Instances carry only the settings; unknown attributes are rejected."""
+        plugin = EducationalPlugin()
+
+        assert not hasattr(plugin, "__dict__")
+        with pytest.raises(AttributeError):
+            plugin.generate_pfd = False
+
     def test_default_settings(self):
         """Test plugin initializes with default settings."""
         plugin = EducationalPlugin()
@@ -58,6 +96,7 @@ class TestEducationalPlugin:
         assert plugin.include_code_examples is True
         assert plugin.summarization_depth == "detailed"
         assert plugin.generate_pdf is True
+        assert plugin.max_concurrent_chunks == 4
 
     def test_configure_settings(self):
         """Test configure method applies settings."""
@@ -85,6 +124,38 @@ class TestEducationalPlugin:
         assert plugin.include_code_examples is True  # Default
         assert plugin.summarization_depth == "detailed"  # Default
 
+    @patch('meeting_transcription.plugins.educational_plugin.create_educational_chunks')
+    @patch('meeting_transcription.plugins.educational_plugin.summarize_educational_content')
+    @patch('meeting_transcription.plugins.educational_plugin.create_study_guide')
+    @patch('meeting_transcription.plugins.educational_plugin.markdown_to_pdf')
+    def test_stage_results_passed_in_memory(
+        self,
+        mock_pdf,
+        mock_study_guide,
+        mock_summarize,
+        mock_chunks
+    ):
+        """Each stage gets the previous stage's result instead of re-reading its file."""
+        plugin = EducationalPlugin()
+        plugin.configure({"generate_pdf": False})
+        chunks_data = {"metadata": {}, "chunks": []}
+        summary_data = {"overall_summary": {}}
+        mock_chunks.create_educational_content_chunks.return_value = chunks_data
+        mock_summarize.summarize_educational_content.return_value = summary_data
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            plugin.process_transcript(
+                combined_transcript_path=os.path.join(temp_dir, "combined.json"),
+                output_dir=temp_dir,
+                llm_provider="vertex_ai",
+                metadata={}
+            )
+
+        summarize_kwargs = mock_summarize.summarize_educational_content.call_args.kwargs
+        assert summarize_kwargs["chunks_data"] is chunks_data
+        guide_kwargs = mock_study_guide.create_markdown_study_guide.call_args.kwargs
+        assert guide_kwargs["summary_data"] is summary_data
+
     @patch('meeting_transcription.plugins.educational_plugin.create_educational_chunks')
     @patch('meeting_transcription.plugins.educational_plugin.summarize_educational_content')
     @patch('meeting_transcription.plugins.educational_plugin.create_study_guide')
@@ -116,7 +187,7 @@ class TestEducationalPlugin:
                 with open(output_path, 'w') as f:
                     json.dump({"summary": "test"}, f)
 
-            def mock_create_guide(input_path, output_path):
+            def mock_create_guide(input_path, output_path, **kwargs):
                 with open(output_path, 'w') as f:
                     f.write("# Study Guide")
 
@@ -179,7 +250,7 @@ class TestEducationalPlugin:
                 with open(output_path, 'w') as f:
                     json.dump({"summary": "test"}, f)
 
-            def mock_create_guide(input_path, output_path):
+            def mock_create_guide(input_path, output_path, **kwargs):
                 with open(output_path, 'w') as f:
                     f.write("# Study Guide")
 
@@ -229,7 +300,7 @@ class TestEducationalPlugin:
                 with open(output_path, 'w') as f:
                     json.dump({"summary": "test"}, f)
 
-            def mock_create_guide(input_path, output_path):
+            def mock_create_guide(input_path, output_path, **kwargs):
                 with open(output_path, 'w') as f:
                     f.write("# Study Guide")
 
@@ -248,3 +319,7 @@ class TestEducationalPlugin:
             mock_chunks.create_educational_content_chunks.assert_called_once()
             call_kwargs = mock_chunks.create_educational_content_chunks.call_args[1]
             assert call_kwargs["chunk_minutes"] == 20
+
+            # Chunk analyses use the default concurrency limit
+            summarize_kwargs = mock_summarize.summarize_educational_content.call_args[1]
+            assert summarize_kwargs["max_concurrency"] == 4
@@ -0,0 +1,171 @@
+"""
+Tests for plugin discovery.
+
+Test coverage:
+- Plugins provided through the meeting_transcription.plugins entry point group
+- DISABLED_PLUGINS and broken entry points skipped
+- Plugin directories imported and registered in directory order
+- A plugin that fails to register (duplicate name) doesn't abort discovery
+- DISABLED_PLUGINS parsing (case, whitespace, changes between calls)
+"""
+
+import importlib.metadata
+import sys
+
+import pytest
+from meeting_transcription.plugins import plugin_loader
+from meeting_transcription.plugins.plugin_registry import PluginRegistry
+
+
+class EntryPointPlugin:
+    """Minimal plugin advertised through an entry point."""
+
+    name = "from_entry_point"
+    display_name = "Entry Point Plugin"
+    description = "Provided by an installed package"
+
+
+def _broken_factory():
+    raise RuntimeError("boom")
+
+
+@pytest.fixture
+def registry(monkeypatch):
+    registry = PluginRegistry()
+    monkeypatch.setattr(plugin_loader, "register_plugin", registry.register)
+    return registry
+
+
+@pytest.fixture
+def entry_points(monkeypatch):
+    def set_entry_points(*values):
+        eps = [
+            importlib.metadata.EntryPoint(name=f"ep{i}", value=value, group=plugin_loader.ENTRY_POINT_GROUP)
+            for i, value in enumerate(values)
+        ]
+        monkeypatch.setattr(
+            plugin_loader.importlib.metadata,
+            "entry_points",
+            lambda group: eps if group == plugin_loader.ENTRY_POINT_GROUP else [],
+        )
+    return set_entry_points
+
+
+class TestEntryPointDiscovery:
+    """Tests for discover_and_register_plugins() with entry points."""
+
+    def test_registers_entry_point_plugins(self, registry, entry_points, tmp_path, monkeypatch):
+        monkeypatch.delenv("DISABLED_PLUGINS", raising=False)
+        entry_points(f"{__name__}:EntryPointPlugin")
+
+        names = plugin_loader.discover_and_register_plugins(str(tmp_path / "missing"))
+
+        assert names == ["from_entry_point"]
+        assert isinstance(registry.get("from_entry_point"), EntryPointPlugin)
+
+    def test_disabled_and_broken_entry_points_skipped(self, registry, entry_points, tmp_path, monkeypatch):
+        monkeypatch.setenv("DISABLED_PLUGINS", "from_entry_point")
+        entry_points(f"{__name__}:EntryPointPlugin", f"{__name__}:_broken_factory")
+
+        names = plugin_loader.discover_and_register_plugins(str(tmp_path))
+
+        assert names == []
+        assert not registry.has("from_entry_point")
+
+    def test_discovery_disabled(self, registry, entry_points, monkeypatch):
+        monkeypatch.setenv("ENABLE_PLUGIN_DISCOVERY", "false")
+        entry_points(f"{__name__}:EntryPointPlugin")
+
+        assert plugin_loader.discover_and_register_plugins() == []
+        assert not registry.has("from_entry_point")
+
+
+PLUGIN_PY = """
+class Plugin:
+    name = {name!r}
+    display_name = "Directory Plugin"
+
+def get_plugin():
+    return Plugin()
+"""
+
+
+class TestDirectoryDiscovery:
+    """Tests for discover_and_register_plugins() with a plugins directory."""
+
+    def test_loads_plugin_dirs(self, registry, entry_points, tmp_path, monkeypatch, capsys):
+        monkeypatch.setenv("DISABLED_PLUGINS", "dirtest_off")
+        monkeypatch.setattr(sys, "path", list(sys.path))
+        entry_points()
+        plugins = {
+            "dirtest_alpha": PLUGIN_PY.format(name="dirtest_alpha"),
+            "dirtest_beta": PLUGIN_PY.format(name="dirtest_beta"),
+            "dirtest_off": PLUGIN_PY.format(name="dirtest_off"),
+            "dirtest_broken": "raise ImportError('missing dependency')\n",
+            "dirtest_no_factory": "x = 1\n",
+        }
+        for dir_name, source in plugins.items():
+            (tmp_path / dir_name).mkdir()
+            (tmp_path / dir_name / "plugin.py").write_text(source)
+        (tmp_path / "dirtest_empty").mkdir()
+        (tmp_path / ".hidden").mkdir()
+
+        try:
+            names = plugin_loader.discover_and_register_plugins(str(tmp_path))
+        finally:
+            for dir_name in plugins:
+                sys.modules.pop(f"{dir_name}.plugin", None)
+
+        assert sorted(names) == ["dirtest_alpha", "dirtest_beta"]
+        assert registry.get("dirtest_alpha").name == "dirtest_alpha"
+        assert not registry.has("dirtest_off")
+        assert str(tmp_path) in sys.path
+        out = capsys.readouterr().out
+        assert "Error loading plugin from dirtest_broken: missing dependency" in out
+        assert "dirtest_no_factory/plugin.py must define a get_plugin() function" in out
+        assert "Skipping dirtest_empty - no plugin.py found" in out
+
+    def test_duplicate_name_does_not_abort_discovery(self, registry, entry_points, tmp_path, monkeypatch, capsys):
+        monkeypatch.delenv("DISABLED_PLUGINS", raising=False)
+        monkeypatch.setattr(sys, "path", list(sys.path))
+        entry_points()
+        dir_names = ["dirtest_dup_a", "dirtest_dup_b", "dirtest_other"]
+        for dir_name in dir_names:
+            name = "dirtest_other" if dir_name == "dirtest_other" else "dirtest_dup"
+            (tmp_path / dir_name).mkdir()
+            (tmp_path / dir_name / "plugin.py").write_text(PLUGIN_PY.format(name=name))
+
+        try:
+            names = plugin_loader.discover_and_register_plugins(str(tmp_path))
+        finally:
+            for dir_name in dir_names:
+                sys.modules.pop(f"{dir_name}.plugin", None)
+
+        assert sorted(names) == ["dirtest_dup", "dirtest_other"]
+        assert registry.has("dirtest_dup")
+        assert "is already registered" in capsys.readouterr().out
+
+
+class TestIsPluginDisabled:
+    """Tests for _is_plugin_disabled()."""
+
+    def test_unset(self, monkeypatch):
+        monkeypatch.delenv("DISABLED_PLUGINS", raising=False)
+
+        assert plugin_loader._is_plugin_disabled("educational") is False
+
+    def test_case_and_whitespace(self, monkeypatch):
+        monkeypatch.setenv("DISABLED_PLUGINS", " Educational , therapy,,")
+
+        assert plugin_loader._is_plugin_disabled("educational") is True
+        assert plugin_loader._is_plugin_disabled("THERAPY") is True
+        assert plugin_loader._is_plugin_disabled("") is False
+        assert plugin_loader._is_plugin_disabled("sales") is False
+
+    def test_env_change_takes_effect(self, monkeypatch):
+        monkeypatch.setenv("DISABLED_PLUGINS", "educational")
+        assert plugin_loader._is_plugin_disabled("educational") is True
+
+        monkeypatch.setenv("DISABLED_PLUGINS", "therapy")
+
+        assert plugin_loader._is_plugin_disabled("educational") is False
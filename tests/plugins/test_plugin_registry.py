@@ -2,6 +2,9 @@
 Tests for plugin registry.
 """
 
+import time
+from concurrent.futures import ThreadPoolExecutor
+
 import pytest
 from meeting_transcription.plugins import (
     PluginRegistry,
@@ -119,6 +122,76 @@ class TestPluginRegistry:
             registry.unregister("nonexistent")
 
 
+class TestLazyRegistration:
+    """Tests for PluginRegistry.register_lazy()."""
+
+    def test_factory_called_on_first_get_only(self):
+        """The plugin should be created on first use and then reused."""
+        registry = PluginRegistry()
+        created = []
+
+        def factory():
+            created.append(MockPlugin())
+            return created[-1]
+
+        registry.register_lazy("mock", factory)
+
+        assert registry.has("mock")
+        assert created == []
+        assert registry.get("mock") is registry.get("mock") is created[0]
+        assert len(created) == 1
+
+    def test_concurrent_first_get(self):
+        """Threads racing on the first get() should share one instance."""
+        registry = PluginRegistry()
+        created = []
+
+        def factory():
+            time.sleep(0.05)
+            created.append(MockPlugin())
+            return created[-1]
+
+        registry.register_lazy("mock", factory)
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            plugins = list(executor.map(lambda _: registry.get("mock"), range(4)))
+
+        assert len(created) == 1
+        assert all(p is created[0] for p in plugins)
+
+    def test_list_creates_lazy_plugins(self):
+        """Listing should include lazily registered plugins."""
+        registry = PluginRegistry()
+        registry.register_lazy("mock", MockPlugin)
+
+        assert [p["display_name"] for p in registry.list()] == ["Mock Plugin"]
+
+    def test_duplicate_name_raises_error(self):
+        """A lazy registration should conflict with an existing plugin name."""
+        registry = PluginRegistry()
+        registry.register(MockPlugin())
+
+        with pytest.raises(ValueError, match="already registered"):
+            registry.register_lazy("mock", MockPlugin)
+
+    def test_name_mismatch_raises_error(self):
+        """The created plugin must have the name it was registered under."""
+        registry = PluginRegistry()
+        registry.register_lazy("other", MockPlugin)
+
+        with pytest.raises(ValueError, match="is named 'mock'"):
+            registry.get("other")
+
+    def test_unregister_before_load(self):
+        """A lazy plugin can be unregistered without being created."""
+        registry = PluginRegistry()
+        registry.register_lazy("mock", lambda: pytest.fail("factory called"))
+
+        registry.unregister("mock")
+
+        assert not registry.has("mock")
+
+
 class TestGlobalRegistryFunctions:
     """Tests for global registry convenience functions."""
 
@@ -126,7 +199,7 @@ class TestGlobalRegistryFunctions:
         """Clear global registry before each test."""
         # Clear the global registry
         registry = get_registry()
-        for plugin_name in list(registry._plugins.keys()):
+        for plugin_name in [*registry._plugins, *registry._factories]:
             registry.unregister(plugin_name)
 
     def test_register_and_get_plugin(self):
@@ -0,0 +1,104 @@
+"""
+Tests for the transcript provider registry.
+
+Test coverage:
+- Built-in providers registered without importing their modules
+- Lazy providers imported and instantiated on first get(), once under concurrent calls
+- list() falls back to the class name for providers that can't be loaded
+- Duplicate and unknown provider types rejected
+"""
+
+import importlib
+import os
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from meeting_transcription.providers import ProviderType
+from meeting_transcription.providers import registry as registry_module
+from meeting_transcription.providers.registry import ProviderRegistry
+
+MANUAL_PATH = "meeting_transcription.providers.manual_provider:ManualUploadProvider"
+
+
+class TestLazyRegistration:
+    """Tests for ProviderRegistry.register_lazy()."""
+
+    def test_get_imports_and_caches_instance(self):
+        registry = ProviderRegistry()
+        registry.register_lazy(ProviderType.MANUAL, MANUAL_PATH)
+
+        assert registry.has("manual")
+        provider = registry.get("manual")
+
+        assert type(provider).__name__ == "ManualUploadProvider"
+        assert registry.get(ProviderType.MANUAL) is provider
+
+    def test_list_includes_lazy_providers(self):
+        registry = ProviderRegistry()
+        registry.register_lazy(ProviderType.MANUAL, MANUAL_PATH)
+
+        assert [p["class"] for p in registry.list()] == ["ManualUploadProvider"]
+
+    def test_list_reports_unloadable_lazy_provider(self):
+        registry = ProviderRegistry()
+        registry.register_lazy(ProviderType.ZOOM, "meeting_transcription.providers.missing:ZoomProvider")
+
+        assert registry.list() == [{"type": "zoom", "name": "ZoomProvider", "class": "ZoomProvider"}]
+
+    def test_duplicate_type_raises_error(self):
+        registry = ProviderRegistry()
+        registry.register_lazy(ProviderType.MANUAL, MANUAL_PATH)
+
+        with pytest.raises(ValueError, match="already registered"):
+            registry.register_lazy(ProviderType.MANUAL, MANUAL_PATH)
+
+    def test_unregistered_type_raises_error(self):
+        registry = ProviderRegistry()
+        registry.register_lazy(ProviderType.MANUAL, MANUAL_PATH)
+
+        with pytest.raises(ValueError, match="Available: manual"):
+            registry.get(ProviderType.ZOOM)
+
+    def test_concurrent_first_get(self, monkeypatch):
+        registry = ProviderRegistry()
+        registry.register_lazy(ProviderType.MANUAL, MANUAL_PATH)
+        import_module = importlib.import_module
+
+        def slow_import(name):
+            time.sleep(0.05)
+            return import_module(name)
+
+        monkeypatch.setattr(registry_module.importlib, "import_module", slow_import)
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            providers = list(executor.map(lambda _: registry.get("manual"), range(4)))
+
+        assert all(p is providers[0] for p in providers)
+
+    def test_unregister_before_import(self):
+        registry = ProviderRegistry()
+        registry.register_lazy(ProviderType.ZOOM, "no.such.module:Provider")
+
+        registry.unregister(ProviderType.ZOOM)
+
+        assert not registry.has(ProviderType.ZOOM)
+
+
+class TestBuiltinProviders:
+    """Tests for the import-time registration of built-in providers."""
+
+    def test_provider_modules_not_imported(self):
+        """Importing the package should register providers without loading them."""
+        code = (
+            "import sys\n"
+            "from meeting_transcription.providers import has_provider\n"
+            "assert all(has_provider(t) for t in ('recall', 'google_meet', 'zoom', 'manual'))\n"
+            "loaded = [m for m in sys.modules if m.endswith('_provider')]\n"
+            "assert loaded == [], loaded\n"
+        )
+
+        env = {**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)}
+        subprocess.run([sys.executable, "-c", code], check=True, env=env)
@@ -0,0 +1,31 @@
+"""
+Tests for the Zoom provider stub.
+
+Test coverage:
+- Every operation raises NotImplementedError until the integration lands
+"""
+
+import asyncio
+
+import pytest
+from meeting_transcription.providers import ProviderType
+from meeting_transcription.providers.zoom_provider import ZoomProvider
+
+
+class TestZoomProvider:
+    """Tests for ZoomProvider."""
+
+    def test_identity(self):
+        provider = ZoomProvider()
+
+        assert provider.name == "Zoom"
+        assert provider.provider_type is ProviderType.ZOOM
+
+    @pytest.mark.parametrize("call", [
+        lambda p: p.create_meeting("https://zoom.us/j/123"),
+        lambda p: p.get_transcript("zoom-1"),
+        lambda p: p.get_status("zoom-1"),
+    ])
+    def test_operations_not_implemented(self, call):
+        with pytest.raises(NotImplementedError, match="Epic 2"):
+            asyncio.run(call(ZoomProvider()))
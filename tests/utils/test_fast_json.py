@@ -0,0 +1,57 @@
+"""
+Tests for the fast_json helpers.
+
+Test coverage:
+- Round trips through both the orjson and stdlib code paths
+- Invalid input raises json.JSONDecodeError on both paths
+"""
+
+import json
+
+import pytest
+from meeting_transcription.utils import fast_json
+
+
+@pytest.fixture(params=["orjson", "stdlib"])
+def backend(request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch) -> str:
+    """Run each test against both implementations."""
+    if request.param == "orjson":
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr(fast_json, "HAS_ORJSON", False)
+    return request.param
+
+
+class TestFastJson:
+    """Tests for loads/dumps."""
+
+    def test_round_trip(self, backend: str) -> None:
+        """dumps output should load back to the same object."""
+        obj = {"text": "héllo", "n": 3, "items": [1.5, None, True]}
+
+        data = fast_json.dumps(obj)
+
+        assert isinstance(data, bytes)
+        assert fast_json.loads(data) == obj
+        assert json.loads(data) == obj
+
+    def test_loads_accepts_str_and_memoryview(self, backend: str) -> None:
+        """loads should accept str and buffer inputs."""
+        assert fast_json.loads('{"a": 1}') == {"a": 1}
+        assert fast_json.loads(memoryview(b'{"a": 1}')) == {"a": 1}
+
+    def test_invalid_input_raises(self, backend: str) -> None:
+        """Invalid JSON should raise json.JSONDecodeError."""
+        with pytest.raises(json.JSONDecodeError):
+            fast_json.loads(b"{not json")
+
+        with pytest.raises(fast_json.JSONDecodeError):
+            fast_json.loads(b"")
+
+    def test_indent(self, backend: str) -> None:
+        """indent=True should pretty print with two spaces."""
+        obj = {"a": [1, {"b": "ü"}]}
+
+        data = fast_json.dumps(obj, indent=True)
+
+        assert data.decode() == json.dumps(obj, ensure_ascii=False, indent=2)
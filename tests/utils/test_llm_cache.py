@@ -0,0 +1,52 @@
+"""
+Tests for the on-disk LLM result cache.
+
+Test coverage:
+- Disabled without LLM_CACHE_DIR
+- Round trip, and keys that differ by model or prompt
+- Corrupt entries treated as misses
+"""
+
+import pytest
+from meeting_transcription.utils import llm_cache
+
+
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setenv("LLM_CACHE_DIR", str(tmp_path))
+    return tmp_path
+
+
+class TestLLMCache:
+    """Tests for cache_key/get/put."""
+
+    def test_disabled_without_env(self, monkeypatch):
+        monkeypatch.delenv("LLM_CACHE_DIR", raising=False)
+        key = llm_cache.cache_key("m", "p")
+
+        llm_cache.put(key, {"a": 1})
+
+        assert llm_cache.get(key) is None
+
+    def test_round_trip(self, cache_dir):
+        key = llm_cache.cache_key("google:gemini", "Analyze this")
+
+        assert llm_cache.get(key) is None
+        llm_cache.put(key, {"main_theme": "RAG", "concepts": ["é"]})
+
+        assert llm_cache.get(key) == {"main_theme": "RAG", "concepts": ["é"]}
+        assert [p.name for p in cache_dir.rglob("*.tmp")] == []
+
+    def test_key_covers_model_and_prompt(self):
+        key = llm_cache.cache_key("a", "prompt")
+
+        assert key != llm_cache.cache_key("b", "prompt")
+        assert key != llm_cache.cache_key("a", "prompt ")
+        assert key == llm_cache.cache_key("a", "prompt")
+
+    def test_corrupt_entry_is_miss(self, cache_dir):
+        key = llm_cache.cache_key("m", "p")
+        llm_cache.put(key, {"a": 1})
+        next(cache_dir.rglob("*.json")).write_text("{trunc")
+
+        assert llm_cache.get(key) is None
@@ -0,0 +1,153 @@
+"""
+Tests for LLM client helpers.
+
+Test coverage:
+- Prompt cache breakpoint on the user message (whole prompt or shared prefix)
+- Token usage extraction from provider responses
+- Shared per-model clients with per-thread usage, rebuilt when their env changes
+- JSON extraction from fenced responses
+"""
+
+import json
+import threading
+from types import SimpleNamespace
+
+import pytest
+from meeting_transcription.utils import llm_client
+from meeting_transcription.utils.llm_client import _usage_counts, _user_message
+
+
+class TestUserMessage:
+    """Tests for _user_message()."""
+
+    def test_plain(self):
+        assert _user_message("hi") == {"role": "user", "content": "hi"}
+
+    def test_cached(self):
+        message = _user_message("hi", cache=True)
+
+        assert message["content"] == [
+            {"type": "text", "text": "hi", "cache_control": {"type": "ephemeral"}}
+        ]
+
+    def test_prefix_uncached(self):
+        assert _user_message("chunk", prefix="rules ") == {"role": "user", "content": "rules chunk"}
+
+    def test_prefix_cached(self):
+        message = _user_message("chunk", cache=True, prefix="rules ")
+
+        assert message["content"] == [
+            {"type": "text", "text": "rules ", "cache_control": {"type": "ephemeral"}},
+            {"type": "text", "text": "chunk"},
+        ]
+
+
+class TestUsageCounts:
+    """Tests for _usage_counts()."""
+
+    def test_anthropic_cache_fields(self):
+        usage = SimpleNamespace(
+            input_tokens=12, output_tokens=5, cache_read_input_tokens=4000, cache_creation_input_tokens=0
+        )
+
+        assert _usage_counts(usage) == {
+            "input_tokens": 12,
+            "output_tokens": 5,
+            "cache_read_input_tokens": 4000,
+            "cache_creation_input_tokens": 0,
+        }
+
+    def test_openai_cached_tokens(self):
+        usage = {"prompt_tokens": 5000, "completion_tokens": 50, "prompt_tokens_details": {"cached_tokens": 4864}}
+
+        assert _usage_counts(usage) == {"prompt_tokens": 5000, "completion_tokens": 50, "cached_tokens": 4864}
+
+    def test_missing_usage(self):
+        assert _usage_counts(None) == {}
+
+
+class _FakeCompletions:
+    def create(self, model, messages, max_tokens, temperature):
+        prompt = messages[0]["content"]
+        return SimpleNamespace(
+            choices=[SimpleNamespace(message=SimpleNamespace(content=prompt))],
+            usage={"prompt_tokens": len(prompt), "completion_tokens": 1},
+        )
+
+
+@pytest.fixture
+def fake_aisuite(monkeypatch):
+    """Back LLMClient with a fake aisuite client that echoes the prompt."""
+    fake = SimpleNamespace(Client=lambda configs: SimpleNamespace(chat=SimpleNamespace(completions=_FakeCompletions())))
+    monkeypatch.setattr(llm_client, "HAS_AISUITE", True)
+    monkeypatch.setattr(llm_client, "ai", fake, raising=False)
+    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+    llm_client._get_cached_llm_client.cache_clear()
+    yield
+    llm_client._get_cached_llm_client.cache_clear()
+
+
+class TestGetLLMClient:
+    """Tests for get_llm_client()."""
+
+    def test_shared_per_model(self, fake_aisuite):
+        client = llm_client.get_llm_client("openai:gpt-4o")
+
+        assert llm_client.get_llm_client("openai:gpt-4o") is client
+        assert llm_client.get_llm_client("anthropic:claude") is not client
+
+    def test_new_client_when_env_changes(self, fake_aisuite, monkeypatch):
+        monkeypatch.setenv("AI_MODEL", "openai:gpt-4o")
+        client = llm_client.get_llm_client()
+
+        monkeypatch.setenv("AI_MODEL", "anthropic:claude")
+        switched = llm_client.get_llm_client()
+        monkeypatch.setenv("LLM_PROMPT_CACHING", "false")
+        uncached = llm_client.get_llm_client()
+        monkeypatch.setenv("OPENAI_API_KEY", "rotated-key")
+        rotated = llm_client.get_llm_client()
+
+        assert client.model == "openai:gpt-4o"
+        assert switched.model == "anthropic:claude"
+        assert client.prompt_caching and not uncached.prompt_caching
+        assert len({id(client), id(switched), id(uncached), id(rotated)}) == 4
+        assert llm_client.get_llm_client() is rotated
+
+    def test_last_usage_is_per_thread(self, fake_aisuite):
+        client = llm_client.get_llm_client("openai:gpt-4o")
+        client.call("main thread")
+        seen = {}
+
+        def worker():
+            seen["before"] = client.last_usage
+            client.call("worker")
+            seen["after"] = client.last_usage
+
+        thread = threading.Thread(target=worker)
+        thread.start()
+        thread.join()
+
+        assert seen == {"before": {}, "after": {"prompt_tokens": 6, "completion_tokens": 1}}
+        assert client.last_usage == {"prompt_tokens": 11, "completion_tokens": 1}
+
+
+class TestParseJsonResponse:
+    """Tests for parse_json_response()."""
+
+    def test_json_fence(self):
+        response = 'Here you go:\n```json\n{"a": [1, 2]}\n```\nThanks ```other```'
+
+        assert llm_client.parse_json_response(response) == {"a": [1, 2]}
+
+    def test_plain_fence(self):
+        assert llm_client.parse_json_response('```\n{"a": 1}\n```') == {"a": 1}
+
+    def test_unfenced(self):
+        assert llm_client.parse_json_response('  {"a": 1}\n') == {"a": 1}
+
+    def test_unterminated_fence(self):
+        assert llm_client.parse_json_response('```json\n{"a": 1}') == {"a": 1}
+
+    def test_invalid(self):
+        with pytest.raises(json.JSONDecodeError):
+            llm_client.parse_json_response("```json\nnot json\n```")